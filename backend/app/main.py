@@ -1,22 +1,130 @@
 """Main FastAPI application module."""
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+import asyncio
+import os
+import platform
+import sys
+from contextlib import asynccontextmanager
 
+import anyio.to_thread
+import orjson
+import uvicorn
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
+
+from backend.app.middleware import (
+    PathPrefixCORSMiddleware,
+    UploadExtensionMiddleware,
+)
+from backend.app.routes import ALLOWED_EXTENSIONS, UNSUPPORTED_TYPE_DETAIL
 from backend.app.routes import router as api_router
+from backend.core.utils import (
+    close_async_redis_pools,
+    close_redis_pools,
+    get_redis_connection,
+)
+
+# Oldest Linux kernel providing the io_uring features used by uringcore
+URING_MIN_KERNEL = (5, 11)
+
+
+def _kernel_version() -> tuple:
+    """Get the running kernel version as a tuple of integers.
+
+    Returns:
+        tuple: Major and minor version, e.g. (5, 15).
+    """
+    parts = platform.release().split("-")[0].split(".")
+    try:
+        return tuple(int(part) for part in parts[:2])
+    except ValueError:
+        return (0, 0)
+
+
+def install_uring_loop_policy() -> bool:
+    """Install the io_uring event loop policy if the platform supports it.
+
+    The policy comes from the optional ``uringcore`` package and requires
+    Linux 5.11 or newer.
+
+    Returns:
+        bool: True if the policy was installed, False otherwise.
+    """
+    if sys.platform != "linux" or _kernel_version() < URING_MIN_KERNEL:
+        return False
+
+    try:
+        import uringcore
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uringcore.EventLoopPolicy())
+    return True
+
+
+# Installed at import time so uvicorn reload/worker subprocesses use it too.
+# uvicorn must then keep the current policy instead of installing its own loop.
+if install_uring_loop_policy():
+    API_LOOP = "none"
+elif sys.platform == "win32":
+    # uvloop is not available on Windows
+    API_LOOP = "asyncio"
+else:
+    API_LOOP = "uvloop"
+API_HTTP = "httptools"
+
+# Static response bodies, encoded once instead of on every probe
+ROOT_RESPONSE = {
+    "message": "Welcome to the Smart Assistant API",
+    "status": "operational",
+    "version": "0.1.0",
+}
+HEALTH_RESPONSE = {"status": "ok"}
+ROOT_BODY = orjson.dumps(ROOT_RESPONSE)
+HEALTH_BODY = orjson.dumps(HEALTH_RESPONSE)
+
+# Worker threads available for blocking work such as saving uploads (anyio
+# default: 40)
+THREADPOOL_SIZE = int(os.environ.get("API_THREADPOOL_SIZE", 100))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Set up shared resources on startup and release them on shutdown."""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = (
+        THREADPOOL_SIZE
+    )
+    get_redis_connection()
+    yield
+    await close_async_redis_pools()
+    close_redis_pools()
+
 
 app = FastAPI(
     title="Smart Assistant for Video/Audio Content",
     description="A service that helps users extract insights from video and audio content",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+# Reject unsupported uploads from their part headers, before the body is
+# spooled.
+# Added before CORS so rejections still carry CORS headers.
+app.add_middleware(
+    UploadExtensionMiddleware,
+    path=f"{api_router.prefix}/transcribe",
+    allowed_extensions=ALLOWED_EXTENSIONS,
+    detail=UNSUPPORTED_TYPE_DETAIL,
 )
 
-# Configure CORS
+# Configure CORS for the public API only, internal probes skip it
 app.add_middleware(
-    CORSMiddleware,
+    PathPrefixCORSMiddleware,
+    path_prefix=api_router.prefix,
     allow_origins=["*"],  # In production, replace with specific origins
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type"],
 )
 
 # Include API routes
@@ -26,33 +134,45 @@ app.include_router(api_router)
 @app.get("/")
 async def root():
     """Root endpoint that returns a welcome message."""
-    return {
-        "message": "Welcome to the Smart Assistant API",
-        "status": "operational",
-        "version": "0.1.0",
-    }
+    return Response(ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
 async def health():
     """Health check endpoint."""
-    return {"status": "ok"}
+    return Response(HEALTH_BODY, media_type="application/json")
 
 
 def run_api(host="0.0.0.0", port=8000):
-    """Run FastAPI server using uvicorn.
+    """Run FastAPI server using uvicorn with the uvloop/httptools stack.
     
+    With ENV=dev a single auto-reloading process is started. Otherwise the
+    server runs API_WORKERS processes (default: one per CPU core), each with
+    its own lazily created Redis pools.
+
     Args:
         host: Host to bind the server to.
         port: Port to bind the server to.
     """
-    import uvicorn
-    import os
-    
-    # Allow port override via environment variable
+    # Allow port and worker count override via environment variables
     port = int(os.environ.get("API_PORT", port))
+    dev = os.environ.get("ENV") == "dev"
+
+    # Auto-reload runs a single process, so it is only used in development
+    if dev:
+        workers = 1
+    else:
+        workers = int(os.environ.get("API_WORKERS", os.cpu_count() or 1))
     
-    uvicorn.run("backend.app.main:app", host=host, port=port, reload=True)
+    uvicorn.run(
+        "backend.app.main:app",
+        host=host,
+        port=port,
+        reload=dev,
+        workers=workers,
+        loop=API_LOOP,
+        http=API_HTTP,
+    )
 
 
 if __name__ == "__main__":
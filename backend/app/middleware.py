@@ -0,0 +1,155 @@
+"""ASGI middleware for the FastAPI application."""
+import os
+from typing import AbstractSet, Iterator, List, Optional
+
+from multipart.multipart import parse_options_header
+from starlette.datastructures import Headers
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Bytes of a request body read to find the headers of its multipart parts
+UPLOAD_PEEK_SIZE = 64 * 1024
+
+
+class PathPrefixCORSMiddleware:
+    """CORS middleware applied only to requests under a path prefix.
+
+    Other requests, such as health checks and load balancer probes, go
+    straight to the application without the CORS header processing.
+    """
+
+    def __init__(self, app: ASGIApp, path_prefix: str, **cors_options) -> None:
+        """Initialize middleware.
+
+        Args:
+            app: ASGI application to wrap.
+            path_prefix: Only paths starting with this prefix get CORS
+                handling.
+            **cors_options: Options passed to ``CORSMiddleware``.
+        """
+        self.app = app
+        self.path_prefix = path_prefix
+        self.cors = CORSMiddleware(app, **cors_options)
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(
+            self.path_prefix
+        ):
+            await self.cors(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+
+def _upload_filenames(body: bytes, boundary: bytes) -> Iterator[str]:
+    """Get the filenames of the multipart parts whose headers are in ``body``.
+
+    Args:
+        body: Start of a multipart/form-data body.
+        boundary: Multipart boundary from the request content type.
+
+    Yields:
+        str: Filename of each file part.
+    """
+    for part in body.split(b"--" + boundary)[1:]:
+        headers_end = part.find(b"\r\n\r\n")
+        if headers_end == -1:
+            return  # Part headers cut off at the end of the peeked bytes
+
+        for line in part[:headers_end].split(b"\r\n"):
+            name, _, value = line.partition(b":")
+            if name.strip().lower() == b"content-disposition":
+                _, options = parse_options_header(value.strip())
+                if b"filename" in options:
+                    yield options[b"filename"].decode("latin-1")
+
+
+class UploadExtensionMiddleware:
+    """Reject uploads with an unsupported extension before reading their body.
+
+    Only the first ``peek_size`` bytes of a multipart request are read to
+    find the filenames of its parts. Accepted requests get those bytes
+    replayed unchanged, so the application parses them as usual. Requests
+    whose part headers are not within the peeked bytes are passed through
+    for the route to validate.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        path: str,
+        allowed_extensions: AbstractSet[str],
+        detail: str,
+        peek_size: int = UPLOAD_PEEK_SIZE,
+    ) -> None:
+        """Initialize middleware.
+
+        Args:
+            app: ASGI application to wrap.
+            path: Path of the upload endpoint.
+            allowed_extensions: Lowercase extensions accepted, including the
+                dot.
+            detail: Error detail returned for rejected uploads.
+            peek_size: Maximum number of body bytes read before deciding.
+        """
+        self.app = app
+        self.path = path
+        self.allowed_extensions = allowed_extensions
+        self.detail = detail
+        self.peek_size = peek_size
+
+    def _boundary(self, scope: Scope) -> Optional[bytes]:
+        """Get the multipart boundary of an upload request, if it is one."""
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or scope["path"] != self.path
+        ):
+            return None
+
+        content_type, options = parse_options_header(
+            Headers(scope=scope).get("content-type", "")
+        )
+        if content_type != b"multipart/form-data":
+            return None
+        return options.get(b"boundary")
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        boundary = self._boundary(scope)
+        if not boundary:
+            await self.app(scope, receive, send)
+            return
+
+        # Read just enough of the body to see the part headers
+        messages: List[Message] = []
+        peeked = bytearray()
+        more_body = True
+        while more_body and len(peeked) < self.peek_size:
+            message = await receive()
+            messages.append(message)
+            if message["type"] != "http.request":
+                break  # Client disconnected, the application will see it
+            peeked += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        for filename in _upload_filenames(bytes(peeked), boundary):
+            if (
+                os.path.splitext(filename)[1].lower()
+                not in self.allowed_extensions
+            ):
+                response = JSONResponse(
+                    {"detail": self.detail}, status_code=400
+                )
+                await response(scope, receive, send)
+                return
+
+        async def replay_receive() -> Message:
+            if messages:
+                return messages.pop(0)
+            return await receive()
+
+        await self.app(scope, replay_receive, send)
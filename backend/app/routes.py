@@ -1,48 +1,87 @@
 """API routes for file upload and transcription."""
-from fastapi import APIRouter, File, UploadFile, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
+import os
 
-from backend.core.worker import enqueue_file
+from fastapi import (
+    APIRouter,
+    File,
+    UploadFile,
+    HTTPException,
+    BackgroundTasks,
+    Response,
+)
+
+from backend.app.schemas import TranscribeResponse
+from backend.core.worker import (
+    enqueue_saved_file_background,
+    file_job_id,
+    get_cached_job_info_async,
+    save_uploaded_file_async,
+)
 
 router = APIRouter(prefix="/api/v1")
 
+# Supported upload extensions
+ALLOWED_EXTENSIONS = frozenset(
+    {".mp3", ".wav", ".mp4", ".m4a", ".aac", ".flac"}
+)
+UNSUPPORTED_TYPE_DETAIL = (
+    "Unsupported file type. Allowed types: "
+    f"{', '.join(sorted(ALLOWED_EXTENSIONS))}"
+)
+
 
-@router.post("/transcribe")
-async def upload_file(file: UploadFile = File(...)):
+@router.post("/transcribe", status_code=202, response_model_exclude_none=True)
+async def upload_file(
+    background_tasks: BackgroundTasks,
+    response: Response,
+    file: UploadFile = File(...),
+) -> TranscribeResponse:
     """Upload a file for transcription.
-    
+
+    The response is sent as soon as the file is on disk, the job is pushed
+    to Redis afterwards in a background task.
+
     Args:
+        background_tasks: Tasks run after the response is sent.
+        response: Response used to set the status code of cached results.
         file: The file to upload.
-        
+
     Returns:
-        JSONResponse: Job information.
+        TranscribeResponse: Job information.
     """
     # Check file type
-    allowed_extensions = [".mp3", ".wav", ".mp4", ".m4a", ".aac", ".flac"]
-    file_extension = "." + file.filename.split(".")[-1].lower()
+    file_extension = os.path.splitext(file.filename or "")[1].lower()
     
-    if file_extension not in allowed_extensions:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Unsupported file type. Allowed types: {', '.join(allowed_extensions)}"
-        )
+    if file_extension not in ALLOWED_EXTENSIONS:
+        raise HTTPException(status_code=400, detail=UNSUPPORTED_TYPE_DETAIL)
     
     try:
-        # Read file content
-        file_content = await file.read()
+        # Stream the spooled upload to disk
+        file_info = await save_uploaded_file_async(file.file, file.filename)
         
-        # Enqueue file for processing
-        job_info = enqueue_file(file_content, file.filename)
-        
-        return JSONResponse(
-            status_code=202,
-            content={
-                "message": "File uploaded and queued for transcription",
-                "job_id": job_info["job_id"],
-                "file_id": job_info["file_id"],
-                "filename": job_info["original_filename"],
-                "status": "queued"
-            }
+        # Same content was already transcribed, no job is needed
+        job_info = await get_cached_job_info_async(file_info)
+        if job_info is not None:
+            response.status_code = 200
+            return TranscribeResponse(
+                message="File already transcribed",
+                job_id=job_info["job_id"],
+                file_id=job_info["file_id"],
+                filename=job_info["original_filename"],
+                status="transcribed",
+                transcription=job_info["transcription"]
+            )
+
+        # The job ID is derived from the file ID, so it is known before
+        # enqueueing. An enqueue failure is recorded under that job ID.
+        background_tasks.add_task(enqueue_saved_file_background, file_info)
+
+        return TranscribeResponse(
+            message="File uploaded and queued for transcription",
+            job_id=file_job_id(file_info["file_id"]),
+            file_id=file_info["file_id"],
+            filename=file_info["original_filename"],
+            status="queued"
         )
     except Exception as e:
         raise HTTPException(
@@ -0,0 +1,27 @@
+"""Request and response models for the API."""
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class TranscriptionResult(BaseModel):
+    """Output files and text of a finished transcription."""
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    json_path: str
+    vtt_path: str
+    transcript: str
+
+
+class TranscribeResponse(BaseModel):
+    """Response to a file upload."""
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    message: str
+    job_id: Optional[str]
+    file_id: str
+    filename: str
+    status: str
+    transcription: Optional[TranscriptionResult] = None
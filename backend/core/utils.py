@@ -1,13 +1,97 @@
 """Shared utilities for the application."""
+import functools
 import os
-from typing import Optional
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
 
 import redis
+import redis.asyncio
+
+# Maximum number of connections kept by each Redis connection pool
+REDIS_MAX_CONNECTIONS = int(os.environ.get("REDIS_POOL_SIZE", 32))
+
+# Seconds a client waits for a free connection once the pool is exhausted,
+# instead of failing straight away
+REDIS_POOL_TIMEOUT = 5
+
+# Directories remembered as created by ensure_dir
+CREATED_DIRS_CACHE_SIZE = 32
+
+# Connection pools shared by all clients of the process, keyed by (host, port)
+_redis_pools: Dict[Tuple[str, int], redis.BlockingConnectionPool] = {}
+_redis_pools_lock = threading.Lock()
+
+# asyncio connection pools, keyed by (host, port). They are bound to the event
+# loop that first uses them, so they are only shared inside the API process.
+_async_redis_pools: Dict[
+    Tuple[str, int], redis.asyncio.BlockingConnectionPool
+] = {}
+
+
+@functools.lru_cache(maxsize=CREATED_DIRS_CACHE_SIZE)
+def ensure_dir(directory: str) -> Path:
+    """Ensure a directory exists, creating it only once per process.
+
+    Every job saves or writes into the same few directories, the result is
+    cached so the mkdir syscall is not repeated for each of them.
+
+    Args:
+        directory: Directory to create.
+
+    Returns:
+        Path: Path to the directory.
+    """
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+@functools.lru_cache(maxsize=1)
+def _redis_env_address() -> Tuple[str, int]:
+    """Get the Redis address configured in the environment, read once.
+
+    Returns:
+        Tuple[str, int]: REDIS_HOST and REDIS_PORT, or 'localhost' and 6379.
+    """
+    return os.environ.get("REDIS_HOST", "localhost"), int(
+        os.environ.get("REDIS_PORT", 6379)
+    )
+
+
+def get_redis_pool(host: str, port: int) -> redis.BlockingConnectionPool:
+    """Get the shared Redis connection pool for a server, creating it once.
+
+    Args:
+        host: Redis host.
+        port: Redis port.
+
+    Returns:
+        redis.BlockingConnectionPool: Connection pool for the server.
+    """
+    key = (host, port)
+    pool = _redis_pools.get(key)
+    if pool is None:
+        with _redis_pools_lock:
+            pool = _redis_pools.get(key)
+            if pool is None:
+                pool = redis.BlockingConnectionPool(
+                    host=host,
+                    port=port,
+                    max_connections=REDIS_MAX_CONNECTIONS,
+                    timeout=REDIS_POOL_TIMEOUT,
+                    decode_responses=False,
+                )
+                _redis_pools[key] = pool
+    return pool
 
 
 def get_redis_connection(host: Optional[str] = None, port: Optional[int] = None) -> redis.Redis:
     """Get Redis connection with parameters from environment or defaults.
     
+    Connections are taken from a process-wide pool, so repeated calls do not
+    open a new TCP connection each time.
+
     Args:
         host: Redis host. If None, will use REDIS_HOST environment variable or default to 'localhost'.
         port: Redis port. If None, will use REDIS_PORT environment variable or default to 6379.
@@ -16,7 +100,60 @@ def get_redis_connection(host: Optional[str] = None, port: Optional[int] = None)
         redis.Redis: Redis connection.
     """
     # Get Redis connection params from environment or use defaults/provided values
-    redis_host = host or os.environ.get("REDIS_HOST", "localhost")
-    redis_port = port or int(os.environ.get("REDIS_PORT", 6379))
+    env_host, env_port = _redis_env_address()
+    redis_host = host or env_host
+    redis_port = port or env_port
     
-    return redis.Redis(host=redis_host, port=redis_port)
+    return redis.Redis(connection_pool=get_redis_pool(redis_host, redis_port))
+
+
+def get_async_redis_connection(
+    host: Optional[str] = None, port: Optional[int] = None
+) -> redis.asyncio.Redis:
+    """Get asyncio Redis connection configured from environment or defaults.
+
+    Meant for use inside async endpoints, where a blocking Redis call would
+    stall the event loop.
+
+    Args:
+        host: Redis host. If None, will use REDIS_HOST environment variable or
+            default to 'localhost'.
+        port: Redis port. If None, will use REDIS_PORT environment variable or
+            default to 6379.
+
+    Returns:
+        redis.asyncio.Redis: asyncio Redis connection.
+    """
+    env_host, env_port = _redis_env_address()
+    redis_host = host or env_host
+    redis_port = port or env_port
+
+    key = (redis_host, redis_port)
+    pool = _async_redis_pools.get(key)
+    if pool is None:
+        pool = redis.asyncio.BlockingConnectionPool(
+            host=redis_host,
+            port=redis_port,
+            max_connections=REDIS_MAX_CONNECTIONS,
+            timeout=REDIS_POOL_TIMEOUT,
+            decode_responses=False,
+        )
+        _async_redis_pools[key] = pool
+
+    return redis.asyncio.Redis(connection_pool=pool)
+
+
+async def close_async_redis_pools() -> None:
+    """Disconnect and forget all asyncio Redis connection pools."""
+    pools = list(_async_redis_pools.values())
+    _async_redis_pools.clear()
+    for pool in pools:
+        await pool.disconnect()
+
+
+def close_redis_pools() -> None:
+    """Disconnect and forget all shared Redis connection pools."""
+    with _redis_pools_lock:
+        for pool in _redis_pools.values():
+            pool.disconnect()
+        _redis_pools.clear()
@@ -1,6 +1,35 @@
 """Worker module for handling file processing and Redis RQ queue."""
 
-from backend.core.worker.queue import Queue, get_queue
-from backend.core.worker.tasks import process_file, enqueue_file
+from backend.core.worker.queue import (
+    AsyncQueue,
+    Queue,
+    get_async_queue,
+    get_queue,
+)
+from backend.core.worker.tasks import (
+    process_file,
+    enqueue_file,
+    enqueue_files,
+    enqueue_file_async,
+    enqueue_saved_file_async,
+    enqueue_saved_file_background,
+    file_job_id,
+    get_cached_job_info_async,
+    save_uploaded_file_async,
+)
 
-__all__ = ["Queue", "get_queue", "process_file", "enqueue_file"]
+__all__ = [
+    "AsyncQueue",
+    "Queue",
+    "get_async_queue",
+    "get_queue",
+    "process_file",
+    "enqueue_file",
+    "enqueue_files",
+    "enqueue_file_async",
+    "enqueue_saved_file_async",
+    "enqueue_saved_file_background",
+    "file_job_id",
+    "get_cached_job_info_async",
+    "save_uploaded_file_async",
+]
@@ -1,10 +1,13 @@
 """Queue management for Redis RQ."""
-from typing import Optional
+from typing import Callable, Optional, Sequence, Tuple
 
 import redis
+import redis.asyncio
 from rq import Queue as RQQueue
+from rq.job import Job, JobStatus
+from rq.utils import utcnow
 
-from backend.core.utils import get_redis_connection
+from backend.core.utils import get_async_redis_connection, get_redis_connection
 
 
 class Queue:
@@ -38,6 +41,37 @@ class Queue:
         job = self._queue.enqueue(func, *args, **kwargs)
         return job
 
+    def enqueue_many(
+        self,
+        jobs: Sequence[Tuple[Callable, tuple, dict]],
+        job_ids: Optional[Sequence[str]] = None,
+    ):
+        """Enqueue several jobs in a single Redis round-trip.
+
+        All job hashes and queue pushes are sent through one non-transactional
+        pipeline instead of one set of commands per job.
+
+        Args:
+            jobs: Sequence of (func, args, kwargs) tuples.
+            job_ids: IDs of the jobs, in the same order as ``jobs``. If None,
+                random IDs are generated.
+
+        Returns:
+            List[rq.Job]: Job objects, in the same order as ``jobs``.
+        """
+        if job_ids is None:
+            job_ids = [None] * len(jobs)
+
+        job_datas = [
+            RQQueue.prepare_data(func, args=args, kwargs=kwargs, job_id=job_id)
+            for (func, args, kwargs), job_id in zip(jobs, job_ids)
+        ]
+
+        pipe = self.connection.pipeline(transaction=False)
+        enqueued = self._queue.enqueue_many(job_datas, pipeline=pipe)
+        pipe.execute()
+        return enqueued
+
     def get_job_ids(self):
         """Get all job IDs in the queue.
 
@@ -55,7 +89,71 @@ class Queue:
         return len(self._queue)
 
 
+class AsyncQueue:
+    """RQ-compatible queue that submits jobs through asyncio Redis.
+
+    Jobs are stored in the same format as ``rq.Queue.enqueue`` uses, so they
+    are picked up by regular RQ workers.
+    """
+
+    def __init__(
+        self,
+        name: str = "transcription",
+        connection: Optional[redis.asyncio.Redis] = None,
+    ):
+        """Initialize queue with asyncio Redis connection.
+
+        Args:
+            name: Name of the queue.
+            connection: asyncio Redis connection. If None, a new connection
+                will be created.
+        """
+        if connection is None:
+            connection = get_async_redis_connection()
+
+        # Only used to build job payloads, it never sends commands to Redis
+        self._queue = RQQueue(name=name, connection=get_redis_connection())
+        self.name = name
+        self.connection = connection
+
+    async def enqueue(
+        self, func, *args, job_id: Optional[str] = None, **kwargs
+    ) -> Job:
+        """Enqueue a job to the queue.
+
+        Args:
+            func: Function to execute.
+            *args: Arguments to pass to the function.
+            job_id: ID of the job. If None, a random ID is generated.
+            **kwargs: Keyword arguments to pass to the function.
+
+        Returns:
+            rq.Job: Job object.
+        """
+        job = self._queue.create_job(
+            func,
+            args=args,
+            kwargs=kwargs,
+            job_id=job_id,
+            status=JobStatus.QUEUED,
+        )
+        job.origin = self.name
+        job.enqueued_at = utcnow()
+        if job.timeout is None:
+            job.timeout = RQQueue.DEFAULT_TIMEOUT
+
+        # Same commands rq.Queue issues for a job without dependencies
+        async with self.connection.pipeline(transaction=True) as pipe:
+            pipe.sadd(RQQueue.redis_queues_keys, self._queue.key)
+            pipe.hset(job.key, mapping=job.to_dict())
+            pipe.rpush(self._queue.key, job.id)
+            await pipe.execute()
+
+        return job
+
+
 _default_queue = None
+_default_async_queue = None
 
 
 def get_queue(name: str = "transcription") -> Queue:
@@ -71,3 +169,18 @@ def get_queue(name: str = "transcription") -> Queue:
     if _default_queue is None:
         _default_queue = Queue(name=name)
     return _default_queue
+
+
+def get_async_queue(name: str = "transcription") -> AsyncQueue:
+    """Get default asyncio queue instance.
+
+    Args:
+        name: Name of the queue.
+
+    Returns:
+        AsyncQueue: Queue instance.
+    """
+    global _default_async_queue
+    if _default_async_queue is None:
+        _default_async_queue = AsyncQueue(name=name)
+    return _default_async_queue
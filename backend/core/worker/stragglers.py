@@ -0,0 +1,267 @@
+"""Straggler mitigation for transcription jobs.
+
+Jobs that run much longer than usual are duplicated on a backup queue. Both
+copies transcribe into a private staging directory and only publish their
+outputs if the other copy has not published first, so whichever copy
+finishes first wins and the other result is discarded.
+"""
+import argparse
+import logging
+import os
+import shutil
+import statistics
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import redis
+from rq import Queue as RQQueue
+from rq.command import send_stop_job_command
+from rq.exceptions import InvalidJobOperation, NoSuchJobError
+from rq.job import Job
+from rq.registry import StartedJobRegistry
+from rq.utils import utcnow
+
+from backend.core.utils import get_redis_connection
+
+logger = logging.getLogger(__name__)
+
+# Queue served by spare workers that run duplicates of straggling jobs
+BACKUP_QUEUE_NAME = "transcription-backup"
+
+# Redis list with the most recent job runtimes, in seconds
+RUNTIME_HISTORY_KEY = "transcription:runtimes"
+RUNTIME_HISTORY_SIZE = 1000
+
+# Minimum history needed before any job is considered a straggler
+MIN_RUNTIME_SAMPLES = 20
+
+# A job is a straggler once it runs longer than p95 runtime times this factor
+STRAGGLER_FACTOR = 1.5
+
+# Idempotency key set when a backup is enqueued for a file
+BACKUP_KEY_PREFIX = "transcription:backup:"
+BACKUP_KEY_TTL = 24 * 60 * 60
+
+# Seconds between two scans of the started job registry
+DEFAULT_SCAN_INTERVAL = 30
+
+
+def record_runtime(
+    seconds: float, connection: Optional[redis.Redis] = None
+) -> None:
+    """Add a job runtime to the history used to detect stragglers.
+
+    Failures are logged and ignored, the history is best effort.
+
+    Args:
+        seconds: Job runtime in seconds.
+        connection: Redis connection. If None, a new connection will be
+            created.
+    """
+    try:
+        connection = connection or get_redis_connection()
+        pipe = connection.pipeline(transaction=False)
+        pipe.lpush(RUNTIME_HISTORY_KEY, seconds)
+        pipe.ltrim(RUNTIME_HISTORY_KEY, 0, RUNTIME_HISTORY_SIZE - 1)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Could not record job runtime: {str(e)}")
+
+
+def get_runtime_threshold(
+    connection: Optional[redis.Redis] = None,
+) -> Optional[float]:
+    """Get the runtime above which a job is considered a straggler.
+
+    Args:
+        connection: Redis connection. If None, a new connection will be
+            created.
+
+    Returns:
+        Optional[float]: Threshold in seconds, or None if the history is too
+        short.
+    """
+    connection = connection or get_redis_connection()
+    samples = [
+        float(value) for value in connection.lrange(RUNTIME_HISTORY_KEY, 0, -1)
+    ]
+    if len(samples) < MIN_RUNTIME_SAMPLES:
+        return None
+
+    p95 = statistics.quantiles(samples, n=20)[-1]
+    return p95 * STRAGGLER_FACTOR
+
+
+def find_stragglers(
+    queue_name: str = "transcription", connection: Optional[redis.Redis] = None
+) -> List[Job]:
+    """Find started jobs that have been running longer than the threshold.
+
+    Args:
+        queue_name: Name of the queue to scan.
+        connection: Redis connection. If None, a new connection will be
+            created.
+
+    Returns:
+        List[Job]: Straggling jobs.
+    """
+    connection = connection or get_redis_connection()
+    threshold = get_runtime_threshold(connection)
+    if threshold is None:
+        return []
+
+    registry = StartedJobRegistry(queue_name, connection=connection)
+    jobs = Job.fetch_many(registry.get_job_ids(), connection=connection)
+
+    now = utcnow()
+    return [
+        job for job in jobs
+        if job is not None
+        and job.started_at is not None
+        and (now - job.started_at).total_seconds() > threshold
+    ]
+
+
+def watch_stragglers(
+    queue_name: str = "transcription", connection: Optional[redis.Redis] = None
+) -> List[str]:
+    """Enqueue a backup copy of every straggling job, at most once per file.
+
+    Args:
+        queue_name: Name of the queue to scan.
+        connection: Redis connection. If None, a new connection will be
+            created.
+
+    Returns:
+        List[str]: IDs of the enqueued backup jobs.
+    """
+    connection = connection or get_redis_connection()
+    backup_queue = RQQueue(name=BACKUP_QUEUE_NAME, connection=connection)
+
+    backup_ids = []
+    for job in find_stragglers(queue_name, connection):
+        file_info = job.args[0]
+        key = f"{BACKUP_KEY_PREFIX}{file_info['file_id']}"
+        if not connection.set(key, job.id, nx=True, ex=BACKUP_KEY_TTL):
+            continue  # A backup already exists for this file
+
+        backup = backup_queue.enqueue(
+            "backend.core.worker.tasks.process_file",
+            file_info,
+            backup_of=job.id,
+        )
+        logger.info(f"Job {job.id} is straggling, enqueued backup {backup.id}")
+        backup_ids.append(backup.id)
+
+    return backup_ids
+
+
+def publish_outputs(
+    outputs: Dict[str, str], output_dir: str
+) -> Optional[Dict[str, str]]:
+    """Move a job's outputs from its staging directory into place.
+
+    The JSON output is published with ``os.link``, which fails atomically if
+    the file already exists, and acts as the claim for the whole result, so
+    outputs already published by another copy of the job are never
+    overwritten. The staging directory is removed in every case.
+
+    Args:
+        outputs: Paths of the job's output files in its staging directory,
+            keyed by format.
+        output_dir: Directory the outputs are published to.
+
+    Returns:
+        Optional[Dict[str, str]]: Published paths keyed by format, or None if
+        another copy of the job published first.
+    """
+    staging_dir = Path(outputs["json"]).parent
+    try:
+        published = {}
+        json_path = Path(output_dir) / Path(outputs["json"]).name
+        try:
+            os.link(outputs["json"], json_path)
+        except FileExistsError:
+            return None
+        published["json"] = str(json_path)
+
+        for fmt, path in outputs.items():
+            if fmt != "json":
+                target = Path(output_dir) / Path(path).name
+                os.replace(path, target)
+                published[fmt] = str(target)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    return published
+
+
+def publish_backup_outputs(
+    outputs: Dict[str, str],
+    output_dir: str,
+    original_job_id: str,
+    connection: Optional[redis.Redis] = None,
+) -> Optional[Dict[str, str]]:
+    """Publish a backup job's outputs and stop the original if the backup won.
+
+    Args:
+        outputs: Paths of the backup's output files, keyed by format.
+        output_dir: Directory where the original job publishes its outputs.
+        original_job_id: ID of the job the backup duplicates.
+        connection: Redis connection. If None, a new connection will be
+            created.
+
+    Returns:
+        Optional[Dict[str, str]]: Published paths keyed by format, or None if
+        the original job won.
+    """
+    published = publish_outputs(outputs, output_dir)
+    if published is None:
+        return None
+
+    # The original result is no longer needed
+    try:
+        send_stop_job_command(
+            connection or get_redis_connection(), original_job_id
+        )
+    except (InvalidJobOperation, NoSuchJobError, redis.RedisError):
+        pass  # Original job already finished
+
+    return published
+
+
+def run_straggler_watcher(
+    queue_name: str = "transcription", interval: float = DEFAULT_SCAN_INTERVAL
+) -> None:
+    """Scan for straggling jobs forever.
+
+    Args:
+        queue_name: Name of the queue to scan.
+        interval: Seconds to wait between scans.
+    """
+    connection = get_redis_connection()
+    while True:
+        watch_stragglers(queue_name, connection)
+        time.sleep(interval)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Duplicate straggling transcription jobs"
+    )
+    parser.add_argument(
+        "--queue",
+        type=str,
+        default="transcription",
+        help="Queue name to watch",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_SCAN_INTERVAL,
+        help="Seconds between scans",
+    )
+
+    args = parser.parse_args()
+    run_straggler_watcher(args.queue, args.interval)
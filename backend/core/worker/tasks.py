@@ -1,13 +1,72 @@
 """Task definitions for worker processing."""
+import functools
+import hashlib
 import os
+import secrets
 import shutil
-import uuid
+import tempfile
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, List, Optional, Sequence, Tuple
 
-from backend.core.worker import transcription
+import anyio.to_thread
+import orjson
+import redis
+from rq import Queue as RQQueue
+from rq import get_current_job
+from rq.job import Job, JobStatus
 
-from backend.core.worker.queue import get_queue
+from backend.core.utils import (
+    ensure_dir,
+    get_async_redis_connection,
+    get_redis_connection,
+)
+from backend.core.worker import stragglers
+
+from backend.core.worker.queue import get_async_queue, get_queue
+
+# Chunk size used when streaming uploads to disk (1 MiB)
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Drop saved uploads from the page cache, for hosts where the worker reads them
+# from another machine and the API should keep its own pages cached
+UPLOAD_DROP_CACHE = os.environ.get("UPLOAD_DROP_CACHE") == "1"
+
+# Vosk model size used for every job, small for faster processing
+MODEL_SIZE = "small"
+
+# Directory the transcription outputs are published to, and their formats
+TRANSCRIPTION_DIR = "data/transcriptions"
+OUTPUT_FORMATS = ("json", "vtt")
+
+# Prefix of the Redis keys caching the result of each transcribed file
+RESULT_KEY_PREFIX = "transcription:result:"
+
+# Prefix of the Redis keys claiming the job of a file, set before the job is
+# enqueued so concurrent uploads of the same file only enqueue it once
+JOB_CLAIM_KEY_PREFIX = "job-claim:"
+
+# Lifetime of a claim, it is released when the job ends and only outlives it
+# if the worker dies
+JOB_CLAIM_TTL = RQQueue.DEFAULT_TIMEOUT
+
+# Statuses of a job that will still run, a file with such a job is not enqueued
+# again even once its claim has expired
+PENDING_JOB_STATUSES = frozenset(
+    {
+        JobStatus.QUEUED,
+        JobStatus.STARTED,
+        JobStatus.DEFERRED,
+        JobStatus.SCHEDULED,
+    }
+)
+
+# Uploads are named after a hash of their content so re-uploads can be
+# detected. BLAKE3 is preferred for speed, BLAKE2 is the stdlib fallback.
+try:
+    from blake3 import blake3 as _content_hasher
+except ImportError:
+    _content_hasher = functools.partial(hashlib.blake2b, digest_size=16)
 
 
 def _ensure_upload_dir(upload_dir: str = "data/uploads") -> Path:
@@ -19,50 +78,222 @@ def _ensure_upload_dir(upload_dir: str = "data/uploads") -> Path:
     Returns:
         Path: Path to upload directory.
     """
-    path = Path(upload_dir)
-    path.mkdir(parents=True, exist_ok=True)
-    return path
+    return ensure_dir(upload_dir)
+
+
+def _copy_file(src: BinaryIO, dst: BinaryIO, hasher) -> None:
+    """Copy the rest of ``src`` into ``dst``, hashing it on the way.
+
+    The content is copied in chunks through a single reusable buffer.
+
+    Args:
+        src: Source binary file-like object, read from its current position.
+        dst: Destination binary file opened for writing.
+        hasher: Hash object updated with every chunk.
+    """
+    buffer = bytearray(COPY_BUFFER_SIZE)
+    view = memoryview(buffer)
+    readinto = getattr(src, "readinto", None)
+    while True:
+        if readinto is not None:
+            n = readinto(buffer)
+            chunk = view[:n]
+        else:
+            chunk = src.read(COPY_BUFFER_SIZE)
+            n = len(chunk)
+        if not n:
+            return
+        hasher.update(chunk)
+        dst.write(chunk)
+
+
+def _drop_page_cache(f: BinaryIO) -> None:
+    """Write a file to disk and evict its pages from the page cache.
+
+    Pages are only evicted once written back, so the file is synced first.
+    Does nothing unless ``UPLOAD_DROP_CACHE`` is set, or where
+    ``posix_fadvise`` is not available.
+
+    Args:
+        f: Binary file opened for writing.
+    """
+    if not UPLOAD_DROP_CACHE or not hasattr(os, "posix_fadvise"):
+        return
+    f.flush()
+    os.fdatasync(f.fileno())
+    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def result_key(file_id: str) -> str:
+    """Get the Redis key caching the transcription result of a file.
+
+    Args:
+        file_id: ID of the file.
+
+    Returns:
+        str: Redis key.
+    """
+    return f"{RESULT_KEY_PREFIX}{file_id}"
+
+
+def job_claim_key(file_id: str) -> str:
+    """Get the Redis key claiming the job of a file.
+
+    Args:
+        file_id: ID of the file.
+
+    Returns:
+        str: Redis key.
+    """
+    return f"{JOB_CLAIM_KEY_PREFIX}{file_id}"
+
+
+def _release_claim(file_id: str) -> None:
+    """Release the job claim of a file so it can be enqueued again.
+
+    Failures are logged and ignored, the claim expires on its own.
+
+    Args:
+        file_id: ID of the file.
+    """
+    try:
+        get_redis_connection().delete(job_claim_key(file_id))
+    except redis.RedisError as e:
+        print(f"Could not release job claim: {str(e)}")
+
+
+def _cache_result(file_id: str, result: Dict) -> None:
+    """Cache a transcription result so re-uploads of a file skip the job.
+
+    Failures are logged and ignored, the cache is best effort.
+
+    Args:
+        file_id: ID of the file.
+        result: Result returned by process_file.
+    """
+    job = get_current_job()
+    try:
+        get_redis_connection().set(
+            result_key(file_id),
+            orjson.dumps(
+                {
+                    "job_id": job.id if job else None,
+                    "transcription": result["transcription"],
+                }
+            ),
+        )
+    except redis.RedisError as e:
+        print(f"Could not cache result: {str(e)}")
+
+
+def _cached_job_info(
+    file_info: Dict, cached: Optional[bytes]
+) -> Optional[Dict]:
+    """Build the job information returned for an already transcribed file.
+
+    Args:
+        file_info: Information about the saved file.
+        cached: Cached result, or None if the file was never transcribed.
+
+    Returns:
+        Optional[Dict]: Job information, or None on a cache miss.
+    """
+    if cached is None:
+        return None
+
+    cached_result = orjson.loads(cached)
+    return {
+        "job_id": cached_result["job_id"],
+        "file_id": file_info["file_id"],
+        "original_filename": file_info["original_filename"],
+        "status": "transcribed",
+        "transcription": cached_result["transcription"]
+    }
+
+
+def _queued_job_info(file_info: Dict) -> Dict:
+    """Build the job information returned for a file waiting to be transcribed.
+
+    Args:
+        file_info: Information about the saved file.
+
+    Returns:
+        Dict: Job information.
+    """
+    return {
+        "job_id": file_job_id(file_info["file_id"]),
+        "file_id": file_info["file_id"],
+        "original_filename": file_info["original_filename"],
+        "status": "queued"
+    }
+
+
+def _is_pending(status: Optional[bytes]) -> bool:
+    """Check whether a job will still run, so its file is not enqueued again.
+
+    Args:
+        status: Status field of the job hash, or None if there is no such job.
+
+    Returns:
+        bool: True if the job is queued, started, deferred or scheduled.
+    """
+    return status is not None and status.decode() in PENDING_JOB_STATUSES
 
 
-def save_uploaded_file(file_content: bytes, filename: str, upload_dir: str = "data/uploads") -> Dict:
+def save_uploaded_file(
+    file_obj: BinaryIO, filename: str, upload_dir: str = "data/uploads"
+) -> Dict:
     """Save uploaded file to disk.
 
+    The content is streamed without loading it into memory. The file is
+    named after a hash of its content, computed during the copy, so the
+    same file uploaded twice gets the same ID.
+
     Args:
-        file_content: File content.
+        file_obj: Binary file-like object with the file content.
         filename: Original filename.
         upload_dir: Directory to store uploaded files.
 
     Returns:
         Dict: Information about the saved file.
     """
-    # Generate a unique ID for the file
-    file_id = str(uuid.uuid4())
-    
     # Get file extension
     _, ext = os.path.splitext(filename)
     
-    # Create safe filename with original name and unique ID
-    safe_filename = f"{file_id}{ext}"
-    
     # Ensure upload directory exists
     upload_path = _ensure_upload_dir(upload_dir)
     
-    # Full path to the file
-    file_path = upload_path / safe_filename
-    
-    # Save file
-    with open(file_path, "wb") as f:
-        f.write(file_content)
+    # Stream file to a temporary name, the final name depends on the content.
+    # Created with the umask applied like open() does, unlike mkstemp's 0600,
+    # so workers running as another user can read the upload.
+    temp_path = os.path.join(
+        upload_path, f".upload-{secrets.token_hex(8)}{ext}"
+    )
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        hasher = _content_hasher()
+        with open(fd, "wb", buffering=COPY_BUFFER_SIZE) as f:
+            _copy_file(file_obj, f, hasher)
+            size = f.tell()
+            _drop_page_cache(f)
+
+        file_id = hasher.hexdigest()[:32]
+        # Plain string join, no Path objects are built per upload
+        file_path = os.path.join(upload_path, f"{file_id}{ext}")
+        os.replace(temp_path, file_path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
     
     return {
         "file_id": file_id,
         "original_filename": filename,
-        "path": str(file_path),
-        "size": len(file_content)
+        "path": file_path,
+        "size": size
     }
 
 
-def process_file(file_info: Dict) -> Dict:
+def process_file(file_info: Dict, backup_of: Optional[str] = None) -> Dict:
     """Process uploaded file using Vosk for transcription.
     
     This function is executed by the worker to process audio files.
@@ -71,49 +302,78 @@ def process_file(file_info: Dict) -> Dict:
 
     Args:
         file_info: Information about the file.
+        backup_of: ID of the straggling job this job duplicates, if any. Both
+            the original and the backup work in a staging directory and only
+            publish their outputs if the other has not finished first.
 
     Returns:
         Dict: Processing result with transcription data.
     """
+    # Vosk is only loaded by the processes that transcribe, not by the API
+    from backend.core.worker import transcription
+
+    started = time.monotonic()
+    staging_dir = None
     try:
         file_path = file_info["path"]
-        file_id = file_info["file_id"]
         
         # Create transcription directory if it doesn't exist
-        transcription_dir = Path("data/transcriptions")
-        transcription_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Convert audio to a format compatible with Vosk if needed
-        _, ext = os.path.splitext(file_path)
-        if ext.lower() not in [".wav"]:
-            # Convert to WAV format for best compatibility with Vosk
-            wav_path = os.path.join("data/uploads", f"{file_id}.wav")
-            converted_path = transcription.convert_audio_format(
-                input_file=file_path,
-                output_file=wav_path
-            )
-        else:
-            converted_path = file_path
+        transcription_dir = ensure_dir(TRANSCRIPTION_DIR)
         
-        # Perform transcription using Vosk
+        # Outputs left by an earlier run of the same file would block the
+        # claim below. No backup exists yet when the original job starts.
+        if backup_of is None:
+            base_name = Path(file_path).stem
+            for fmt in OUTPUT_FORMATS:
+                (transcription_dir / f"{base_name}.{fmt}").unlink(
+                    missing_ok=True
+                )
+
+        # Outputs are written to a staging directory and only moved into
+        # place once complete, so the original job and its backup never
+        # write the published files
+        staging_dir = tempfile.mkdtemp(
+            prefix=".staging-", dir=transcription_dir
+        )
+
+        # Perform transcription using Vosk. Non-WAV uploads are decoded by
+        # ffmpeg straight into the recognizer, no converted copy is written.
         result = transcription.transcribe_audio(
-            audio_file=converted_path,
-            output_dir="data/transcriptions",
-            model_size="small",  # Use small model for faster processing
-            output_formats=["json", "vtt"],
-            mock_mode=False
+            audio_file=file_path,
+            output_dir=staging_dir,
+            model_size=MODEL_SIZE,
+            output_formats=list(OUTPUT_FORMATS),
+            create_output_dir=False,
         )
         
+        outputs = result["outputs"]
+        staged = {
+            fmt: outputs[fmt] for fmt in OUTPUT_FORMATS if fmt in outputs
+        }
+        if backup_of is None:
+            published = stragglers.publish_outputs(staged, TRANSCRIPTION_DIR)
+        else:
+            published = stragglers.publish_backup_outputs(
+                staged, TRANSCRIPTION_DIR, backup_of
+            )
+        if published is None:
+            return {**file_info, "status": "duplicate"}
+        outputs = {**outputs, **published}
+        if backup_of is None:
+            stragglers.record_runtime(time.monotonic() - started)
+
         # Return results
-        return {
+        result = {
             **file_info,
             "status": "transcribed",
             "transcription": {
-                "json_path": result["outputs"].get("json", ""),
-                "vtt_path": result["outputs"].get("vtt", ""),
-                "transcript": result["outputs"].get("transcription", {}).get("text", "")
+                "json_path": outputs.get("json", ""),
+                "vtt_path": outputs.get("vtt", ""),
+                "transcript": outputs.get("transcription", {}).get("text", "")
             }
         }
+        _cache_result(file_info["file_id"], result)
+        return result
     except Exception as e:
         # Log the error and return error status
         print(f"Error processing file: {str(e)}")
@@ -122,13 +382,27 @@ def process_file(file_info: Dict) -> Dict:
             "status": "error",
             "error": str(e)
         }
+    finally:
+        if staging_dir is not None:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+        # The claim taken when the file was enqueued belongs to the original
+        # job, a re-upload after this point hits the result cache or retries
+        if backup_of is None:
+            _release_claim(file_info["file_id"])
 
 
-def enqueue_file(file_content: bytes, filename: str, upload_dir: str = "data/uploads") -> Dict:
+def enqueue_file(
+    file_obj: BinaryIO, filename: str, upload_dir: str = "data/uploads"
+) -> Dict:
     """Save file and enqueue it for processing.
 
+    Only the saved file metadata is passed to the queue, never the content.
+    Files that were already transcribed are not enqueued again, the cached
+    result is returned instead, and neither are files whose job is still
+    pending.
+
     Args:
-        file_content: File content.
+        file_obj: Binary file-like object with the file content.
         filename: Original filename.
         upload_dir: Directory to store uploaded files.
 
@@ -136,17 +410,238 @@ def enqueue_file(file_content: bytes, filename: str, upload_dir: str = "data/upl
         Dict: Job information.
     """
     # Save the file
-    file_info = save_uploaded_file(file_content, filename, upload_dir)
-    
-    # Get queue
-    queue = get_queue()
+    file_info = save_uploaded_file(file_obj, filename, upload_dir)
     
-    # Enqueue job
-    job = queue.enqueue(process_file, file_info)
-    
-    return {
-        "job_id": job.id,
-        "file_id": file_info["file_id"],
-        "original_filename": file_info["original_filename"],
-        "status": "queued"
-    }
+    # Skip the job entirely if the same file was already transcribed
+    cached = _cached_job_info(
+        file_info, get_redis_connection().get(result_key(file_info["file_id"]))
+    )
+    if cached is not None:
+        return cached
+
+    # Skip the job if the same file was uploaded again while its job is
+    # pending. The claim is taken atomically, so of several concurrent uploads
+    # only one enqueues the job.
+    job_info = _queued_job_info(file_info)
+    connection = get_redis_connection()
+    claim_key = job_claim_key(file_info["file_id"])
+    if not connection.set(
+        claim_key, job_info["job_id"], nx=True, ex=JOB_CLAIM_TTL
+    ):
+        return job_info
+    if _is_pending(
+        connection.hget(Job.key_for(job_info["job_id"]), "status")
+    ):
+        return job_info
+
+    try:
+        get_queue().enqueue(
+            process_file, file_info, job_id=job_info["job_id"]
+        )
+    except BaseException:
+        connection.delete(claim_key)
+        raise
+    return job_info
+
+
+def enqueue_files(
+    files: Sequence[Tuple[BinaryIO, str]], upload_dir: str = "data/uploads"
+) -> List[Dict]:
+    """Save several files and enqueue the ones not transcribed yet, in bulk.
+
+    The result cache is checked for all files with a single MGET, the jobs
+    are claimed through one pipeline and enqueued through another, so a batch
+    costs three Redis round-trips whatever its size. A file uploaded twice in
+    the same batch, or whose job is already pending, is only enqueued once.
+
+    Args:
+        files: Sequence of (file_obj, filename) tuples.
+        upload_dir: Directory to store uploaded files.
+
+    Returns:
+        List[Dict]: Job information, in the same order as ``files``.
+    """
+    file_infos = [
+        save_uploaded_file(file_obj, filename, upload_dir)
+        for file_obj, filename in files
+    ]
+    if not file_infos:
+        return []
+
+    connection = get_redis_connection()
+    cached_values = connection.mget(
+        [result_key(info["file_id"]) for info in file_infos]
+    )
+
+    job_infos = []
+    pending = {}
+    for file_info, cached_value in zip(file_infos, cached_values):
+        cached = _cached_job_info(file_info, cached_value)
+        if cached is None:
+            pending.setdefault(file_info["file_id"], file_info)
+            cached = _queued_job_info(file_info)
+        job_infos.append(cached)
+
+    if pending:
+        # Claim every job and read its status in one round-trip, files whose
+        # job is claimed or pending elsewhere are left out
+        pipe = connection.pipeline(transaction=False)
+        for file_id in pending:
+            pipe.set(
+                job_claim_key(file_id),
+                file_job_id(file_id),
+                nx=True,
+                ex=JOB_CLAIM_TTL,
+            )
+            pipe.hget(Job.key_for(file_job_id(file_id)), "status")
+        replies = pipe.execute()
+        pending = {
+            file_id: file_info
+            for (file_id, file_info), claimed, status in zip(
+                pending.items(), replies[::2], replies[1::2]
+            )
+            if claimed and not _is_pending(status)
+        }
+
+    if pending:
+        try:
+            get_queue().enqueue_many(
+                [
+                    (process_file, (file_info,), {})
+                    for file_info in pending.values()
+                ],
+                job_ids=[file_job_id(file_id) for file_id in pending],
+            )
+        except BaseException:
+            connection.delete(*[job_claim_key(file_id) for file_id in pending])
+            raise
+
+    return job_infos
+
+
+def file_job_id(file_id: str) -> str:
+    """Get the ID of the job processing a file.
+
+    Job IDs are derived from the file ID so they are known before the job is
+    enqueued.
+
+    Args:
+        file_id: ID of the file.
+
+    Returns:
+        str: Job ID.
+    """
+    return f"job-{file_id}"
+
+
+async def save_uploaded_file_async(
+    file_obj: BinaryIO, filename: str, upload_dir: str = "data/uploads"
+) -> Dict:
+    """Save uploaded file to disk without blocking the event loop.
+
+    Args:
+        file_obj: Binary file-like object with the file content.
+        filename: Original filename.
+        upload_dir: Directory to store uploaded files.
+
+    Returns:
+        Dict: Information about the saved file.
+    """
+    # Save the file in a worker thread so the event loop is never blocked on
+    # disk I/O
+    return await anyio.to_thread.run_sync(
+        save_uploaded_file, file_obj, filename, upload_dir
+    )
+
+
+async def get_cached_job_info_async(file_info: Dict) -> Optional[Dict]:
+    """Get the job information of a file that was already transcribed.
+
+    Args:
+        file_info: Information about the saved file.
+
+    Returns:
+        Optional[Dict]: Job information with the cached result, or None.
+    """
+    connection = get_async_redis_connection()
+    return _cached_job_info(
+        file_info, await connection.get(result_key(file_info["file_id"]))
+    )
+
+
+async def enqueue_saved_file_async(file_info: Dict) -> Dict:
+    """Enqueue a saved file for processing without blocking on Redis.
+
+    The same file uploaded again while its job is still pending is not
+    enqueued a second time, even by concurrent requests.
+
+    Args:
+        file_info: Information about the saved file.
+
+    Returns:
+        Dict: Job information.
+    """
+    job_info = _queued_job_info(file_info)
+    connection = get_async_redis_connection()
+    claim_key = job_claim_key(file_info["file_id"])
+    if not await connection.set(
+        claim_key, job_info["job_id"], nx=True, ex=JOB_CLAIM_TTL
+    ):
+        return job_info
+    status = await connection.hget(Job.key_for(job_info["job_id"]), "status")
+    if _is_pending(status):
+        return job_info
+
+    try:
+        await get_async_queue().enqueue(
+            process_file, file_info, job_id=job_info["job_id"]
+        )
+    except BaseException:
+        await connection.delete(claim_key)
+        raise
+    return job_info
+
+
+async def enqueue_saved_file_background(file_info: Dict) -> None:
+    """Enqueue a saved file after its job ID was already sent to the client.
+
+    Errors can no longer reach the client, so they are logged with the file
+    ID and recorded as a failed status under the job key.
+
+    Args:
+        file_info: Information about the saved file.
+    """
+    try:
+        await enqueue_saved_file_async(file_info)
+    except Exception as e:
+        print(f"Could not enqueue file {file_info['file_id']}: {str(e)}")
+        try:
+            await get_async_redis_connection().hset(
+                Job.key_for(file_job_id(file_info["file_id"])),
+                mapping={"status": JobStatus.FAILED.value, "exc_info": str(e)},
+            )
+        except redis.RedisError as e:
+            print(f"Could not record failed job: {str(e)}")
+
+
+async def enqueue_file_async(
+    file_obj: BinaryIO, filename: str, upload_dir: str = "data/uploads"
+) -> Dict:
+    """Save file and enqueue it for processing without blocking on Redis.
+
+    Args:
+        file_obj: Binary file-like object with the file content.
+        filename: Original filename.
+        upload_dir: Directory to store uploaded files.
+
+    Returns:
+        Dict: Job information.
+    """
+    file_info = await save_uploaded_file_async(file_obj, filename, upload_dir)
+
+    # Skip the job entirely if the same file was already transcribed
+    cached = await get_cached_job_info_async(file_info)
+    if cached is not None:
+        return cached
+
+    return await enqueue_saved_file_async(file_info)
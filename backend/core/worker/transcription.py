@@ -1,21 +1,117 @@
 """Module for transcription using Vosk ASR (replacing Whisper CLI)."""
-import json
+import concurrent.futures
+import contextlib
+import functools
+import io
+import itertools
 import os
+import queue
 import subprocess
 import tempfile
 import wave
-import datetime
 import requests
 import shutil
 import tarfile
+import zipfile
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Tuple
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Union,
+    Tuple,
+)
+
+import anyio
+import anyio.to_thread
+import cffi
+import orjson
 from vosk import Model, KaldiRecognizer, SetLogLevel
 
+from backend.core.utils import ensure_dir
+
+# PyAV decodes audio in-process, without an ffmpeg subprocess
+try:
+    import av
+except ImportError:
+    av = None
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('vosk_transcription')
+SetLogLevel(-1)  # Only Vosk warnings and errors, no LOG lines
+
+# Wraps reusable read buffers as C char arrays, which AcceptWaveform takes
+# without a copy
+_ffi = cffi.FFI()
+
+# Models (and their recognizers) kept loaded per process, e.g. a few languages
+MODEL_CACHE_SIZE = 4
+
+# Sample rate of the PCM stream decoded for Vosk
+PCM_SAMPLE_RATE = 16000
+
+# Bytes of 16-bit mono PCM fed to the recognizer at a time: 16000 frames, 1s
+# at 16 kHz. Files are transcribed offline, so latency does not matter and
+# utterances are only finalized on silence; larger chunks just mean fewer
+# AcceptWaveform calls.
+PCM_CHUNK_SIZE = 32000
+
+# WAV files longer than this many seconds are split into chunks of this
+# length, recognized in parallel by several recognizers sharing one model
+PARALLEL_CHUNK_SECONDS = 30
+
+# Audio, in seconds, each chunk also reads past its own bounds, so a word
+# cut by a chunk boundary is still heard whole by one of the two chunks
+CHUNK_OVERLAP_SECONDS = 0.5
+
+# Cores this process may use. run_worker sets WORKER_CPUS to each worker
+# process's share, otherwise every core is available.
+WORKER_CPUS = int(os.environ.get("WORKER_CPUS") or os.cpu_count() or 1)
+
+# Threads recognizing the chunks of a single file
+RECOGNIZER_THREADS = min(WORKER_CPUS, 4)
+
+# Pause between two words, in seconds, that starts a new segment
+SEGMENT_PAUSE = 0.3
+
+# Model archives up to this size are downloaded in memory, larger ones spill to
+# disk
+MODEL_SPOOL_SIZE = 64 * 1024 * 1024
+
+# Block size used when downloading model archives
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Connections used to download archives too large to spool in memory, each
+# fetching one byte range
+DOWNLOAD_CONNECTIONS = 4
+
+# Attempts per byte range, each resuming after the last byte received
+DOWNLOAD_RETRIES = 3
+
+# ffmpeg audio codec arguments per converted file format. FLAC at level 0
+# roughly halves the bytes written for almost no encoding cost.
+CONVERSION_CODECS = {
+    "wav": ["-c:a", "pcm_s16le"],  # 16-bit PCM
+    "flac": ["-c:a", "flac", "-compression_level", "0"],
+}
+
+# Model directories found installed. Models are never removed while a worker
+# runs, so they are not looked up on disk again for every job.
+_installed_models: Set[Path] = set()
+
+# Threads extracting the members of a model archive, zlib inflates without the
+# GIL
+EXTRACT_THREADS = WORKER_CPUS
+
+# Read buffer of the ffmpeg pipe, so small chunk reads do not each cost a
+# syscall
+PIPE_BUFFER_SIZE = 1024 * 1024
 
 class TranscriptionError(Exception):
     """Exception raised for errors in the transcription process."""
@@ -23,17 +119,23 @@ class TranscriptionError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=1)
 def ensure_ffmpeg() -> bool:
     """Check if ffmpeg is installed.
     
+    The result is cached for the lifetime of the process.
+
     Returns:
         bool: True if ffmpeg is available, False otherwise.
     """
+    if shutil.which("ffmpeg") is None:
+        return False
+
     try:
         result = subprocess.run(
             ["ffmpeg", "-version"], 
-            capture_output=True, 
-            text=True, 
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=False
         )
         return result.returncode == 0
@@ -48,10 +150,16 @@ def convert_audio_format(
 ) -> str:
     """Convert audio file to a format compatible with Whisper.
 
+    The samples are stored as 16-bit PCM, uncompressed in WAV files and
+    losslessly compressed in FLAC files. A WAV input already in that format
+    is not converted when no output file is requested.
+
     Args:
         input_file: Path to input audio file.
-        output_format: Desired output format (default: wav).
-        output_file: Path to output file. If None, a temporary file will be created.
+        output_format: Desired output format, "wav" (default) or "flac".
+        output_file: Path to output file. If None, a temporary file will be
+            created, or input_file itself is returned if it needs no
+            conversion.
 
     Returns:
         str: Path to the converted audio file.
@@ -59,6 +167,14 @@ def convert_audio_format(
     Raises:
         TranscriptionError: If conversion fails.
     """
+    if output_format not in CONVERSION_CODECS:
+        raise TranscriptionError(f"Unsupported output format: {output_format}")
+
+    if output_format == "wav" and output_file is None:
+        with contextlib.ExitStack() as stack:
+            if _open_pcm16_wav(stack, input_file) is not None:
+                return input_file
+
     if not ensure_ffmpeg():
         raise TranscriptionError("FFmpeg is not installed. Required for audio conversion.")
 
@@ -66,24 +182,658 @@ def convert_audio_format(
         fd, output_file = tempfile.mkstemp(suffix=f".{output_format}")
         os.close(fd)
 
+    # Only errors are logged, to a file that is read back only if ffmpeg fails
+    with tempfile.TemporaryFile() as stderr:
+        try:
+            subprocess.run(
+                [
+                    "ffmpeg",
+                    "-nostdin",
+                    "-loglevel",
+                    "error",
+                    "-i",
+                    input_file,
+                    "-vn",
+                    "-sn",
+                    "-dn",  # Skip video, subtitle and data streams
+                    "-ar",
+                    "16000",  # Whisper prefers 16kHz audio
+                    "-ac",
+                    "1",  # Mono channel
+                    "-sample_fmt",
+                    "s16",
+                    *CONVERSION_CODECS[output_format],
+                    "-y",            # Overwrite output file
+                    output_file
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=stderr,
+                check=True,
+                close_fds=False,  # See decode_audio_stream
+            )
+            return output_file
+        except subprocess.CalledProcessError:
+            stderr.seek(0)
+            raise TranscriptionError(
+                "Audio conversion failed: "
+                f"{stderr.read().decode(errors='replace')}"
+            )
+
+
+@contextlib.contextmanager
+def decode_audio_stream(
+    input_file: str, sample_rate: int = PCM_SAMPLE_RATE
+) -> Iterator[BinaryIO]:
+    """Decode audio to raw 16-bit mono PCM read straight from ffmpeg's stdout.
+
+    Unlike convert_audio_format, no intermediate WAV file is written to disk.
+
+    Args:
+        input_file: Path to input audio file.
+        sample_rate: Sample rate of the decoded stream.
+
+    Yields:
+        BinaryIO: Pipe with the decoded PCM samples.
+
+    Raises:
+        TranscriptionError: If ffmpeg is missing or decoding fails.
+    """
+    # ffmpeg errors go to a file so a chatty stderr can never block the pipe
+    with tempfile.TemporaryFile() as stderr:
+        try:
+            proc = subprocess.Popen(
+                [
+                    "ffmpeg",
+                    "-nostdin",
+                    "-loglevel",
+                    "error",
+                    "-i",
+                    input_file,
+                    "-vn",
+                    "-sn",
+                    "-dn",  # Skip video, subtitle and data streams
+                    "-f",
+                    "s16le",  # Raw 16-bit PCM
+                    "-ac",
+                    "1",  # Mono channel
+                    "-ar",
+                    str(sample_rate),
+                    "pipe:1",
+                ],
+                stdout=subprocess.PIPE,
+                stderr=stderr,
+                bufsize=PIPE_BUFFER_SIZE,
+                # Python opens every descriptor non-inheritable (PEP 446), so
+                # Redis sockets never leak into ffmpeg. Skipping the close
+                # pass over every open descriptor makes the spawn cheaper.
+                close_fds=False,
+            )
+        except FileNotFoundError:
+            raise TranscriptionError(
+                "FFmpeg is not installed. Required for audio conversion."
+            )
+
+        try:
+            yield proc.stdout
+        finally:
+            proc.stdout.close()
+            returncode = proc.wait()
+
+        if returncode != 0:
+            stderr.seek(0)
+            raise TranscriptionError(
+                "Audio decoding failed: "
+                f"{stderr.read().decode(errors='replace')}"
+            )
+
+
+def _open_pcm16_wav(
+    stack: contextlib.ExitStack, audio_file: str
+) -> Optional[Tuple[BinaryIO, wave.Wave_read]]:
+    """Open a WAV file that Vosk can read as is, without decoding.
+
+    Only 16-bit mono PCM at PCM_SAMPLE_RATE qualifies, so every stream is fed
+    to a recognizer for the same rate as the model.
+
+    Args:
+        stack: Exit stack that closes the file.
+        audio_file: Path to audio file.
+
+    Returns:
+        Optional[Tuple[BinaryIO, wave.Wave_read]]: Raw file positioned at the
+        start of the samples and its WAV reader, or None if the file has to be
+        decoded.
+    """
+    if not audio_file.lower().endswith('.wav'):
+        return None
+
+    f = stack.enter_context(open(audio_file, "rb"))
     try:
-        result = subprocess.run(
-            [
-                "ffmpeg", 
-                "-i", input_file,
-                "-ar", "16000",  # Whisper prefers 16kHz audio
-                "-ac", "1",      # Mono channel
-                "-c:a", "pcm_s16le",  # 16-bit PCM
-                "-y",            # Overwrite output file
-                output_file
-            ],
-            capture_output=True,
-            text=True,
-            check=True
+        wf = stack.enter_context(wave.open(f, "rb"))
+    except (wave.Error, EOFError):
+        return None  # Not a PCM WAV file, e.g. float samples
+
+    if (
+        wf.getnchannels(),
+        wf.getsampwidth(),
+        wf.getframerate(),
+        wf.getcomptype(),
+    ) != (1, 2, PCM_SAMPLE_RATE, "NONE"):
+        return None
+    return f, wf
+
+
+def _read_pcm_chunks(
+    f: BinaryIO, size: Optional[int] = None, chunk_size: int = PCM_CHUNK_SIZE
+) -> Iterator[Any]:
+    """Read raw PCM in chunks, reusing a single buffer.
+
+    Each chunk is a view of the same buffer and is only valid until the next
+    one is read.
+
+    Args:
+        f: File or pipe positioned at the first sample.
+        size: Number of bytes of samples to read. If None, read until the end.
+        chunk_size: Number of bytes per chunk.
+
+    Yields:
+        cffi char arrays over the buffer, of at most chunk_size bytes.
+    """
+    view = memoryview(bytearray(chunk_size))
+    while size is None or size > 0:
+        n = f.readinto(view if size is None else view[:min(chunk_size, size)])
+        if not n:
+            break
+        if size is not None:
+            size -= n
+        yield _ffi.from_buffer(view[:n])
+
+
+def decode_to_pcm16(
+    input_file: str,
+    sample_rate: int = PCM_SAMPLE_RATE,
+    chunk_size: int = PCM_CHUNK_SIZE,
+) -> Iterator[Any]:
+    """Decode audio to 16-bit mono PCM chunks without writing any file.
+
+    PyAV decodes and resamples in-process when it is installed. Otherwise
+    the samples are read from an ffmpeg subprocess, see decode_audio_stream,
+    into a single reused buffer.
+
+    Args:
+        input_file: Path to input audio file.
+        sample_rate: Sample rate of the decoded audio.
+        chunk_size: Maximum size in bytes of the yielded chunks.
+
+    Yields:
+        Chunks of raw PCM samples, bytes or views only valid until the next
+        chunk is read.
+
+    Raises:
+        TranscriptionError: If decoding fails.
+    """
+    if av is None:
+        with decode_audio_stream(input_file, sample_rate) as pcm:
+            yield from _read_pcm_chunks(pcm, chunk_size=chunk_size)
+        return
+
+    buffer = bytearray()
+    with av.open(input_file) as container:
+        resampler = av.AudioResampler(
+            format="s16", layout="mono", rate=sample_rate
+        )
+        frames = container.decode(audio=0)
+        # A final resample(None) flushes the samples buffered by the resampler
+        for frame in itertools.chain(frames, [None]):
+            for resampled in resampler.resample(frame):
+                # Planes can be padded past the last sample
+                plane = memoryview(resampled.planes[0])
+                buffer += plane[:resampled.samples * 2]
+            while len(buffer) >= chunk_size:
+                yield bytes(buffer[:chunk_size])
+                del buffer[:chunk_size]
+    if buffer:
+        yield bytes(buffer)
+
+
+def group_words_into_segments(
+    words: List[Dict], pause: float = SEGMENT_PAUSE
+) -> List[Dict]:
+    """Group recognized words into segments separated by pauses.
+
+    The pauses are found in a single pass over the word timings, then each
+    segment is sliced and joined once.
+
+    Args:
+        words: Words with "word", "start" and "end" keys, in order.
+        pause: Minimum silence in seconds between two segments.
+
+    Returns:
+        List[Dict]: Segments with id, start, end and text.
+    """
+    if not words:
+        return []
+
+    starts = [word["start"] for word in words]
+    ends = [word["end"] for word in words]
+    breaks = [
+        i
+        for i, (start, prev_end) in enumerate(zip(starts[1:], ends), 1)
+        if start - prev_end > pause
+    ]
+    bounds = zip([0] + breaks, breaks + [len(words)])
+
+    return [
+        {
+            "id": segment_id,
+            "start": round(starts[first], 3),
+            "end": round(ends[last - 1], 3),
+            "text": " ".join(word["word"] for word in words[first:last])
+        }
+        for segment_id, (first, last) in enumerate(bounds)
+    ]
+
+
+def format_vtt_timestamp(seconds: float) -> str:
+    """Format a time offset as a WebVTT timestamp.
+
+    Args:
+        seconds: Offset from the start of the audio, in seconds.
+
+    Returns:
+        str: Timestamp in HH:MM:SS.mmm format, rounded to the millisecond.
+    """
+    ms = int(round(seconds * 1000))
+    h, ms = divmod(ms, 3600000)
+    m, ms = divmod(ms, 60000)
+    s, ms = divmod(ms, 1000)
+    return f"{h:02d}:{m:02d}:{s:02d}.{ms:03d}"
+
+
+@functools.lru_cache(maxsize=MODEL_CACHE_SIZE)
+def load_model(model_path: str) -> Model:
+    """Load a Vosk model, once per process.
+
+    Loading a model takes seconds and hundreds of MB, so the most recently
+    used models are cached and shared by every job the process (or its
+    forked work horses) runs.
+
+    Args:
+        model_path: Path to the Vosk model directory.
+
+    Returns:
+        Model: Loaded Vosk model.
+    """
+    return Model(model_path)
+
+
+@functools.lru_cache(maxsize=MODEL_CACHE_SIZE)
+def _recognizer_pool(
+    model_path: str, sample_rate: int
+) -> "queue.SimpleQueue[KaldiRecognizer]":
+    """Get the pool of idle recognizers for a model and sample rate."""
+    return queue.SimpleQueue()
+
+
+@contextlib.contextmanager
+def acquire_recognizer(
+    model_path: str, sample_rate: int = PCM_SAMPLE_RATE
+) -> Iterator[KaldiRecognizer]:
+    """Borrow a recognizer ready for a new audio stream.
+
+    Recognizers are not thread safe, so each stream gets one of its own. They
+    are returned to a pool afterwards and reused by later streams of the same
+    process, a new one is only created when every pooled one is in use. They
+    are reset here in case a previous stream was interrupted before its final
+    result.
+
+    Args:
+        model_path: Path to the Vosk model directory.
+        sample_rate: Sample rate of the audio fed to the recognizer.
+
+    Yields:
+        KaldiRecognizer: Recognizer with word timestamps enabled.
+    """
+    pool = _recognizer_pool(model_path, sample_rate)
+    try:
+        rec = pool.get_nowait()
+    except queue.Empty:
+        rec = KaldiRecognizer(load_model(model_path), sample_rate)
+        rec.SetWords(True)  # Get word timestamps
+
+    rec.Reset()
+    try:
+        yield rec
+    finally:
+        pool.put(rec)
+
+
+def _get_model_path(model_size: str, language: Optional[str]) -> Path:
+    """Get the path of the Vosk model to use, downloading it if necessary.
+
+    Args:
+        model_size: Vosk model size (small, medium, large).
+        language: Language code (ISO 639-1), or None for English.
+
+    Returns:
+        Path: Path to the model directory.
+
+    Raises:
+        TranscriptionError: If the model cannot be obtained.
+    """
+    try:
+        model_path = get_vosk_model(model_size, language)
+        logger.info(f"Using Vosk model at {model_path}")
+        return model_path
+    except Exception as e:
+        raise TranscriptionError(f"Could not obtain Vosk model: {str(e)}")
+
+
+def _recognize_chunks(
+    rec: KaldiRecognizer, chunks: Iterator[Any]
+) -> List[Dict]:
+    """Feed PCM chunks to a recognizer and collect the recognized words.
+
+    Args:
+        rec: Recognizer ready for a new audio stream.
+        chunks: Chunks of 16-bit mono PCM.
+
+    Returns:
+        List[Dict]: Recognized words with their start and end times.
+    """
+    all_words = []
+
+    for data in chunks:
+        if rec.AcceptWaveform(data):
+            # Process complete utterance
+            result = orjson.loads(rec.Result())
+            if "result" in result and result["result"]:
+                # Add words with precise timestamps
+                all_words.extend(result["result"])
+                # We'll group them into segments later
+
+    # Get final result
+    final_result = orjson.loads(rec.FinalResult())
+    if "result" in final_result and final_result["result"]:
+        all_words.extend(final_result["result"])
+
+    return all_words
+
+
+def _recognize_wav_range(
+    audio_file: str,
+    model_path: str,
+    data_offset: int,
+    first_frame: int,
+    last_frame: int,
+    keep_from: int,
+    keep_until: int,
+) -> List[Dict]:
+    """Recognize a range of frames of a PCM WAV file.
+
+    The range is read through a file of its own, so several ranges can be
+    recognized at the same time. Only the words starting between keep_from
+    and keep_until are returned, the rest of the range is overlap already
+    covered by the neighbouring ranges.
+
+    Args:
+        audio_file: Path to a 16-bit mono PCM WAV file at PCM_SAMPLE_RATE.
+        model_path: Path to the Vosk model directory.
+        data_offset: Offset in bytes of the first sample in the file.
+        first_frame: First frame read.
+        last_frame: Frame the range stops before.
+        keep_from: First frame where returned words can start.
+        keep_until: Frame returned words must start before.
+
+    Returns:
+        List[Dict]: Recognized words, timed from the start of the file.
+    """
+    offset = first_frame / PCM_SAMPLE_RATE
+    keep_from_seconds = keep_from / PCM_SAMPLE_RATE
+    keep_until_seconds = keep_until / PCM_SAMPLE_RATE
+
+    with open(audio_file, "rb") as f, acquire_recognizer(
+        model_path, PCM_SAMPLE_RATE
+    ) as rec:
+        f.seek(data_offset + first_frame * 2)
+        words = _recognize_chunks(
+            rec, _read_pcm_chunks(f, (last_frame - first_frame) * 2)
         )
-        return output_file
-    except subprocess.CalledProcessError as e:
-        raise TranscriptionError(f"Audio conversion failed: {e.stderr}")
+
+    return [
+        {**word, "start": word["start"] + offset, "end": word["end"] + offset}
+        for word in words
+        if keep_from_seconds <= word["start"] + offset < keep_until_seconds
+    ]
+
+
+def _recognize_wav_parallel(
+    audio_file: str,
+    model_path: str,
+    data_offset: int,
+    nframes: int,
+    num_workers: int,
+) -> List[Dict]:
+    """Recognize a PCM WAV file in chunks spread over several threads.
+
+    Vosk releases the GIL while decoding, so the chunks are recognized in
+    parallel. Each thread borrows its own recognizer, all of them share the
+    same model.
+
+    Args:
+        audio_file: Path to a 16-bit mono PCM WAV file at PCM_SAMPLE_RATE.
+        model_path: Path to the Vosk model directory.
+        data_offset: Offset in bytes of the first sample in the file.
+        nframes: Number of frames in the file.
+        num_workers: Number of recognizer threads.
+
+    Returns:
+        List[Dict]: Recognized words with their start and end times, in order.
+    """
+    chunk_frames = PARALLEL_CHUNK_SECONDS * PCM_SAMPLE_RATE
+    overlap_frames = int(CHUNK_OVERLAP_SECONDS * PCM_SAMPLE_RATE)
+
+    # Load the model up front, rather than in every thread at once
+    load_model(model_path)
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=num_workers
+    ) as executor:
+        futures = [
+            executor.submit(
+                _recognize_wav_range,
+                audio_file,
+                model_path,
+                data_offset,
+                max(start - overlap_frames, 0),
+                min(start + chunk_frames + overlap_frames, nframes),
+                start,
+                min(start + chunk_frames, nframes),
+            )
+            for start in range(0, nframes, chunk_frames)
+        ]
+        return [word for future in futures for word in future.result()]
+
+
+def recognize_words(
+    audio_file: str,
+    model_path: Union[str, Path],
+    num_workers: int = RECOGNIZER_THREADS,
+) -> List[Dict]:
+    """Run Vosk over an audio file.
+
+    PCM WAV files longer than PARALLEL_CHUNK_SECONDS are split into chunks
+    recognized by up to num_workers threads. Other files are decoded as a
+    stream and recognized sequentially.
+
+    Args:
+        audio_file: Path to audio file.
+        model_path: Path to the Vosk model directory.
+        num_workers: Number of threads recognizing a long WAV file.
+
+    Returns:
+        List[Dict]: Recognized words with their start and end times.
+    """
+    with contextlib.ExitStack() as stack:
+        wav = _open_pcm16_wav(stack, audio_file)
+        if wav is not None:
+            f, wf = wav
+            nframes = wf.getnframes()
+
+            # Get file duration for proper timings
+            duration = nframes / float(PCM_SAMPLE_RATE)
+            logger.info(f"Audio duration: {duration:.2f} seconds")
+
+            if num_workers > 1 and duration > PARALLEL_CHUNK_SECONDS:
+                return _recognize_wav_parallel(
+                    audio_file, str(model_path), f.tell(), nframes, num_workers
+                )
+
+            # The reader leaves the file at the samples, read them straight
+            # into one buffer
+            chunks = _read_pcm_chunks(f, nframes * 2)
+        else:
+            # Decode other formats and WAV encodings in memory and feed them
+            # straight to Vosk
+            chunks = stack.enter_context(
+                contextlib.closing(
+                    decode_to_pcm16(audio_file, PCM_SAMPLE_RATE)
+                )
+            )
+
+        # Get a recognizer, loading the model if this process did not already
+        rec = stack.enter_context(
+            acquire_recognizer(str(model_path), PCM_SAMPLE_RATE)
+        )
+
+        return _recognize_chunks(rec, chunks)
+
+
+def _build_transcription(words: List[Dict], language: Optional[str]) -> Dict:
+    """Group recognized words into the transcription written to the outputs.
+
+    Args:
+        words: Recognized words with their start and end times.
+        language: Language code (ISO 639-1), or None for English.
+
+    Returns:
+        Dict: Transcription with its text, segments and language.
+    """
+    # Group words into sentences/segments based on natural pauses
+    segments = group_words_into_segments(words)
+    full_text = " ".join(segment["text"] for segment in segments)
+
+    return {
+        "text": full_text.strip(),
+        "segments": segments,
+        "language": language or "en"
+    }
+
+
+def _write_json_output(json_file: Path, transcription: Dict) -> None:
+    """Write a transcription as indented JSON.
+
+    Args:
+        json_file: Path of the JSON file.
+        transcription: Transcription to write.
+    """
+    json_file.write_bytes(
+        orjson.dumps(transcription, option=orjson.OPT_INDENT_2)
+    )
+
+
+def _write_vtt_output(vtt_file: Path, segments: List[Dict]) -> None:
+    """Write transcription segments as WebVTT subtitles.
+
+    Args:
+        vtt_file: Path of the VTT file.
+        segments: Transcription segments.
+    """
+    vtt_content = "".join(
+        f"{segment['id'] + 1}\n"
+        f"{format_vtt_timestamp(segment['start'])} --> "
+        f"{format_vtt_timestamp(segment['end'])}\n"
+        f"{segment['text']}\n\n"
+        for segment in segments
+    )
+
+    vtt_file.write_text("WEBVTT\n\n" + vtt_content)
+
+
+def _output_files(
+    audio_file: str,
+    output_dir: str,
+    output_formats: List[str],
+    create_output_dir: bool = True,
+) -> Tuple[Path, Optional[Path]]:
+    """Get the paths of the output files of a transcription.
+
+    Args:
+        audio_file: Path to audio file.
+        output_dir: Directory to save transcription results.
+        output_formats: Requested output formats.
+        create_output_dir: Create ``output_dir`` if missing. Callers passing
+            a directory they just created skip it, so one-off directories
+            never take a slot in the ``ensure_dir`` cache.
+
+    Returns:
+        Tuple[Path, Optional[Path]]: JSON file, which is always written, and
+        VTT file if requested.
+    """
+    if create_output_dir:
+        output_path = ensure_dir(str(output_dir))
+    else:
+        output_path = Path(output_dir)
+
+    # Name the output files after the input file
+    base_name = Path(audio_file).stem
+    vtt_file = (
+        output_path / f"{base_name}.vtt" if "vtt" in output_formats else None
+    )
+    return output_path / f"{base_name}.json", vtt_file
+
+
+def _transcription_result(
+    audio_file: str,
+    model_path: Path,
+    transcription: Dict,
+    json_file: Path,
+    vtt_file: Optional[Path],
+    output_formats: List[str],
+) -> Dict[str, Union[str, Dict]]:
+    """Build the result returned by a transcription.
+
+    Args:
+        audio_file: Path to audio file.
+        model_path: Path to the Vosk model directory.
+        transcription: Transcription written to the outputs.
+        json_file: Path of the JSON output.
+        vtt_file: Path of the VTT output, if written.
+        output_formats: Requested output formats.
+
+    Returns:
+        Dict: Transcription results with paths to output files.
+    """
+    model_name = Path(model_path).name
+
+    # Return paths to output files
+    outputs = {}
+    if "json" in output_formats:
+        outputs["json"] = str(json_file)
+    if vtt_file:
+        outputs["vtt"] = str(vtt_file)
+    outputs["transcription"] = transcription
+
+    return {
+        "success": True,
+        "audio_file": audio_file,
+        "outputs": outputs,
+        "model": model_name,
+        "command_output": (
+            "Vosk transcription completed successfully with model: "
+            f"{model_name}"
+        ),
+    }
 
 
 def transcribe_audio(
@@ -91,7 +841,9 @@ def transcribe_audio(
     output_dir: str = "data/transcriptions",
     model_size: str = "small",  # Vosk model size (small, medium, large)
     language: Optional[str] = None,
-    output_formats: Optional[List[str]] = None
+    output_formats: Optional[List[str]] = None,
+    num_workers: int = RECOGNIZER_THREADS,
+    create_output_dir: bool = True,
 ) -> Dict[str, Union[str, Dict]]:
     """Transcribe audio using Vosk ASR.
 
@@ -101,6 +853,9 @@ def transcribe_audio(
         model_size: Vosk model size (small, medium, large).
         language: Language code (ISO 639-1) to force. None for auto-detection (defaults to English).
         output_formats: List of output formats. Defaults to ["json", "vtt"].
+        num_workers: Number of threads recognizing a long WAV file.
+        create_output_dir: Create ``output_dir`` if missing. False when the
+            caller already created it.
 
     Returns:
         Dict: Transcription results with paths to output files.
@@ -108,205 +863,113 @@ def transcribe_audio(
     Raises:
         TranscriptionError: If transcription fails.
     """
-    # Ensure output directory exists
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
-
     # Set default output formats if not provided
     if output_formats is None:
         output_formats = ["json", "vtt"]
 
-    # Generate a unique name for the output files based on input filename
-    base_name = Path(audio_file).stem
-    output_prefix = output_path / base_name
-    
-    # Initialize output files dictionary
-    outputs = {}
+    json_file, vtt_file = _output_files(
+        audio_file, output_dir, output_formats, create_output_dir
+    )
     
     try:
-            # Convert audio to format suitable for Vosk if needed
-            wav_file = audio_file
-            if not audio_file.lower().endswith('.wav'):
-                wav_file = convert_audio_format(audio_file, "wav")
-                
-            # Get appropriate model path, downloading if necessary
-            try:
-                model_path = get_vosk_model(model_size, language)
-                logger.info(f"Using Vosk model at {model_path}")
-            except Exception as e:
-                raise TranscriptionError(f"Could not obtain Vosk model: {str(e)}")
-                
-            # Load the model
-            SetLogLevel(0)  # Reduce verbosity
-            model = Model(str(model_path))
-            
-            # Process the audio file
-            segments = []
-            full_text = ""
-            segment_id = 0
-            sample_rate = 0
-            
-            with wave.open(wav_file, "rb") as wf:
-                # Check audio format - must be 16-bit PCM
-                if wf.getnchannels() != 1 or wf.getsampwidth() != 2 or wf.getcomptype() != "NONE":
-                    raise TranscriptionError("Audio file must be WAV format mono PCM.")
-                
-                # Get sample rate for accurate timings
-                sample_rate = wf.getframerate()
-                    
-                # Create recognizer
-                rec = KaldiRecognizer(model, sample_rate)
-                rec.SetWords(True)  # Get word timestamps
-                
-                # Get file duration for proper timings
-                duration = wf.getnframes() / float(sample_rate)
-                logger.info(f"Audio duration: {duration:.2f} seconds")
-                
-                # Process audio chunks
-                chunk_size = 8000  # Read 8000 frames at a time for better sentence boundaries
-                all_words = []
-                
-                while True:
-                    data = wf.readframes(chunk_size)
-                    if len(data) == 0:
-                        break
-                        
-                    if rec.AcceptWaveform(data):
-                        # Process complete utterance
-                        result = json.loads(rec.Result())
-                        if "result" in result and result["result"]:
-                            # Add words with precise timestamps
-                            all_words.extend(result["result"])
-                            # We'll group them into segments later
-                
-                # Get final result
-                final_result = json.loads(rec.FinalResult())
-                if "result" in final_result and final_result["result"]:
-                    all_words.extend(final_result["result"])
-                
-                # Group words into sentences/segments based on natural pauses
-                # A new segment starts when there's a significant pause (>0.3s)
-                if all_words:
-                    current_segment = {
-                        "id": segment_id,
-                        "words": [],
-                        "text": ""
-                    }
-                    
-                    prev_end = all_words[0]["start"]
-                    
-                    for word in all_words:
-                        # Check if there's a significant pause
-                        if word["start"] - prev_end > 0.3 and current_segment["words"]:
-                            # Finalize current segment
-                            words_text = " ".join(w["word"] for w in current_segment["words"])
-                            start_time = current_segment["words"][0]["start"]
-                            end_time = current_segment["words"][-1]["end"]
-                            
-                            segments.append({
-                                "id": segment_id,
-                                "start": round(start_time, 3),
-                                "end": round(end_time, 3),
-                                "text": words_text
-                            })
-                            
-                            full_text += words_text + " "
-                            segment_id += 1
-                            
-                            # Start new segment
-                            current_segment = {
-                                "id": segment_id,
-                                "words": [word],
-                                "text": ""
-                            }
-                        else:
-                            # Add to current segment
-                            current_segment["words"].append(word)
-                        
-                        prev_end = word["end"]
-                    
-                    # Don't forget the last segment
-                    if current_segment["words"]:
-                        words_text = " ".join(w["word"] for w in current_segment["words"])
-                        start_time = current_segment["words"][0]["start"]
-                        end_time = current_segment["words"][-1]["end"]
-                        
-                        segments.append({
-                            "id": segment_id,
-                            "start": round(start_time, 3),
-                            "end": round(end_time, 3),
-                            "text": words_text
-                        })
-                        
-                        full_text += words_text
-            
-            # Create transcription result
-            transcription = {
-                "text": full_text.strip(),
-                "segments": segments,
-                "language": language or "en"
-            }
+        model_path = _get_model_path(model_size, language)
+        transcription = _build_transcription(
+            recognize_words(audio_file, model_path, num_workers), language
+        )
+
+        _write_json_output(json_file, transcription)
+        if vtt_file:
+            _write_vtt_output(vtt_file, transcription["segments"])
             
-            # Write JSON output file
-            json_file = output_path / f"{base_name}.json"
-            with open(json_file, "w") as f:
-                json.dump(transcription, f, indent=2)
+        return _transcription_result(
+            audio_file,
+            model_path,
+            transcription,
+            json_file,
+            vtt_file,
+            output_formats,
+        )
             
-            # Write VTT output file if requested
-            vtt_file = None
-            if "vtt" in output_formats:
-                vtt_file = output_path / f"{base_name}.vtt"
-                vtt_content = ["WEBVTT", ""]
-                
-                for segment in segments:
-                    # Format timestamps for VTT (HH:MM:SS.mmm)
-                    start_time = str(datetime.timedelta(seconds=segment["start"]))
-                    if "." not in start_time:
-                        start_time += ".000"
-                    else:
-                        start_time = start_time[:-3] if len(start_time.split(".")[-1]) > 3 else start_time
-                        
-                    end_time = str(datetime.timedelta(seconds=segment["end"]))
-                    if "." not in end_time:
-                        end_time += ".000"
-                    else:
-                        end_time = end_time[:-3] if len(end_time.split(".")[-1]) > 3 else end_time
-                    
-                    # Ensure HH:MM:SS format (VTT requires hours)
-                    if start_time.count(":") == 1:
-                        start_time = f"00:{start_time}"
-                    if end_time.count(":") == 1:
-                        end_time = f"00:{end_time}"
-                        
-                    vtt_content.append(f"{segment['id'] + 1}")
-                    vtt_content.append(f"{start_time} --> {end_time}")
-                    vtt_content.append(segment["text"])
-                    vtt_content.append("")
+    except Exception as e:
+        raise TranscriptionError(f"Vosk transcription failed: {str(e)}")
+
+
+async def transcribe_audio_async(
+    audio_file: str,
+    output_dir: str = "data/transcriptions",
+    model_size: str = "small",
+    language: Optional[str] = None,
+    output_formats: Optional[List[str]] = None,
+    num_workers: int = RECOGNIZER_THREADS,
+    create_output_dir: bool = True,
+) -> Dict[str, Union[str, Dict]]:
+    """Transcribe audio using Vosk ASR without blocking the event loop.
+
+    The model download and recognition run in worker threads, and the JSON
+    and VTT outputs are written concurrently. Concurrent calls each borrow
+    their own recognizer, so several files can be recognized in parallel.
+
+    Args:
+        audio_file: Path to audio file.
+        output_dir: Directory to save transcription results.
+        model_size: Vosk model size (small, medium, large).
+        language: Language code (ISO 639-1) to force. None for auto-detection
+            (defaults to English).
+        output_formats: List of output formats. Defaults to ["json", "vtt"].
+        num_workers: Number of threads recognizing a long WAV file.
+        create_output_dir: Create ``output_dir`` if missing. False when the
+            caller already created it.
+
+    Returns:
+        Dict: Transcription results with paths to output files.
+
+    Raises:
+        TranscriptionError: If transcription fails.
+    """
+    if output_formats is None:
+        output_formats = ["json", "vtt"]
+
+    json_file, vtt_file = _output_files(
+        audio_file, output_dir, output_formats, create_output_dir
+    )
+
+    try:
+        model_path = await anyio.to_thread.run_sync(
+            _get_model_path, model_size, language
+        )
+        words = await anyio.to_thread.run_sync(
+            recognize_words, audio_file, model_path, num_workers
+        )
+        transcription = _build_transcription(words, language)
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(
+                anyio.to_thread.run_sync,
+                _write_json_output,
+                json_file,
+                transcription,
+            )
+            if vtt_file:
+                tg.start_soon(
+                    anyio.to_thread.run_sync,
+                    _write_vtt_output,
+                    vtt_file,
+                    transcription["segments"],
+                )
                 
-                with open(vtt_file, "w") as f:
-                    f.write("\n".join(vtt_content))
-            
-            # Return paths to output files
-            outputs = {}
-            if "json" in output_formats:
-                outputs["json"] = str(json_file)
-            if vtt_file and "vtt" in output_formats:
-                outputs["vtt"] = str(vtt_file)
-            outputs["transcription"] = transcription
-                    
-            return {
-                "success": True,
-                "audio_file": audio_file,
-                "outputs": outputs,
-                "model": model_name,
-                "command_output": f"Vosk transcription completed successfully with model: {model_name}",
-            }
+        return _transcription_result(
+            audio_file,
+            model_path,
+            transcription,
+            json_file,
+            vtt_file,
+            output_formats,
+        )
             
     except Exception as e:
         raise TranscriptionError(f"Vosk transcription failed: {str(e)}")
 
 
-
 def get_vosk_model(model_size: str = "small", language: Optional[str] = None) -> Path:
     """Get the path to a Vosk model, downloading it if it doesn't exist.
     
@@ -325,8 +988,7 @@ def get_vosk_model(model_size: str = "small", language: Optional[str] = None) ->
     model_size = model_size.lower()
     
     # Define model name and directory structure
-    models_dir = Path(os.environ.get("VOSK_MODEL_PATH", "./models"))
-    models_dir.mkdir(exist_ok=True, parents=True)
+    models_dir = ensure_dir(os.environ.get("VOSK_MODEL_PATH", "./models"))
     
     # Define model mapping for different languages and sizes
     model_map = {
@@ -377,8 +1039,11 @@ def get_vosk_model(model_size: str = "small", language: Optional[str] = None) ->
     model_path = models_dir / model_name
     
     # Check if model exists
+    if model_path in _installed_models:
+        return model_path
     if model_path.exists():
         logger.info(f"Vosk model already exists at {model_path}")
+        _installed_models.add(model_path)
         return model_path
         
     # Download model if it doesn't exist
@@ -386,9 +1051,181 @@ def get_vosk_model(model_size: str = "small", language: Optional[str] = None) ->
     return download_vosk_model(model_url, model_name, models_dir)
 
 
+class _RangesNotSupported(Exception):
+    """Raised when a server ignores the Range header of a request."""
+
+    pass
+
+
+def _download_range(url: str, fd: int, start: int, end: int) -> None:
+    """Download a byte range of a file to the same offset of an open file.
+
+    Args:
+        url: URL of the file.
+        fd: Descriptor of the file to write to.
+        start: First byte of the range.
+        end: Last byte of the range, inclusive.
+
+    Raises:
+        _RangesNotSupported: If the server sends the whole file instead.
+        TranscriptionError: If the range is still incomplete after all retries.
+    """
+    offset = start
+    for attempt in range(DOWNLOAD_RETRIES):
+        try:
+            with requests.get(
+                url, headers={"Range": f"bytes={offset}-{end}"}, stream=True
+            ) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise _RangesNotSupported(url)
+                for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                    view = memoryview(chunk)
+                    while view:
+                        written = os.pwrite(fd, view, offset)
+                        view = view[written:]
+                        offset += written
+        except (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.ChunkedEncodingError,
+        ) as e:
+            logger.warning(
+                f"Download of bytes {offset}-{end} interrupted: {str(e)}"
+            )
+
+        if offset > end:
+            return
+
+    raise TranscriptionError(
+        f"Download of bytes {start}-{end} incomplete after "
+        f"{DOWNLOAD_RETRIES} attempts"
+    )
+
+
+def _download_ranges(url: str, size: int) -> Optional[BinaryIO]:
+    """Download a file over several connections, one byte range each.
+
+    Args:
+        url: URL of the file.
+        size: Size of the file in bytes.
+
+    Returns:
+        Optional[BinaryIO]: Anonymous temporary file with the download, or
+        None if the server does not support byte ranges.
+    """
+    archive = tempfile.TemporaryFile()
+    try:
+        os.ftruncate(archive.fileno(), size)
+        part_size = -(-size // DOWNLOAD_CONNECTIONS)
+        with concurrent.futures.ThreadPoolExecutor(
+            DOWNLOAD_CONNECTIONS
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _download_range,
+                    url,
+                    archive.fileno(),
+                    start,
+                    min(start + part_size, size) - 1,
+                )
+                for start in range(0, size, part_size)
+            ]
+            for future in futures:
+                future.result()
+    except _RangesNotSupported:
+        archive.close()
+        return None
+    except BaseException:
+        archive.close()
+        raise
+    return archive
+
+
+def _download_stream(url: str, size: int) -> BinaryIO:
+    """Download a file over a single connection.
+
+    Args:
+        url: URL of the file.
+        size: Expected size of the file in bytes, 0 if unknown.
+
+    Returns:
+        BinaryIO: In-memory buffer or anonymous temporary file with the
+        download.
+    """
+    # Small archives stay in memory, larger or unknown ones go to an anonymous
+    # temp file. Both are real seekable files, which zipfile needs (a
+    # SpooledTemporaryFile is not before Python 3.11).
+    if 0 < size <= MODEL_SPOOL_SIZE:
+        archive: BinaryIO = io.BytesIO()
+    else:
+        archive = tempfile.TemporaryFile()
+    try:
+        with requests.get(url, stream=True) as response:
+            response.raise_for_status()
+            # Reading the raw stream in large blocks skips requests'
+            # small-chunk iterator
+            response.raw.decode_content = True
+            shutil.copyfileobj(response.raw, archive, DOWNLOAD_CHUNK_SIZE)
+    except BaseException:
+        archive.close()
+        raise
+    return archive
+
+
+def _extract_member(
+    zf: zipfile.ZipFile, member: zipfile.ZipInfo, path: Path
+) -> None:
+    """Extract one archive member, tolerating siblings creating its parents.
+
+    Args:
+        zf: Archive shared by the extracting threads.
+        member: Member to extract.
+        path: Directory to extract into.
+    """
+    try:
+        zf.extract(member, path)
+    except FileExistsError:
+        # Another thread created a parent directory between the check and mkdir
+        zf.extract(member, path)
+
+
+def _extract_archive(archive: BinaryIO, path: Path) -> None:
+    """Extract a zip archive, inflating its members in parallel.
+
+    Threads read the members through the same archive, ZipFile serialises
+    the reads and the inflating runs concurrently.
+
+    Args:
+        archive: Seekable zip archive.
+        path: Directory to extract into.
+    """
+    with zipfile.ZipFile(archive) as zf:
+        members = zf.infolist()
+        if EXTRACT_THREADS < 2 or len(members) < 2:
+            zf.extractall(path)
+            return
+
+        # Largest members first, so a big one does not start last
+        members.sort(key=lambda member: member.compress_size, reverse=True)
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=EXTRACT_THREADS
+        ) as executor:
+            futures = [
+                executor.submit(_extract_member, zf, member, path)
+                for member in members
+            ]
+            for future in futures:
+                future.result()
+
+
 def download_vosk_model(url: str, model_name: str, models_dir: Path) -> Path:
     """Download and extract a Vosk model.
     
+    The archive is extracted straight from the download buffer, it is never
+    saved under a name of its own. The model directory is moved into place
+    once fully extracted. Archives too large to spool in memory are
+    downloaded over several connections when the server supports byte ranges.
+
     Args:
         url: URL to download the model from.
         model_name: Name of the model.
@@ -401,33 +1238,63 @@ def download_vosk_model(url: str, model_name: str, models_dir: Path) -> Path:
         TranscriptionError: If download or extraction fails.
     """
     try:
-        # Create temporary directory for download
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            zip_path = temp_path / f"{model_name}.zip"
-            
-            # Download model
-            logger.info(f"Downloading model {model_name} from {url}...")
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
+        logger.info(f"Downloading model {model_name} from {url}...")
+        head = requests.head(url, allow_redirects=True)
+        size = int(head.headers.get("Content-Length", 0))
+
+        archive = None
+        if (
+            head.ok
+            and hasattr(os, "pwrite")
+            and size > MODEL_SPOOL_SIZE
+            and head.headers.get("Accept-Ranges") == "bytes"
+            and "Content-Encoding" not in head.headers
+        ):
+            archive = _download_ranges(url, size)
+        if archive is None:
+            archive = _download_stream(url, size if head.ok else 0)
+
+        model_path = models_dir / model_name
+        with archive:
+            archive.seek(0)
             
-            # Save to temporary file
-            with open(zip_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-                    
-            # Extract model
+            # Extract model into a staging directory. The model only gets its
+            # final name once complete, so an interrupted extraction is never
+            # mistaken for an installed model by get_vosk_model.
             logger.info(f"Extracting model to {models_dir}...")
-            shutil.unpack_archive(zip_path, models_dir)
+            models_dir.mkdir(parents=True, exist_ok=True)
+            staging_dir = Path(
+                tempfile.mkdtemp(prefix=".extract-", dir=models_dir)
+            )
+            try:
+                _extract_archive(archive, staging_dir)
+
+                # Check if extraction was successful
+                if not (staging_dir / model_name).exists():
+                    raise TranscriptionError(
+                        "Model extraction failed. Path not found: "
+                        f"{model_path}"
+                    )
+
+                try:
+                    os.rename(staging_dir / model_name, model_path)
+                except OSError:
+                    if not model_path.exists():
+                        raise
+                    # Another process installed the same model first
+            finally:
+                shutil.rmtree(staging_dir, ignore_errors=True)
             
-            # Check if extraction was successful
-            model_path = models_dir / model_name
-            if not model_path.exists():
-                raise TranscriptionError(f"Model extraction failed. Path not found: {model_path}")
-                
-            return model_path
-    except (requests.exceptions.RequestException, shutil.Error, OSError) as e:
-        raise TranscriptionError(f"Failed to download or extract model: {str(e)}")
+        return model_path
+    except (
+        requests.exceptions.RequestException,
+        zipfile.BadZipFile,
+        OSError,
+        ValueError,
+    ) as e:
+        raise TranscriptionError(
+            f"Failed to download or extract model: {str(e)}"
+        )
 
 
 def extract_transcript_from_json(json_file: str) -> str:
@@ -440,8 +1307,8 @@ def extract_transcript_from_json(json_file: str) -> str:
         str: Plain text transcript.
     """
     try:
-        with open(json_file, 'r') as f:
-            data = json.load(f)
+        with open(json_file, 'rb') as f:
+            data = orjson.loads(f.read())
         
         if "text" in data:
             # Main text field with full transcript
@@ -449,12 +1316,13 @@ def extract_transcript_from_json(json_file: str) -> str:
         
         # For older format or Vosk output, concatenate segments
         if "segments" in data:
-            transcript = ""
-            for segment in data["segments"]:
-                if "text" in segment:
-                    transcript += segment["text"] + " "
+            transcript = " ".join(
+                segment["text"]
+                for segment in data["segments"]
+                if "text" in segment
+            )
             return transcript.strip()
             
         raise TranscriptionError("Unexpected JSON format: no text or segments found")
-    except (json.JSONDecodeError, FileNotFoundError) as e:
+    except (orjson.JSONDecodeError, FileNotFoundError) as e:
         raise TranscriptionError(f"Failed to extract transcript: {str(e)}")
@@ -1,26 +1,100 @@
 """Worker script to process jobs from Redis queue."""
 import argparse
+import logging
+import os
 import sys
+import time
 
-from rq import Connection, Worker
+from rq import Worker
+from rq.worker_pool import WorkerPool
 
 from backend.core.utils import get_redis_connection
+from backend.core.worker import tasks
 
+logger = logging.getLogger(__name__)
 
-def run_worker(queue_names=None):
+# Number of worker processes: one per physical core, assuming two hardware
+# threads per core. Vosk decoding is AVX-bound and gains nothing from SMT.
+DEFAULT_NUM_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+
+
+class ModelPreloadingWorker(Worker):
+    """RQ worker that loads the Vosk model before it starts taking jobs.
+
+    Every job runs in a work horse forked from the worker, so the model and
+    recognizer created here are inherited by all of them instead of being
+    created once per job.
+    """
+
+    def work(self, *args, **kwargs):
+        # Imported here so Vosk and its BLAS read the thread settings of
+        # run_worker
+        from backend.core.worker import transcription
+
+        started = time.monotonic()
+        try:
+            model_path = str(transcription.get_vosk_model(tasks.MODEL_SIZE))
+            with transcription.acquire_recognizer(
+                model_path, transcription.PCM_SAMPLE_RATE
+            ):
+                pass  # Leaves a ready recognizer in the pool
+            logger.info(
+                f"Preloaded Vosk model {model_path} in "
+                f"{time.monotonic() - started:.1f}s"
+            )
+        except Exception as e:
+            # Jobs load the model themselves and report the error
+            logger.warning(f"Could not preload Vosk model: {str(e)}")
+        return super().work(*args, **kwargs)
+
+
+def run_worker(queue_names=None, num_workers=None, burst=None):
     """Run worker process to handle jobs from Redis queue.
 
+    With more than one worker, an RQ ``WorkerPool`` supervises that many
+    worker processes so several transcription jobs run concurrently. Each
+    worker process loads the Vosk model once, see ``ModelPreloadingWorker``.
+    Unless already set, ``WORKER_CPUS`` shares the cores between them, and
+    sizes both ``OMP_NUM_THREADS`` and the recognizer threads of each process.
+
     Args:
         queue_names: Names of queues to listen to. Defaults to ["transcription"].
+        num_workers: Number of worker processes. Defaults to the RQ_WORKERS
+            environment variable or one per physical core.
+        burst: Exit once the queues are empty, e.g. for batch runs. Defaults
+            to True if the RQ_BURST environment variable is "1".
     """
     if queue_names is None:
         queue_names = ["transcription"]
 
+    if num_workers is None:
+        num_workers = int(os.environ.get("RQ_WORKERS", DEFAULT_NUM_WORKERS))
+
+    if burst is None:
+        burst = os.environ.get("RQ_BURST") == "1"
+
+    # Split the cores between the worker processes instead of every process
+    # starting one BLAS/OpenMP thread and one recognizer thread per core
+    os.environ.setdefault(
+        "WORKER_CPUS", str(max(1, (os.cpu_count() or 1) // num_workers))
+    )
+    os.environ.setdefault("OMP_NUM_THREADS", os.environ["WORKER_CPUS"])
+
     redis_connection = get_redis_connection()
 
-    with Connection(redis_connection):
-        worker = Worker(queue_names)
-        worker.work(with_scheduler=True)
+    if num_workers > 1:
+        pool = WorkerPool(
+            queue_names,
+            connection=redis_connection,
+            num_workers=num_workers,
+            worker_class=ModelPreloadingWorker,
+        )
+        pool.start(burst=burst)
+        return
+
+    # The worker and its scheduler take their connections from the shared pool
+    worker = ModelPreloadingWorker(queue_names, connection=redis_connection)
+    worker.work(with_scheduler=True, burst=burst)
 
 
 if __name__ == "__main__":
@@ -31,8 +105,25 @@ if __name__ == "__main__":
         default="transcription",
         help="Queue names to listen to (comma separated)",
     )
+    parser.add_argument(
+        "--workers",
+        "--num-workers",
+        dest="workers",
+        type=int,
+        default=None,
+        help=(
+            "Number of worker processes "
+            "(default: RQ_WORKERS or one per physical core)"
+        ),
+    )
+    parser.add_argument(
+        "--burst",
+        action="store_true",
+        default=None,
+        help="Exit once the queues are empty (default: RQ_BURST=1)",
+    )
 
     args = parser.parse_args()
     queue_names = [q.strip() for q in args.queues.split(",")]
 
-    run_worker(queue_names)
+    run_worker(queue_names, num_workers=args.workers, burst=args.burst)
@@ -1,5 +1,6 @@
 """Script to launch the full transcription pipeline (API and worker) in parallel."""
 import os
+import selectors
 import signal
 import subprocess
 import sys
@@ -15,9 +16,18 @@ DEFAULT_CONFIG = {
     "redis_port": 6379,
 }
 
+# Bytes read from a process output pipe at a time
+OUTPUT_READ_SIZE = 64 * 1024
+
+# Seconds processes get to exit after SIGTERM before they are killed
+STOP_TIMEOUT = 5
+
 # Global process registry
 processes: Dict[str, subprocess.Popen] = {}
 
+# Whether the shutdown signal handlers are installed
+_signal_handlers_installed = False
+
 
 def signal_handler(sig, frame):
     """Handle interruption signals by gracefully stopping all processes."""
@@ -27,16 +37,21 @@ def signal_handler(sig, frame):
 
 
 def stop_all_processes():
-    """Stop all registered processes gracefully."""
+    """Stop all registered processes gracefully.
+
+    All processes share a single ``STOP_TIMEOUT`` deadline, so shutdown takes
+    as long as the slowest process rather than the sum of their timeouts.
+    """
     for name, process in processes.items():
         if process.poll() is None:  # If process is still running
             print(f"Stopping {name}...")
             process.terminate()
             
     # Wait for processes to terminate gracefully
+    deadline = time.monotonic() + STOP_TIMEOUT
     for name, process in processes.items():
         try:
-            process.wait(timeout=5)
+            process.wait(timeout=max(deadline - time.monotonic(), 0))
             print(f"{name} stopped.")
         except subprocess.TimeoutExpired:
             print(f"Force killing {name}...")
@@ -44,72 +59,125 @@ def stop_all_processes():
 
 
 def start_api(host: str = DEFAULT_CONFIG["api_host"], port: int = DEFAULT_CONFIG["api_port"]):
-    """Start FastAPI server using the Poetry script."""
+    """Start FastAPI server with the current interpreter.
+
+    The module is run directly rather than through ``poetry run``, which
+    would start another interpreter and load Poetry first.
+    """
     env = os.environ.copy()
     env["API_PORT"] = str(port)
     
     print(f"Starting API server at http://{host}:{port}")
     api_process = subprocess.Popen(
-        ["poetry", "run", "api"],
+        [sys.executable, "-m", "backend.app.main"],
         env=env,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        universal_newlines=True,
+        bufsize=0,
+        # Descriptors are non-inheritable by default (PEP 446), so nothing
+        # leaks into the child, and CPython can spawn it with posix_spawn
+        close_fds=False,
     )
     processes["api"] = api_process
     return api_process
 
 
 def start_worker(queue_name: str = DEFAULT_CONFIG["queue_name"]):
-    """Start RQ worker using the Poetry script."""
+    """Start RQ worker with the current interpreter, see ``start_api``."""
     env = os.environ.copy()
     env["QUEUE_NAME"] = queue_name
     
     print(f"Starting worker for queue: {queue_name}")
     worker_process = subprocess.Popen(
-        ["poetry", "run", "worker"],
+        [
+            sys.executable,
+            "-m",
+            "backend.core.worker.worker",
+            "--queues",
+            queue_name,
+        ],
         env=env,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        universal_newlines=True,
+        bufsize=0,
+        close_fds=False,  # See start_api
     )
     processes["worker"] = worker_process
     return worker_process
 
 
+def _print_lines(name: str, pending: bytearray, final: bool = False) -> None:
+    """Print the complete lines buffered from a process and drop them.
+
+    Args:
+        name: Name of the process.
+        pending: Output read from the process but not printed yet.
+        final: Also print a trailing incomplete line, once the output is
+            closed.
+    """
+    *lines, rest = pending.split(b"\n")
+    if final and rest:
+        lines.append(rest)
+        rest = b""
+    for line in lines:
+        print(f"[{name}] {line.decode(errors='replace').strip()}")
+    pending[:] = rest
+
+
 def print_process_output():
-    """Print output from all running processes in real-time."""
-    while True:
+    """Print output from all running processes in real-time.
+
+    Output pipes are read without blocking as soon as a process writes, so a
+    talkative process never stalls on a full pipe and the loop stays idle
+    while nothing happens.
+    """
+    reported = set()
+    with selectors.DefaultSelector() as selector:
         for name, process in processes.items():
-            # Check if process is still running
-            if process.poll() is not None:
-                print(f"\n{name} exited with code {process.returncode}")
+            if process.stdout:
+                os.set_blocking(process.stdout.fileno(), False)
+                selector.register(
+                    process.stdout, selectors.EVENT_READ, (name, bytearray())
+                )
+
+        while True:
+            for key, _ in selector.select(timeout=1.0):
+                name, pending = key.data
+                try:
+                    chunk = os.read(key.fd, OUTPUT_READ_SIZE)
+                except BlockingIOError:
+                    continue
                 
-            # Print any available output
-            if hasattr(process, "stdout") and process.stdout:
-                while True:
-                    output = process.stdout.readline()
-                    if output:
-                        print(f"[{name}] {output.strip()}")
-                    else:
-                        break
-                        
-        # If all processes have exited, break the loop
-        if all(p.poll() is not None for p in processes.values()):
-            print("All processes have exited.")
-            break
+                if chunk:
+                    pending += chunk
+                    _print_lines(name, pending)
+                else:
+                    # End of output, the process (and its children) closed the
+                    # pipe
+                    selector.unregister(key.fileobj)
+                    _print_lines(name, pending, final=True)
+
+            for name, process in processes.items():
+                if name not in reported and process.poll() is not None:
+                    print(f"\n{name} exited with code {process.returncode}")
+                    reported.add(name)
             
-        # Sleep briefly to avoid high CPU usage
-        time.sleep(0.1)
+            # If all processes have exited and their output is drained, stop
+            if len(reported) == len(processes) and not selector.get_map():
+                print("All processes have exited.")
+                break
 
 
 def start_pipeline():
     """Start the full transcription pipeline with API and worker."""
     print("Starting transcription pipeline...")
     
-    # Register signal handlers for graceful shutdown
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    # Register signal handlers for graceful shutdown, once per process
+    global _signal_handlers_installed
+    if not _signal_handlers_installed:
+        signal.signal(signal.SIGINT, signal_handler)
+        signal.signal(signal.SIGTERM, signal_handler)
+        _signal_handlers_installed = True
     
     # Start API server
     api_process = start_api()
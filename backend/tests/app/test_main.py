@@ -5,7 +5,14 @@ from unittest import mock
 import pytest
 from fastapi.testclient import TestClient
 
-from backend.app.main import app, run_api
+from backend.app.main import (
+    API_HTTP,
+    API_LOOP,
+    THREADPOOL_SIZE,
+    app,
+    install_uring_loop_policy,
+    run_api,
+)
 
 
 class TestMain:
@@ -31,12 +38,76 @@ class TestMain:
         response = self.client.get("/health")
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
+        assert response.headers["content-type"] == "application/json"
+
+    def test_internal_endpoints_skip_cors(self):
+        """Test CORS headers are not added to internal endpoints."""
+        response = self.client.get(
+            "/health", headers={"Origin": "http://example.com"}
+        )
+        assert response.status_code == 200
+        assert "access-control-allow-origin" not in response.headers
+
+    def test_unsupported_upload_rejected_early(self):
+        """Test unsupported uploads are rejected with CORS headers."""
+        with mock.patch(
+            "backend.app.routes.save_uploaded_file_async"
+        ) as mock_save:
+            response = self.client.post(
+                "/api/v1/transcribe",
+                files={
+                    "file": ("test.txt", b"test file content", "text/plain")
+                },
+                headers={"Origin": "http://example.com"},
+            )
+
+        assert response.status_code == 400
+        assert "Unsupported file type" in response.json()["detail"]
+        assert response.headers["access-control-allow-origin"] == "*"
+        mock_save.assert_not_called()
+
+    def test_api_endpoints_use_cors(self):
+        """Test CORS preflight requests are answered for the public API."""
+        response = self.client.options(
+            "/api/v1/transcribe",
+            headers={
+                "Origin": "http://example.com",
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "content-type",
+            },
+        )
+        assert response.status_code == 200
+        assert "access-control-allow-origin" in response.headers
+        assert "POST" in response.headers["access-control-allow-methods"]
+
+    @mock.patch("backend.app.main.close_redis_pools")
+    @mock.patch("backend.app.main.get_redis_connection")
+    def test_lifespan_manages_redis_pool(
+        self, mock_get_redis, mock_close_pools
+    ):
+        """Test the Redis pool is created on startup and closed on shutdown."""
+        with TestClient(app):
+            mock_get_redis.assert_called_once()
+            mock_close_pools.assert_not_called()
+
+        mock_close_pools.assert_called_once()
+
+    def test_lifespan_sets_threadpool_size(self):
+        """Test the threadpool for blocking work is enlarged on startup."""
+        import anyio.to_thread
+
+        get_limiter = anyio.to_thread.current_default_thread_limiter
+        with TestClient(app) as client:
+            limit = client.portal.call(lambda: get_limiter().total_tokens)
+
+        assert limit == THREADPOOL_SIZE
 
     @mock.patch("backend.app.main.uvicorn.run")
     def test_run_api_default(self, mock_run):
         """Test run_api with default parameters."""
         # Setup environment
-        with mock.patch.dict(os.environ, {}, clear=True):
+        with mock.patch.dict(os.environ, {}, clear=True), \
+             mock.patch("backend.app.main.os.cpu_count", return_value=8):
             # Call function
             run_api()
             
@@ -45,28 +116,37 @@ class TestMain:
                 "backend.app.main:app", 
                 host="0.0.0.0", 
                 port=8000, 
-                reload=True
+                reload=False,
+                workers=8,
+                loop=API_LOOP,
+                http=API_HTTP,
             )
 
     @mock.patch("backend.app.main.uvicorn.run")
     def test_run_api_custom_params(self, mock_run):
         """Test run_api with custom parameters."""
         # Call function with custom parameters
-        run_api(host="127.0.0.1", port=9000)
+        with mock.patch.dict(os.environ, {"ENV": "dev"}, clear=True):
+            run_api(host="127.0.0.1", port=9000)
         
         # Verify
         mock_run.assert_called_once_with(
             "backend.app.main:app", 
             host="127.0.0.1", 
             port=9000, 
-            reload=True
+            reload=True,
+            workers=1,
+            loop=API_LOOP,
+            http=API_HTTP,
         )
 
     @mock.patch("backend.app.main.uvicorn.run")
     def test_run_api_env_override(self, mock_run):
         """Test run_api with environment variable overrides."""
         # Setup environment with port override
-        with mock.patch.dict(os.environ, {"API_PORT": "5000"}, clear=True):
+        with mock.patch.dict(
+            os.environ, {"API_PORT": "5000", "ENV": "dev"}, clear=True
+        ):
             # Call function with default parameters
             run_api()
             
@@ -75,5 +155,58 @@ class TestMain:
                 "backend.app.main:app", 
                 host="0.0.0.0", 
                 port=5000,  # Should use env var
-                reload=True
+                reload=True,
+                workers=1,
+                loop=API_LOOP,
+                http=API_HTTP,
             )
+
+    @mock.patch("backend.app.main.uvicorn.run")
+    def test_run_api_multiple_workers(self, mock_run):
+        """Test run_api reads API_WORKERS outside development."""
+        with mock.patch.dict(os.environ, {"API_WORKERS": "4"}, clear=True):
+            run_api()
+
+            _, kwargs = mock_run.call_args
+            assert kwargs["workers"] == 4
+            assert kwargs["reload"] is False
+
+    @mock.patch("backend.app.main.uvicorn.run")
+    def test_run_api_dev_ignores_workers(self, mock_run):
+        """Test development mode always runs a single reloading process."""
+        with mock.patch.dict(
+            os.environ, {"API_WORKERS": "4", "ENV": "dev"}, clear=True
+        ):
+            run_api()
+
+            _, kwargs = mock_run.call_args
+            assert kwargs["workers"] == 1
+            assert kwargs["reload"] is True
+
+    @mock.patch("backend.app.main.asyncio.set_event_loop_policy")
+    def test_install_uring_loop_policy(self, mock_set_policy):
+        """Test the io_uring policy is installed on a supported kernel."""
+        mock_uringcore = mock.MagicMock()
+        with mock.patch.dict(
+            "sys.modules", {"uringcore": mock_uringcore}
+        ), mock.patch("backend.app.main.sys.platform", "linux"), mock.patch(
+            "backend.app.main.platform.release", return_value="6.1.0-13-amd64"
+        ):
+            assert install_uring_loop_policy() is True
+
+        mock_set_policy.assert_called_once_with(
+            mock_uringcore.EventLoopPolicy.return_value
+        )
+
+    @mock.patch("backend.app.main.asyncio.set_event_loop_policy")
+    def test_install_uring_loop_policy_old_kernel(self, mock_set_policy):
+        """Test the io_uring policy is skipped on kernels older than 5.11."""
+        with mock.patch.dict(
+            "sys.modules", {"uringcore": mock.MagicMock()}
+        ), mock.patch("backend.app.main.sys.platform", "linux"), mock.patch(
+            "backend.app.main.platform.release",
+            return_value="5.4.0-150-generic",
+        ):
+            assert install_uring_loop_policy() is False
+
+        mock_set_policy.assert_not_called()
@@ -0,0 +1,117 @@
+"""Tests for middleware.py module."""
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+
+from backend.app.middleware import (
+    PathPrefixCORSMiddleware,
+    UploadExtensionMiddleware,
+)
+
+
+class TestPathPrefixCORSMiddleware:
+    """Test class for PathPrefixCORSMiddleware."""
+
+    def setup_method(self):
+        """Set up test app for each test method."""
+        app = FastAPI()
+
+        @app.get("/api/items")
+        async def items():
+            return []
+
+        @app.get("/health")
+        async def health():
+            return {"status": "ok"}
+
+        app.add_middleware(
+            PathPrefixCORSMiddleware, path_prefix="/api", allow_origins=["*"]
+        )
+        self.client = TestClient(app)
+
+    def test_prefixed_path_gets_cors_headers(self):
+        """Test requests under the prefix are handled by CORSMiddleware."""
+        response = self.client.get(
+            "/api/items", headers={"Origin": "http://example.com"}
+        )
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "*"
+
+    def test_other_path_skips_cors(self):
+        """Test requests outside the prefix bypass CORSMiddleware."""
+        response = self.client.get(
+            "/health", headers={"Origin": "http://example.com"}
+        )
+        assert response.status_code == 200
+        assert "access-control-allow-origin" not in response.headers
+
+
+class TestUploadExtensionMiddleware:
+    """Test class for UploadExtensionMiddleware."""
+
+    def setup_method(self):
+        """Set up test app for each test method."""
+        app = FastAPI()
+        self.received = []
+
+        @app.post("/upload")
+        async def upload(file: UploadFile = File(...)):
+            content = await file.read()
+            self.received.append((file.filename, content))
+            return {"size": len(content)}
+
+        @app.post("/other")
+        async def other(file: UploadFile = File(...)):
+            return {"filename": file.filename}
+
+        app.add_middleware(
+            UploadExtensionMiddleware,
+            path="/upload",
+            allowed_extensions=frozenset({".mp3", ".wav"}),
+            detail="Unsupported file type",
+            peek_size=1024,
+        )
+        self.client = TestClient(app)
+
+    def test_rejects_unsupported_extension(self):
+        """Test unsupported extensions are rejected before the route runs."""
+        response = self.client.post(
+            "/upload",
+            files={
+                "file": (
+                    "virus.EXE",
+                    b"x" * 100000,
+                    "application/octet-stream",
+                )
+            },
+        )
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Unsupported file type"}
+        assert self.received == []
+
+    def test_accepts_supported_extension(self):
+        """Test accepted uploads reach the route with the body replayed."""
+        content = bytes(range(256)) * 400  # Much larger than the peeked bytes
+        response = self.client.post(
+            "/upload", files={"file": ("song.MP3", content, "audio/mpeg")}
+        )
+        assert response.status_code == 200
+        assert self.received == [("song.MP3", content)]
+
+    def test_other_paths_pass_through(self):
+        """Test requests to other paths are not inspected."""
+        response = self.client.post(
+            "/other",
+            files={"file": ("virus.exe", b"data", "application/octet-stream")},
+        )
+        assert response.status_code == 200
+        assert response.json() == {"filename": "virus.exe"}
+
+    def test_headers_beyond_peek_pass_through(self):
+        """Test file parts starting after the peeked bytes go to the route."""
+        response = self.client.post(
+            "/upload",
+            data={"note": "n" * 2048},
+            files={"file": ("song.wav", b"data", "audio/wav")},
+        )
+        assert response.status_code == 200
+        assert self.received == [("song.wav", b"data")]
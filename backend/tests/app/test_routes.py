@@ -18,16 +18,30 @@ class TestRoutes:
         app.include_router(router)
         self.client = TestClient(app)
 
-    @mock.patch("backend.app.routes.enqueue_file")
-    async def test_upload_file_success(self, mock_enqueue):
+    @mock.patch(
+        "backend.app.routes.enqueue_saved_file_background",
+        new_callable=mock.AsyncMock,
+    )
+    @mock.patch(
+        "backend.app.routes.get_cached_job_info_async",
+        new_callable=mock.AsyncMock,
+    )
+    @mock.patch(
+        "backend.app.routes.save_uploaded_file_async",
+        new_callable=mock.AsyncMock,
+    )
+    async def test_upload_file_success(
+        self, mock_save, mock_get_cached, mock_enqueue
+    ):
         """Test successful file upload."""
-        # Setup mock
-        mock_enqueue.return_value = {
-            "job_id": "job-123",
+        # Setup mocks
+        mock_save.return_value = {
             "file_id": "file-123",
             "original_filename": "test.mp3",
-            "status": "queued"
+            "path": "data/uploads/file-123.mp3",
+            "size": 23
         }
+        mock_get_cached.return_value = None
         
         # Create test file content
         file_content = b"test audio file content"
@@ -41,16 +55,61 @@ class TestRoutes:
         # Check response
         assert response.status_code == 202
         json_response = response.json()
-        assert json_response["job_id"] == "job-123"
+        assert json_response["job_id"] == "job-file-123"
         assert json_response["file_id"] == "file-123"
         assert json_response["filename"] == "test.mp3"
         assert json_response["status"] == "queued"
+        assert "transcription" not in json_response
         
-        # Verify enqueue was called
-        mock_enqueue.assert_called_once()
-        args, kwargs = mock_enqueue.call_args
-        assert args[0] == file_content  # First arg should be file content
+        # Verify the file was saved and enqueued in the background
+        mock_save.assert_called_once()
+        args, kwargs = mock_save.call_args
+        assert hasattr(args[0], "read")  # First arg should be the spooled file
         assert args[1] == "test.mp3"    # Second arg should be filename
+        mock_enqueue.assert_awaited_once_with(mock_save.return_value)
+
+    @mock.patch(
+        "backend.app.routes.enqueue_saved_file_background",
+        new_callable=mock.AsyncMock,
+    )
+    @mock.patch(
+        "backend.app.routes.get_cached_job_info_async",
+        new_callable=mock.AsyncMock,
+    )
+    @mock.patch(
+        "backend.app.routes.save_uploaded_file_async",
+        new_callable=mock.AsyncMock,
+    )
+    def test_upload_file_already_transcribed(
+        self, mock_save, mock_get_cached, mock_enqueue
+    ):
+        """Test re-uploading a transcribed file returns the cached result."""
+        transcription = {
+            "json_path": "a.json",
+            "vtt_path": "a.vtt",
+            "transcript": "Hello world",
+        }
+        mock_get_cached.return_value = {
+            "job_id": "job-file-123",
+            "file_id": "file-123",
+            "original_filename": "again.mp3",
+            "status": "transcribed",
+            "transcription": transcription
+        }
+
+        response = self.client.post(
+            "/api/v1/transcribe",
+            files={
+                "file": ("again.mp3", b"test audio file content", "audio/mp3")
+            },
+        )
+
+        assert response.status_code == 200
+        json_response = response.json()
+        assert json_response["job_id"] == "job-file-123"
+        assert json_response["status"] == "transcribed"
+        assert json_response["transcription"] == transcription
+        mock_enqueue.assert_not_called()
 
     async def test_upload_file_invalid_extension(self):
         """Test file upload with invalid extension."""
@@ -68,11 +127,14 @@ class TestRoutes:
         json_response = response.json()
         assert "Unsupported file type" in json_response["detail"]
 
-    @mock.patch("backend.app.routes.enqueue_file")
-    async def test_upload_file_server_error(self, mock_enqueue):
+    @mock.patch(
+        "backend.app.routes.save_uploaded_file_async",
+        new_callable=mock.AsyncMock,
+    )
+    async def test_upload_file_server_error(self, mock_save):
         """Test file upload with server error."""
         # Setup mock to raise exception
-        mock_enqueue.side_effect = Exception("Server error")
+        mock_save.side_effect = Exception("Server error")
         
         # Create test file content
         file_content = b"test audio file content"
@@ -0,0 +1,52 @@
+"""Tests for schemas.py module."""
+import pytest
+from pydantic import ValidationError
+
+from backend.app.schemas import TranscribeResponse, TranscriptionResult
+
+
+class TestSchemas:
+    """Test class for schemas.py module."""
+
+    def test_transcribe_response(self):
+        """Test TranscribeResponse validates nested transcription results."""
+        response = TranscribeResponse(
+            message="File already transcribed",
+            job_id="job-123",
+            file_id="file-123",
+            filename="test.mp3",
+            status="transcribed",
+            transcription={
+                "json_path": "a.json",
+                "vtt_path": "a.vtt",
+                "transcript": "Hello world",
+            },
+        )
+
+        assert isinstance(response.transcription, TranscriptionResult)
+        dumped = response.model_dump(exclude_none=True)
+        assert dumped["transcription"]["transcript"] == "Hello world"
+
+    def test_transcribe_response_rejects_extra_fields(self):
+        """Test unknown fields are rejected instead of silently dropped."""
+        with pytest.raises(ValidationError):
+            TranscribeResponse(
+                message="queued",
+                job_id="job-123",
+                file_id="file-123",
+                filename="test.mp3",
+                status="queued",
+                path="data/uploads/file-123.mp3",
+            )
+
+    def test_transcribe_response_frozen(self):
+        """Test responses cannot be modified after creation."""
+        response = TranscribeResponse(
+            message="queued",
+            job_id="job-123",
+            file_id="file-123",
+            filename="test.mp3",
+            status="queued",
+        )
+        with pytest.raises(ValidationError):
+            response.status = "done"
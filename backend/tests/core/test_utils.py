@@ -1,18 +1,39 @@
 """Tests for utils.py module."""
+import asyncio
 import os
 from unittest import mock
 
 import pytest
 import redis
 
-from backend.core.utils import get_redis_connection
+import backend.core.utils
+from backend.core.utils import (
+    close_async_redis_pools,
+    close_redis_pools,
+    ensure_dir,
+    get_async_redis_connection,
+    get_redis_connection,
+)
 
 
 class TestUtils:
     """Test class for utils.py module."""
 
+    def setup_method(self):
+        """Reset shared pools and the cached environment before each test."""
+        backend.core.utils._redis_pools.clear()
+        backend.core.utils._async_redis_pools.clear()
+        backend.core.utils._redis_env_address.cache_clear()
+
+    def teardown_method(self):
+        """Reset shared pools and the cached environment after each test."""
+        backend.core.utils._redis_pools.clear()
+        backend.core.utils._async_redis_pools.clear()
+        backend.core.utils._redis_env_address.cache_clear()
+
+    @mock.patch("redis.BlockingConnectionPool")
     @mock.patch("redis.Redis")
-    def test_get_redis_connection_default(self, mock_redis_cls):
+    def test_get_redis_connection_default(self, mock_redis_cls, mock_pool_cls):
         """Test get_redis_connection with default parameters."""
         # Setup environment
         with mock.patch.dict(os.environ, {}, clear=True):
@@ -20,10 +41,22 @@ class TestUtils:
             get_redis_connection()
             
             # Verify
-            mock_redis_cls.assert_called_once_with(host="localhost", port=6379)
+            mock_pool_cls.assert_called_once_with(
+                host="localhost",
+                port=6379,
+                max_connections=32,
+                timeout=5,
+                decode_responses=False,
+            )
+            mock_redis_cls.assert_called_once_with(
+                connection_pool=mock_pool_cls.return_value
+            )
 
+    @mock.patch("redis.BlockingConnectionPool")
     @mock.patch("redis.Redis")
-    def test_get_redis_connection_from_env(self, mock_redis_cls):
+    def test_get_redis_connection_from_env(
+        self, mock_redis_cls, mock_pool_cls
+    ):
         """Test get_redis_connection with environment variables."""
         # Setup environment
         with mock.patch.dict(os.environ, {"REDIS_HOST": "redis.example.com", "REDIS_PORT": "6380"}, clear=True):
@@ -31,19 +64,59 @@ class TestUtils:
             get_redis_connection()
             
             # Verify
-            mock_redis_cls.assert_called_once_with(host="redis.example.com", port=6380)
+            mock_pool_cls.assert_called_once_with(
+                host="redis.example.com",
+                port=6380,
+                max_connections=32,
+                timeout=5,
+                decode_responses=False,
+            )
+            mock_redis_cls.assert_called_once_with(
+                connection_pool=mock_pool_cls.return_value
+            )
+
+    @mock.patch("redis.BlockingConnectionPool")
+    @mock.patch("redis.Redis")
+    def test_get_redis_connection_reads_env_once(
+        self, mock_redis_cls, mock_pool_cls
+    ):
+        """Test the environment is only read by the first call."""
+        with mock.patch.dict(
+            os.environ, {"REDIS_HOST": "redis.example.com"}, clear=True
+        ):
+            get_redis_connection()
+        with mock.patch.dict(
+            os.environ, {"REDIS_HOST": "other.example.com"}, clear=True
+        ):
+            get_redis_connection()
+
+        mock_pool_cls.assert_called_once()
+        assert mock_pool_cls.call_args.kwargs["host"] == "redis.example.com"
 
+    @mock.patch("redis.BlockingConnectionPool")
     @mock.patch("redis.Redis")
-    def test_get_redis_connection_params(self, mock_redis_cls):
+    def test_get_redis_connection_params(self, mock_redis_cls, mock_pool_cls):
         """Test get_redis_connection with explicit parameters."""
         # Call function with explicit parameters
         get_redis_connection(host="custom.redis.host", port=1234)
         
         # Verify
-        mock_redis_cls.assert_called_once_with(host="custom.redis.host", port=1234)
+        mock_pool_cls.assert_called_once_with(
+            host="custom.redis.host",
+            port=1234,
+            max_connections=32,
+            timeout=5,
+            decode_responses=False,
+        )
+        mock_redis_cls.assert_called_once_with(
+            connection_pool=mock_pool_cls.return_value
+        )
 
+    @mock.patch("redis.BlockingConnectionPool")
     @mock.patch("redis.Redis")
-    def test_get_redis_connection_mixed_params(self, mock_redis_cls):
+    def test_get_redis_connection_mixed_params(
+        self, mock_redis_cls, mock_pool_cls
+    ):
         """Test get_redis_connection with mixed parameters and env variables."""
         # Setup environment with one parameter
         with mock.patch.dict(os.environ, {"REDIS_PORT": "6380"}, clear=True):
@@ -51,4 +124,79 @@ class TestUtils:
             get_redis_connection(host="custom.redis.host")
             
             # Verify - should use explicit host and env var port
-            mock_redis_cls.assert_called_once_with(host="custom.redis.host", port=6380)
+            mock_pool_cls.assert_called_once_with(
+                host="custom.redis.host",
+                port=6380,
+                max_connections=32,
+                timeout=5,
+                decode_responses=False,
+            )
+            mock_redis_cls.assert_called_once_with(
+                connection_pool=mock_pool_cls.return_value
+            )
+
+    @mock.patch("redis.BlockingConnectionPool")
+    @mock.patch("redis.Redis")
+    def test_get_redis_connection_reuses_pool(
+        self, mock_redis_cls, mock_pool_cls
+    ):
+        """Test repeated calls share a single connection pool."""
+        get_redis_connection(host="custom.redis.host", port=1234)
+        get_redis_connection(host="custom.redis.host", port=1234)
+
+        mock_pool_cls.assert_called_once()
+        assert mock_redis_cls.call_count == 2
+
+    @mock.patch("redis.BlockingConnectionPool")
+    @mock.patch("redis.Redis")
+    def test_close_redis_pools(self, mock_redis_cls, mock_pool_cls):
+        """Test close_redis_pools disconnects and drops all pools."""
+        get_redis_connection(host="custom.redis.host", port=1234)
+
+        close_redis_pools()
+
+        mock_pool_cls.return_value.disconnect.assert_called_once()
+        assert backend.core.utils._redis_pools == {}
+
+    @mock.patch("redis.asyncio.BlockingConnectionPool")
+    @mock.patch("redis.asyncio.Redis")
+    def test_get_async_redis_connection(self, mock_redis_cls, mock_pool_cls):
+        """Test async connections share one asyncio pool per server."""
+        with mock.patch.dict(os.environ, {"REDIS_PORT": "6380"}, clear=True):
+            get_async_redis_connection()
+            get_async_redis_connection()
+
+        mock_pool_cls.assert_called_once_with(
+            host="localhost",
+            port=6380,
+            max_connections=32,
+            timeout=5,
+            decode_responses=False,
+        )
+        assert mock_redis_cls.call_count == 2
+        mock_redis_cls.assert_called_with(
+            connection_pool=mock_pool_cls.return_value
+        )
+
+    @mock.patch("redis.asyncio.BlockingConnectionPool")
+    def test_close_async_redis_pools(self, mock_pool_cls):
+        """Test close_async_redis_pools disconnects and drops all pools."""
+        mock_pool_cls.return_value.disconnect = mock.AsyncMock()
+        get_async_redis_connection(host="custom.redis.host", port=1234)
+
+        asyncio.run(close_async_redis_pools())
+
+        mock_pool_cls.return_value.disconnect.assert_awaited_once()
+        assert backend.core.utils._async_redis_pools == {}
+
+    def test_ensure_dir(self, tmp_path):
+        """Test ensure_dir creates a directory once and returns its path."""
+        directory = tmp_path / "a" / "b"
+        ensure_dir.cache_clear()
+
+        assert ensure_dir(str(directory)) == directory
+        assert directory.is_dir()
+
+        with mock.patch("pathlib.Path.mkdir") as mock_mkdir:
+            ensure_dir(str(directory))
+            mock_mkdir.assert_not_called()
@@ -1,11 +1,17 @@
 """Tests for queue.py module."""
+import asyncio
 from unittest import mock
 
 import pytest
 import redis
 from rq import Queue as RQQueue
 
-from backend.core.worker.queue import Queue, get_queue
+from backend.core.worker.queue import (
+    AsyncQueue,
+    Queue,
+    get_async_queue,
+    get_queue,
+)
 
 
 class TestQueue:
@@ -51,6 +57,58 @@ class TestQueue:
         assert result == mock_job
         mock_queue.enqueue.assert_called_once_with(test_func, "arg1", arg2="value")
 
+    @mock.patch("backend.core.worker.queue.RQQueue")
+    def test_enqueue_many(self, mock_rq_queue):
+        """Test enqueueing several jobs through one pipeline."""
+        # Setup mock
+        mock_queue = mock.MagicMock()
+        mock_jobs = [mock.MagicMock(), mock.MagicMock()]
+        mock_queue.enqueue_many.return_value = mock_jobs
+        mock_rq_queue.return_value = mock_queue
+
+        # Create queue
+        mock_conn = mock.MagicMock(spec=redis.Redis)
+        mock_pipe = mock_conn.pipeline.return_value
+        queue = Queue(name="test_queue", connection=mock_conn)
+
+        # Test enqueue_many
+        test_func = mock.MagicMock()
+        result = queue.enqueue_many(
+            [(test_func, ("a",), {}), (test_func, ("b",), {"x": 1})]
+        )
+
+        # Verify
+        assert result == mock_jobs
+        mock_conn.pipeline.assert_called_once_with(transaction=False)
+        mock_rq_queue.prepare_data.assert_has_calls([
+            mock.call(test_func, args=("a",), kwargs={}, job_id=None),
+            mock.call(test_func, args=("b",), kwargs={"x": 1}, job_id=None),
+        ])
+        mock_queue.enqueue_many.assert_called_once_with(
+            [mock_rq_queue.prepare_data.return_value] * 2, pipeline=mock_pipe
+        )
+        mock_pipe.execute.assert_called_once()
+
+    @mock.patch("backend.core.worker.queue.RQQueue")
+    def test_enqueue_many_job_ids(self, mock_rq_queue):
+        """Test enqueue_many gives each job the requested ID."""
+        queue = Queue(
+            name="test_queue", connection=mock.MagicMock(spec=redis.Redis)
+        )
+
+        test_func = mock.MagicMock()
+        queue.enqueue_many(
+            [(test_func, ("a",), {}), (test_func, ("b",), {})],
+            job_ids=["job-a", "job-b"],
+        )
+
+        mock_rq_queue.prepare_data.assert_has_calls(
+            [
+                mock.call(test_func, args=("a",), kwargs={}, job_id="job-a"),
+                mock.call(test_func, args=("b",), kwargs={}, job_id="job-b"),
+            ]
+        )
+
     @mock.patch("backend.core.worker.queue.RQQueue")
     def test_get_job_ids(self, mock_rq_queue):
         """Test getting job IDs."""
@@ -125,3 +183,67 @@ class TestQueue:
         
         # Reset module-level variable for other tests
         backend.core.worker.queue._default_queue = None
+
+
+class TestAsyncQueue:
+    """Test class for AsyncQueue."""
+
+    @mock.patch("backend.core.worker.queue.get_redis_connection")
+    def test_enqueue(self, mock_get_redis):
+        """Test a job is written in RQ format through one pipeline."""
+        mock_get_redis.return_value = mock.MagicMock(spec=redis.Redis)
+
+        # asyncio Redis pipelines buffer commands synchronously and execute
+        # them async
+        mock_conn = mock.MagicMock()
+        mock_pipe = mock.MagicMock()
+        mock_pipe.execute = mock.AsyncMock()
+        mock_conn.pipeline.return_value.__aenter__.return_value = mock_pipe
+
+        queue = AsyncQueue(name="test_queue", connection=mock_conn)
+        job = asyncio.run(queue.enqueue(print, "arg1", sep="-"))
+
+        # Verify
+        assert job.origin == "test_queue"
+        assert job.args == ("arg1",)
+        assert job.kwargs == {"sep": "-"}
+        mock_conn.pipeline.assert_called_once_with(transaction=True)
+        mock_pipe.sadd.assert_called_once_with(
+            "rq:queues", "rq:queue:test_queue"
+        )
+        mock_pipe.hset.assert_called_once()
+        assert mock_pipe.hset.call_args[0][0] == job.key
+        mock_pipe.rpush.assert_called_once_with("rq:queue:test_queue", job.id)
+        mock_pipe.execute.assert_awaited_once()
+
+    @mock.patch("backend.core.worker.queue.get_redis_connection")
+    def test_enqueue_with_job_id(self, mock_get_redis):
+        """Test enqueueing a job with a given ID."""
+        mock_get_redis.return_value = mock.MagicMock(spec=redis.Redis)
+        mock_conn = mock.MagicMock()
+        mock_pipe = mock.MagicMock()
+        mock_pipe.execute = mock.AsyncMock()
+        mock_conn.pipeline.return_value.__aenter__.return_value = mock_pipe
+
+        queue = AsyncQueue(name="test_queue", connection=mock_conn)
+        job = asyncio.run(queue.enqueue(print, "arg1", job_id="job-abc"))
+
+        assert job.id == "job-abc"
+        assert mock_pipe.hset.call_args[0][0] == b"rq:job:job-abc"
+        mock_pipe.rpush.assert_called_once_with(
+            "rq:queue:test_queue", "job-abc"
+        )
+
+    @mock.patch("backend.core.worker.queue.AsyncQueue")
+    def test_get_async_queue(self, mock_queue_cls):
+        """Test get_async_queue creates the instance once."""
+        import backend.core.worker.queue
+        backend.core.worker.queue._default_async_queue = None
+
+        first = get_async_queue("test_queue")
+        second = get_async_queue("test_queue")
+
+        assert first is second
+        mock_queue_cls.assert_called_once_with(name="test_queue")
+
+        backend.core.worker.queue._default_async_queue = None
@@ -0,0 +1,198 @@
+"""Tests for stragglers.py module."""
+import os
+from datetime import timedelta
+from unittest import mock
+
+import redis
+from rq.utils import utcnow
+
+from backend.core.worker import stragglers
+from backend.core.worker.stragglers import (
+    BACKUP_QUEUE_NAME,
+    MIN_RUNTIME_SAMPLES,
+    RUNTIME_HISTORY_KEY,
+    find_stragglers,
+    get_runtime_threshold,
+    publish_backup_outputs,
+    publish_outputs,
+    record_runtime,
+    watch_stragglers,
+)
+
+
+class TestStragglers:
+    """Test class for straggler mitigation."""
+
+    def test_record_runtime(self):
+        """Test runtimes are pushed onto a capped history."""
+        mock_conn = mock.MagicMock(spec=redis.Redis)
+        mock_pipe = mock_conn.pipeline.return_value
+
+        record_runtime(12.5, connection=mock_conn)
+
+        mock_pipe.lpush.assert_called_once_with(RUNTIME_HISTORY_KEY, 12.5)
+        mock_pipe.ltrim.assert_called_once_with(
+            RUNTIME_HISTORY_KEY, 0, stragglers.RUNTIME_HISTORY_SIZE - 1
+        )
+        mock_pipe.execute.assert_called_once()
+
+    def test_record_runtime_redis_error(self):
+        """Test Redis errors while recording a runtime are ignored."""
+        mock_conn = mock.MagicMock(spec=redis.Redis)
+        mock_conn.pipeline.return_value.execute.side_effect = (
+            redis.ConnectionError("down")
+        )
+
+        record_runtime(12.5, connection=mock_conn)
+
+    def test_get_runtime_threshold_short_history(self):
+        """Test no threshold is returned until enough runtimes are recorded."""
+        mock_conn = mock.MagicMock(spec=redis.Redis)
+        mock_conn.lrange.return_value = [b"10"] * (MIN_RUNTIME_SAMPLES - 1)
+
+        assert get_runtime_threshold(connection=mock_conn) is None
+
+    def test_get_runtime_threshold(self):
+        """Test the threshold is the p95 runtime times the straggler factor."""
+        mock_conn = mock.MagicMock(spec=redis.Redis)
+        mock_conn.lrange.return_value = [b"10"] * MIN_RUNTIME_SAMPLES
+
+        assert (
+            get_runtime_threshold(connection=mock_conn)
+            == 10 * stragglers.STRAGGLER_FACTOR
+        )
+
+    @mock.patch("backend.core.worker.stragglers.Job")
+    @mock.patch("backend.core.worker.stragglers.StartedJobRegistry")
+    @mock.patch("backend.core.worker.stragglers.get_runtime_threshold")
+    def test_find_stragglers(self, mock_threshold, mock_registry, mock_job):
+        """Test only jobs running longer than the threshold are returned."""
+        mock_conn = mock.MagicMock(spec=redis.Redis)
+        mock_threshold.return_value = 60
+        slow = mock.MagicMock(started_at=utcnow() - timedelta(seconds=120))
+        fast = mock.MagicMock(started_at=utcnow() - timedelta(seconds=5))
+        mock_job.fetch_many.return_value = [slow, fast, None]
+
+        assert find_stragglers("transcription", connection=mock_conn) == [slow]
+        mock_registry.assert_called_once_with(
+            "transcription", connection=mock_conn
+        )
+
+    @mock.patch("backend.core.worker.stragglers.get_runtime_threshold")
+    def test_find_stragglers_without_threshold(self, mock_threshold):
+        """Test nothing is a straggler while the history is too short."""
+        mock_threshold.return_value = None
+
+        assert (
+            find_stragglers(connection=mock.MagicMock(spec=redis.Redis)) == []
+        )
+
+    @mock.patch("backend.core.worker.stragglers.RQQueue")
+    @mock.patch("backend.core.worker.stragglers.find_stragglers")
+    def test_watch_stragglers(self, mock_find, mock_queue_class):
+        """Test a backup is enqueued once per straggling file."""
+        mock_conn = mock.MagicMock(spec=redis.Redis)
+        file_info = {"file_id": "file-1", "path": "uploads/file-1.mp3"}
+        mock_find.return_value = [
+            mock.MagicMock(id="job-1", args=(file_info,))
+        ]
+        mock_queue = mock_queue_class.return_value
+        mock_queue.enqueue.return_value.id = "backup-1"
+
+        # First scan claims the idempotency key, the second finds it taken
+        mock_conn.set.side_effect = [True, None]
+        assert watch_stragglers(connection=mock_conn) == ["backup-1"]
+        assert watch_stragglers(connection=mock_conn) == []
+
+        mock_queue_class.assert_called_with(
+            name=BACKUP_QUEUE_NAME, connection=mock_conn
+        )
+        mock_queue.enqueue.assert_called_once_with(
+            "backend.core.worker.tasks.process_file",
+            file_info,
+            backup_of="job-1",
+        )
+        mock_conn.set.assert_called_with(
+            "transcription:backup:file-1",
+            "job-1",
+            nx=True,
+            ex=stragglers.BACKUP_KEY_TTL,
+        )
+
+    def test_publish_outputs(self, tmp_path):
+        """Test outputs are moved into place and the staging dir removed."""
+        output_dir = tmp_path / "transcriptions"
+        staging_dir = output_dir / ".staging-1"
+        staging_dir.mkdir(parents=True)
+        (staging_dir / "file-1.json").write_text("{}")
+        (staging_dir / "file-1.vtt").write_text("WEBVTT")
+
+        published = publish_outputs(
+            {
+                "json": str(staging_dir / "file-1.json"),
+                "vtt": str(staging_dir / "file-1.vtt"),
+            },
+            str(output_dir),
+        )
+
+        assert published == {
+            "json": str(output_dir / "file-1.json"),
+            "vtt": str(output_dir / "file-1.vtt"),
+        }
+        assert (output_dir / "file-1.json").read_text() == "{}"
+        assert (output_dir / "file-1.vtt").read_text() == "WEBVTT"
+        assert not staging_dir.exists()
+
+    @mock.patch("backend.core.worker.stragglers.send_stop_job_command")
+    def test_publish_backup_outputs(self, mock_stop, tmp_path):
+        """Test backup outputs are published and the original stopped."""
+        output_dir = tmp_path / "transcriptions"
+        staging_dir = output_dir / ".staging-1"
+        staging_dir.mkdir(parents=True)
+        (staging_dir / "file-1.json").write_text("{}")
+        (staging_dir / "file-1.vtt").write_text("WEBVTT")
+        mock_conn = mock.MagicMock(spec=redis.Redis)
+
+        published = publish_backup_outputs(
+            {
+                "json": str(staging_dir / "file-1.json"),
+                "vtt": str(staging_dir / "file-1.vtt"),
+            },
+            str(output_dir),
+            "job-1",
+            connection=mock_conn,
+        )
+
+        assert published == {
+            "json": str(output_dir / "file-1.json"),
+            "vtt": str(output_dir / "file-1.vtt"),
+        }
+        assert (output_dir / "file-1.vtt").read_text() == "WEBVTT"
+        assert not staging_dir.exists()
+        mock_stop.assert_called_once_with(mock_conn, "job-1")
+
+    @mock.patch("backend.core.worker.stragglers.send_stop_job_command")
+    def test_publish_backup_outputs_original_won(self, mock_stop, tmp_path):
+        """Test backup outputs are discarded if the original finished first."""
+        output_dir = tmp_path / "transcriptions"
+        staging_dir = output_dir / ".staging-1"
+        staging_dir.mkdir(parents=True)
+        (output_dir / "file-1.json").write_text('{"original": true}')
+        (staging_dir / "file-1.json").write_text("{}")
+        (staging_dir / "file-1.vtt").write_text("WEBVTT")
+
+        published = publish_backup_outputs(
+            {
+                "json": str(staging_dir / "file-1.json"),
+                "vtt": str(staging_dir / "file-1.vtt"),
+            },
+            str(output_dir),
+            "job-1",
+            connection=mock.MagicMock(spec=redis.Redis),
+        )
+
+        assert published is None
+        assert (output_dir / "file-1.json").read_text() == '{"original": true}'
+        assert not os.path.exists(output_dir / "file-1.vtt")
+        assert not staging_dir.exists()
+        mock_stop.assert_not_called()
@@ -1,22 +1,53 @@
 """Tests for tasks.py module."""
+import asyncio
+import io
+import json
 import os
-import uuid
+import subprocess
+import sys
+import tempfile
 from pathlib import Path
 from unittest import mock
 
 import pytest
 
+from backend.core.utils import ensure_dir
 from backend.core.worker.tasks import (
+    _content_hasher,
     _ensure_upload_dir,
     save_uploaded_file,
     process_file,
     enqueue_file,
+    enqueue_files,
+    enqueue_file_async,
+    enqueue_saved_file_async,
+    enqueue_saved_file_background,
+    file_job_id,
 )
 
 
 class TestTasks:
     """Test class for tasks.py module."""
 
+    def setup_method(self):
+        """Forget the directories created by previous tests."""
+        ensure_dir.cache_clear()
+
+    def test_import_does_not_load_vosk(self):
+        """Test importing the worker package does not load Vosk."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, backend.core.worker; "
+                "print('vosk' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "False"
+
     def test_ensure_upload_dir_creates_directory(self):
         """Test _ensure_upload_dir creates directory if it doesn't exist."""
         test_dir = "test_uploads"
@@ -25,6 +56,15 @@ class TestTasks:
             assert result == Path(test_dir)
             mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
 
+    def test_ensure_upload_dir_creates_directory_once(self):
+        """Test _ensure_upload_dir only calls mkdir once per directory."""
+        with mock.patch("pathlib.Path.mkdir") as mock_mkdir:
+            _ensure_upload_dir("test_uploads")
+            _ensure_upload_dir("test_uploads")
+            _ensure_upload_dir("other_uploads")
+
+            assert mock_mkdir.call_count == 2
+
     def test_ensure_upload_dir_returns_path(self):
         """Test _ensure_upload_dir returns Path object."""
         test_dir = "test_uploads"
@@ -32,37 +72,115 @@ class TestTasks:
         assert isinstance(result, Path)
         assert str(result) == test_dir
 
-    @mock.patch("backend.core.worker.tasks._ensure_upload_dir")
-    @mock.patch("uuid.uuid4")
-    def test_save_uploaded_file(self, mock_uuid, mock_ensure_dir):
-        """Test save_uploaded_file saves file correctly."""
-        # Setup mocks
-        mock_uuid.return_value = uuid.UUID("12345678-1234-5678-1234-567812345678")
-        mock_ensure_dir.return_value = Path("test_uploads")
-        
-        # Call function
+    def test_save_uploaded_file(self, tmp_path):
+        """Test save_uploaded_file names the file after its content hash."""
         file_content = b"test file content"
         filename = "test.mp3"
-        
-        # Mock open with context manager
-        mock_file = mock.mock_open()
-        with mock.patch("builtins.open", mock_file):
-            result = save_uploaded_file(file_content, filename, "test_uploads")
-        
+
+        result = save_uploaded_file(
+            io.BytesIO(file_content), filename, str(tmp_path)
+        )
+
         # Check results
-        assert result["file_id"] == "12345678-1234-5678-1234-567812345678"
+        expected_id = _content_hasher(file_content).hexdigest()[:32]
+        assert result["file_id"] == expected_id
         assert result["original_filename"] == filename
-        assert result["path"] == "test_uploads/12345678-1234-5678-1234-567812345678.mp3"
+        assert result["path"] == str(tmp_path / f"{expected_id}.mp3")
         assert result["size"] == len(file_content)
         
-        # Verify file was written correctly
-        mock_file.assert_called_once()
-        mock_file().write.assert_called_once_with(file_content)
+        # Verify file was written correctly and no temporary file is left
+        assert Path(result["path"]).read_bytes() == file_content
+        assert os.listdir(tmp_path) == [f"{expected_id}.mp3"]
+
+    def test_save_uploaded_file_mode(self, tmp_path):
+        """Test saved uploads get the umask default mode, not 0600."""
+        umask = os.umask(0o022)
+        try:
+            result = save_uploaded_file(
+                io.BytesIO(b"test file content"), "test.mp3", str(tmp_path)
+            )
+        finally:
+            os.umask(umask)
+
+        assert os.stat(result["path"]).st_mode & 0o777 == 0o644
+
+    def test_save_uploaded_file_same_content(self, tmp_path):
+        """Test the same content uploaded twice gets the same file ID."""
+        first = save_uploaded_file(
+            io.BytesIO(b"same content"), "a.mp3", str(tmp_path)
+        )
+        second = save_uploaded_file(
+            io.BytesIO(b"same content"), "b.mp3", str(tmp_path)
+        )
+        other = save_uploaded_file(
+            io.BytesIO(b"other content"), "c.mp3", str(tmp_path)
+        )
+
+        assert first["file_id"] == second["file_id"]
+        assert first["path"] == second["path"]
+        assert other["file_id"] != first["file_id"]
+        assert second["original_filename"] == "b.mp3"
+
+    def test_save_uploaded_file_error(self, tmp_path):
+        """Test a failed copy leaves no partial file behind."""
+        file_obj = mock.MagicMock()
+        file_obj.readinto.side_effect = OSError("client disconnected")
+
+        with pytest.raises(OSError):
+            save_uploaded_file(file_obj, "test.mp3", str(tmp_path))
+
+        assert os.listdir(tmp_path) == []
+
+    def test_save_uploaded_file_from_disk(self, tmp_path):
+        """Test save_uploaded_file copies a disk-backed upload completely."""
+        file_content = os.urandom(3 * 1024 * 1024 + 123)
+
+        with tempfile.TemporaryFile() as spool:
+            spool.write(file_content)
+            spool.seek(0)
+            result = save_uploaded_file(spool, "test.wav", str(tmp_path))
+
+        assert result["size"] == len(file_content)
+        assert Path(result["path"]).read_bytes() == file_content
+
+    @pytest.mark.skipif(
+        not hasattr(os, "posix_fadvise"), reason="posix_fadvise not available"
+    )
+    @mock.patch("backend.core.worker.tasks.os.posix_fadvise")
+    def test_save_uploaded_file_drop_cache(self, mock_fadvise, tmp_path):
+        """Test saved uploads are evicted from the page cache when enabled."""
+        with mock.patch("backend.core.worker.tasks.UPLOAD_DROP_CACHE", True):
+            file_info = save_uploaded_file(
+                io.BytesIO(b"audio"), "test.mp3", str(tmp_path)
+            )
+
+        mock_fadvise.assert_called_once_with(
+            mock.ANY, 0, 0, os.POSIX_FADV_DONTNEED
+        )
+        assert Path(file_info["path"]).read_bytes() == b"audio"
 
-    @mock.patch("backend.core.worker.tasks.transcription")
-    @mock.patch("pathlib.Path.mkdir")
-    def test_process_file_mp3(self, mock_mkdir, mock_transcription):
+    @mock.patch("backend.core.worker.tasks.os.posix_fadvise", create=True)
+    def test_save_uploaded_file_keeps_cache_by_default(
+        self, mock_fadvise, tmp_path
+    ):
+        """Test saved uploads stay in the page cache by default."""
+        save_uploaded_file(io.BytesIO(b"audio"), "test.mp3", str(tmp_path))
+
+        mock_fadvise.assert_not_called()
+
+    @mock.patch("backend.core.worker.tasks.get_redis_connection")
+    @mock.patch("backend.core.worker.tasks.stragglers")
+    @mock.patch("backend.core.worker.transcription", create=True)
+    def test_process_file_mp3(
+        self,
+        mock_transcription,
+        mock_stragglers,
+        mock_get_redis,
+        tmp_path,
+        monkeypatch,
+    ):
         """Test process_file with MP3 file."""
+        monkeypatch.chdir(tmp_path)
         # Setup file info
         file_info = {
             "file_id": "12345678-1234-5678-1234-567812345678",
@@ -72,7 +190,6 @@ class TestTasks:
         }
         
         # Setup transcription mock
-        mock_transcription.convert_audio_format.return_value = "uploads/12345678-1234-5678-1234-567812345678.wav"
         mock_transcription.transcribe_audio.return_value = {
             "outputs": {
                 "json": "transcriptions/12345678-1234-5678-1234-567812345678.json",
@@ -90,14 +207,59 @@ class TestTasks:
         assert "json_path" in result["transcription"]
         assert "vtt_path" in result["transcription"]
         
-        # Verify transcription was called
-        mock_transcription.convert_audio_format.assert_called_once()
+        # Verify the upload is transcribed directly, without a converted WAV
+        # copy
+        mock_transcription.convert_audio_format.assert_not_called()
         mock_transcription.transcribe_audio.assert_called_once()
+        assert (
+            mock_transcription.transcribe_audio.call_args[1]["audio_file"]
+            == file_info["path"]
+        )
+        mock_stragglers.record_runtime.assert_called_once()
         
-    @mock.patch("backend.core.worker.tasks.transcription")
-    @mock.patch("pathlib.Path.mkdir")
-    def test_process_file_wav(self, mock_mkdir, mock_transcription):
+        # Outputs are written to a staging directory and published from it
+        call_kwargs = mock_transcription.transcribe_audio.call_args[1]
+        staging_dir = call_kwargs["output_dir"]
+        assert os.path.dirname(staging_dir) == os.path.join(
+            "data", "transcriptions"
+        )
+        assert call_kwargs["create_output_dir"] is False
+        assert not os.path.exists(staging_dir)
+        outputs = mock_transcription.transcribe_audio.return_value["outputs"]
+        mock_stragglers.publish_outputs.assert_called_once_with(
+            {"json": outputs["json"], "vtt": outputs["vtt"]},
+            "data/transcriptions",
+        )
+        mock_stragglers.publish_backup_outputs.assert_not_called()
+
+        # Verify the result is cached for re-uploads of the same file
+        key, value = mock_get_redis.return_value.set.call_args[0]
+        assert (
+            key == "transcription:result:12345678-1234-5678-1234-567812345678"
+        )
+        assert json.loads(value) == {
+            "job_id": None,
+            "transcription": result["transcription"],
+        }
+
+        # The job claim is released so the file can be enqueued again
+        mock_get_redis.return_value.delete.assert_called_once_with(
+            "job-claim:12345678-1234-5678-1234-567812345678"
+        )
+
+    @mock.patch("backend.core.worker.tasks.get_redis_connection")
+    @mock.patch("backend.core.worker.tasks.stragglers")
+    @mock.patch("backend.core.worker.transcription", create=True)
+    def test_process_file_wav(
+        self,
+        mock_transcription,
+        mock_stragglers,
+        mock_get_redis,
+        tmp_path,
+        monkeypatch,
+    ):
         """Test process_file with WAV file (no conversion needed)."""
+        monkeypatch.chdir(tmp_path)
         # Setup file info
         file_info = {
             "file_id": "12345678-1234-5678-1234-567812345678",
@@ -125,10 +287,19 @@ class TestTasks:
         mock_transcription.convert_audio_format.assert_not_called()
         mock_transcription.transcribe_audio.assert_called_once()
 
-    @mock.patch("backend.core.worker.tasks.transcription")
-    @mock.patch("pathlib.Path.mkdir")
-    def test_process_file_error(self, mock_mkdir, mock_transcription):
+    @mock.patch("backend.core.worker.tasks.get_redis_connection")
+    @mock.patch("backend.core.worker.tasks.stragglers")
+    @mock.patch("backend.core.worker.transcription", create=True)
+    def test_process_file_error(
+        self,
+        mock_transcription,
+        mock_stragglers,
+        mock_get_redis,
+        tmp_path,
+        monkeypatch,
+    ):
         """Test process_file handles errors correctly."""
+        monkeypatch.chdir(tmp_path)
         # Setup file info
         file_info = {
             "file_id": "12345678-1234-5678-1234-567812345678",
@@ -148,10 +319,188 @@ class TestTasks:
         assert "error" in result
         assert "Transcription failed" in result["error"]
 
+    @mock.patch("backend.core.worker.tasks.get_redis_connection")
+    @mock.patch("backend.core.worker.tasks.stragglers")
+    @mock.patch("backend.core.worker.transcription", create=True)
+    def test_process_file_loses_to_backup(
+        self,
+        mock_transcription,
+        mock_stragglers,
+        mock_get_redis,
+        tmp_path,
+        monkeypatch,
+    ):
+        """Test the original job loses to a backup that published first."""
+        monkeypatch.chdir(tmp_path)
+        file_info = {
+            "file_id": "12345678-1234-5678-1234-567812345678",
+            "original_filename": "test.wav",
+            "path": "uploads/12345678-1234-5678-1234-567812345678.wav",
+            "size": 1000
+        }
+        mock_transcription.transcribe_audio.return_value = {
+            "outputs": {
+                "json": "a.json",
+                "vtt": "a.vtt",
+                "transcription": {"text": "Hello world"},
+            }
+        }
+        mock_stragglers.publish_outputs.return_value = None
+
+        result = process_file(file_info)
+
+        assert result["status"] == "duplicate"
+        mock_stragglers.record_runtime.assert_not_called()
+        mock_get_redis.return_value.set.assert_not_called()
+
+    @mock.patch("backend.core.worker.tasks.get_redis_connection")
+    @mock.patch("backend.core.worker.tasks.stragglers")
+    @mock.patch("backend.core.worker.transcription", create=True)
+    def test_process_file_removes_stale_outputs(
+        self,
+        mock_transcription,
+        mock_stragglers,
+        mock_get_redis,
+        tmp_path,
+        monkeypatch,
+    ):
+        """Test outputs of an earlier run do not block the original job."""
+        monkeypatch.chdir(tmp_path)
+        output_dir = tmp_path / "data" / "transcriptions"
+        output_dir.mkdir(parents=True)
+        (output_dir / "12345678-1234-5678-1234-567812345678.json").write_text(
+            "{}"
+        )
+        (output_dir / "12345678-1234-5678-1234-567812345678.vtt").write_text(
+            "WEBVTT"
+        )
+        file_info = {
+            "file_id": "12345678-1234-5678-1234-567812345678",
+            "original_filename": "test.wav",
+            "path": "uploads/12345678-1234-5678-1234-567812345678.wav",
+            "size": 1000
+        }
+        mock_transcription.transcribe_audio.return_value = {
+            "outputs": {
+                "json": "a.json",
+                "vtt": "a.vtt",
+                "transcription": {"text": "Hello world"},
+            }
+        }
+
+        process_file(file_info)
+
+        assert os.listdir(output_dir) == []
+
+    @mock.patch("backend.core.worker.tasks.get_redis_connection")
+    @mock.patch("backend.core.worker.tasks.stragglers")
+    @mock.patch("backend.core.worker.transcription", create=True)
+    def test_process_file_backup(
+        self,
+        mock_transcription,
+        mock_stragglers,
+        mock_get_redis,
+        tmp_path,
+        monkeypatch,
+    ):
+        """Test a backup job publishes from its staging directory."""
+        monkeypatch.chdir(tmp_path)
+        file_info = {
+            "file_id": "12345678-1234-5678-1234-567812345678",
+            "original_filename": "test.mp3",
+            "path": "uploads/12345678-1234-5678-1234-567812345678.mp3",
+            "size": 1000
+        }
+
+        def fake_transcribe(audio_file, output_dir, **kwargs):
+            return {
+                "outputs": {
+                    "json": os.path.join(
+                        output_dir, "12345678-1234-5678-1234-567812345678.json"
+                    ),
+                    "vtt": os.path.join(
+                        output_dir, "12345678-1234-5678-1234-567812345678.vtt"
+                    ),
+                    "transcription": {"text": "Hello world"},
+                }
+            }
+
+        mock_transcription.transcribe_audio.side_effect = fake_transcribe
+        mock_stragglers.publish_backup_outputs.return_value = {
+            fmt: f"data/transcriptions/{file_info['file_id']}.{fmt}"
+            for fmt in ("json", "vtt")
+        }
+
+        result = process_file(file_info, backup_of="job-123")
+
+        # Outputs are written to a staging directory that is removed afterwards
+        call_kwargs = mock_transcription.transcribe_audio.call_args[1]
+        staging_dir = call_kwargs["output_dir"]
+        assert os.path.dirname(staging_dir) == os.path.join(
+            "data", "transcriptions"
+        )
+        assert not os.path.exists(staging_dir)
+
+        (
+            outputs,
+            output_dir,
+            original_job_id,
+        ) = mock_stragglers.publish_backup_outputs.call_args[0]
+        assert os.path.dirname(outputs["json"]) == staging_dir
+        assert output_dir == "data/transcriptions"
+        assert original_job_id == "job-123"
+
+        assert result["status"] == "transcribed"
+        assert (
+            result["transcription"]["json_path"]
+            == mock_stragglers.publish_backup_outputs.return_value["json"]
+        )
+        mock_stragglers.record_runtime.assert_not_called()
+        # The claim belongs to the original job
+        mock_get_redis.return_value.delete.assert_not_called()
+
+    @mock.patch("backend.core.worker.tasks.get_redis_connection")
+    @mock.patch("backend.core.worker.tasks.stragglers")
+    @mock.patch("backend.core.worker.transcription", create=True)
+    def test_process_file_backup_loses(
+        self,
+        mock_transcription,
+        mock_stragglers,
+        mock_get_redis,
+        tmp_path,
+        monkeypatch,
+    ):
+        """Test a backup job loses to an original that finished first."""
+        monkeypatch.chdir(tmp_path)
+        file_info = {
+            "file_id": "12345678-1234-5678-1234-567812345678",
+            "original_filename": "test.wav",
+            "path": "uploads/12345678-1234-5678-1234-567812345678.wav",
+            "size": 1000
+        }
+        mock_transcription.transcribe_audio.return_value = {
+            "outputs": {
+                "json": "a.json",
+                "vtt": "a.vtt",
+                "transcription": {"text": "Hello world"},
+            }
+        }
+        mock_stragglers.publish_backup_outputs.return_value = None
+
+        result = process_file(file_info, backup_of="job-123")
+
+        assert result["status"] == "duplicate"
+
+    @mock.patch("backend.core.worker.tasks.get_redis_connection")
     @mock.patch("backend.core.worker.tasks.save_uploaded_file")
     @mock.patch("backend.core.worker.tasks.get_queue")
-    def test_enqueue_file(self, mock_get_queue, mock_save_file):
+    def test_enqueue_file(
+        self, mock_get_queue, mock_save_file, mock_get_redis
+    ):
         """Test enqueue_file correctly saves and enqueues file."""
+        mock_get_redis.return_value.get.return_value = None
+        mock_get_redis.return_value.set.return_value = True
+        mock_get_redis.return_value.hget.return_value = None
         # Setup mocks
         mock_save_file.return_value = {
             "file_id": "12345678-1234-5678-1234-567812345678",
@@ -161,22 +510,364 @@ class TestTasks:
         }
         
         mock_queue = mock.MagicMock()
-        mock_job = mock.MagicMock()
-        mock_job.id = "job-123"
-        mock_queue.enqueue.return_value = mock_job
         mock_get_queue.return_value = mock_queue
         
         # Call function
-        file_content = b"test file content"
+        file_obj = io.BytesIO(b"test file content")
         filename = "test.mp3"
-        result = enqueue_file(file_content, filename)
+        result = enqueue_file(file_obj, filename)
         
         # Check results
-        assert result["job_id"] == "job-123"
+        assert result["job_id"] == "job-12345678-1234-5678-1234-567812345678"
         assert result["file_id"] == "12345678-1234-5678-1234-567812345678"
         assert result["original_filename"] == "test.mp3"
         assert result["status"] == "queued"
         
         # Verify functions were called
-        mock_save_file.assert_called_once_with(file_content, filename, "data/uploads")
+        mock_save_file.assert_called_once_with(
+            file_obj, filename, "data/uploads"
+        )
         mock_queue.enqueue.assert_called_once()
+        args, kwargs = mock_queue.enqueue.call_args
+        assert (
+            args[1] == mock_save_file.return_value
+        )  # Only metadata is enqueued
+        assert not any(
+            isinstance(value, (bytes, bytearray)) for value in args[1].values()
+        )
+        assert kwargs == {"job_id": "job-12345678-1234-5678-1234-567812345678"}
+        mock_get_redis.return_value.set.assert_called_once_with(
+            "job-claim:12345678-1234-5678-1234-567812345678",
+            "job-12345678-1234-5678-1234-567812345678",
+            nx=True,
+            ex=180,
+        )
+
+    @mock.patch("backend.core.worker.tasks.get_redis_connection")
+    @mock.patch("backend.core.worker.tasks.save_uploaded_file")
+    @mock.patch("backend.core.worker.tasks.get_queue")
+    def test_enqueue_file_pending(
+        self, mock_get_queue, mock_save_file, mock_get_redis
+    ):
+        """Test a file whose job is still pending is not enqueued again."""
+        mock_get_redis.return_value.get.return_value = None
+        mock_get_redis.return_value.set.return_value = True
+        mock_get_redis.return_value.hget.return_value = b"queued"
+        mock_save_file.return_value = {
+            "file_id": "0123456789abcdef0123456789abcdef",
+            "original_filename": "again.mp3",
+            "path": "uploads/0123456789abcdef0123456789abcdef.mp3",
+            "size": 1000
+        }
+
+        result = enqueue_file(io.BytesIO(b"test file content"), "again.mp3")
+
+        assert result["job_id"] == "job-0123456789abcdef0123456789abcdef"
+        assert result["status"] == "queued"
+        mock_get_redis.return_value.hget.assert_called_once_with(
+            b"rq:job:job-0123456789abcdef0123456789abcdef", "status"
+        )
+        mock_get_queue.return_value.enqueue.assert_not_called()
+
+    @mock.patch("backend.core.worker.tasks.get_redis_connection")
+    @mock.patch("backend.core.worker.tasks.save_uploaded_file")
+    @mock.patch("backend.core.worker.tasks.get_queue")
+    def test_enqueue_file_claimed(
+        self, mock_get_queue, mock_save_file, mock_get_redis
+    ):
+        """Test a file claimed by a concurrent upload is not enqueued."""
+        mock_get_redis.return_value.get.return_value = None
+        mock_get_redis.return_value.set.return_value = None
+        mock_save_file.return_value = {
+            "file_id": "0123456789abcdef0123456789abcdef",
+            "original_filename": "again.mp3",
+            "path": "uploads/0123456789abcdef0123456789abcdef.mp3",
+            "size": 1000
+        }
+
+        result = enqueue_file(io.BytesIO(b"test file content"), "again.mp3")
+
+        assert result["job_id"] == "job-0123456789abcdef0123456789abcdef"
+        assert result["status"] == "queued"
+        mock_get_redis.return_value.hget.assert_not_called()
+        mock_get_queue.return_value.enqueue.assert_not_called()
+
+    @mock.patch("backend.core.worker.tasks.get_redis_connection")
+    @mock.patch("backend.core.worker.tasks.save_uploaded_file")
+    @mock.patch("backend.core.worker.tasks.get_queue")
+    def test_enqueue_file_releases_claim_on_error(
+        self, mock_get_queue, mock_save_file, mock_get_redis
+    ):
+        """Test the claim is released when the enqueue fails."""
+        mock_get_redis.return_value.get.return_value = None
+        mock_get_redis.return_value.set.return_value = True
+        mock_get_redis.return_value.hget.return_value = None
+        mock_get_queue.return_value.enqueue.side_effect = ConnectionError
+        mock_save_file.return_value = {
+            "file_id": "0123456789abcdef0123456789abcdef",
+            "original_filename": "again.mp3",
+            "path": "uploads/0123456789abcdef0123456789abcdef.mp3",
+            "size": 1000
+        }
+
+        with pytest.raises(ConnectionError):
+            enqueue_file(io.BytesIO(b"test file content"), "again.mp3")
+
+        mock_get_redis.return_value.delete.assert_called_once_with(
+            "job-claim:0123456789abcdef0123456789abcdef"
+        )
+
+    @mock.patch("backend.core.worker.tasks.get_redis_connection")
+    @mock.patch("backend.core.worker.tasks.get_queue")
+    def test_enqueue_files(self, mock_get_queue, mock_get_redis, tmp_path):
+        """Test enqueue_files checks the cache and enqueues in one batch."""
+        transcription = {
+            "json_path": "a.json",
+            "vtt_path": "a.vtt",
+            "transcript": "Hello world",
+        }
+        cached = json.dumps(
+            {"job_id": "job-old", "transcription": transcription}
+        ).encode()
+        mock_get_redis.return_value.mget.side_effect = lambda keys: [
+            None,
+            cached,
+            None,
+        ]
+        pipe = mock_get_redis.return_value.pipeline.return_value
+        pipe.execute.return_value = [True, None]
+
+        files = [
+            (io.BytesIO(b"new audio"), "new.mp3"),
+            (io.BytesIO(b"old audio"), "old.mp3"),
+            (io.BytesIO(b"new audio"), "copy.mp3"),
+        ]
+        result = enqueue_files(files, upload_dir=str(tmp_path))
+
+        new_id = result[0]["file_id"]
+        assert result[0] == {
+            "job_id": f"job-{new_id}",
+            "file_id": new_id,
+            "original_filename": "new.mp3",
+            "status": "queued",
+        }
+        assert result[1]["status"] == "transcribed"
+        assert result[1]["job_id"] == "job-old"
+        assert result[2]["job_id"] == f"job-{new_id}"
+        assert result[2]["original_filename"] == "copy.mp3"
+
+        mock_get_redis.return_value.mget.assert_called_once()
+        mock_get_queue.return_value.enqueue_many.assert_called_once()
+        jobs = mock_get_queue.return_value.enqueue_many.call_args[0][0]
+        assert [
+            (func, args[0]["original_filename"]) for func, args, _ in jobs
+        ] == [(process_file, "new.mp3")]
+        assert mock_get_queue.return_value.enqueue_many.call_args[1] == {
+            "job_ids": [f"job-{new_id}"]
+        }
+        pipe.set.assert_called_once_with(
+            f"job-claim:{new_id}", f"job-{new_id}", nx=True, ex=180
+        )
+
+    @mock.patch("backend.core.worker.tasks.get_redis_connection")
+    @mock.patch("backend.core.worker.tasks.get_queue")
+    def test_enqueue_files_pending(
+        self, mock_get_queue, mock_get_redis, tmp_path
+    ):
+        """Test enqueue_files skips files claimed or pending elsewhere."""
+        mock_get_redis.return_value.mget.return_value = [None, None, None]
+        pipe = mock_get_redis.return_value.pipeline.return_value
+        pipe.execute.return_value = [None, None, True, b"queued", True, None]
+
+        files = [
+            (io.BytesIO(b"claimed audio"), "claimed.mp3"),
+            (io.BytesIO(b"pending audio"), "pending.mp3"),
+            (io.BytesIO(b"new audio"), "new.mp3"),
+        ]
+        result = enqueue_files(files, upload_dir=str(tmp_path))
+
+        assert [info["status"] for info in result] == ["queued"] * 3
+        assert mock_get_queue.return_value.enqueue_many.call_args[1] == {
+            "job_ids": [result[2]["job_id"]]
+        }
+
+    @mock.patch("backend.core.worker.tasks.get_redis_connection")
+    @mock.patch("backend.core.worker.tasks.get_queue")
+    def test_enqueue_files_all_cached(
+        self, mock_get_queue, mock_get_redis, tmp_path
+    ):
+        """Test enqueue_files enqueues nothing when all are transcribed."""
+        cached = json.dumps(
+            {"job_id": "job-old", "transcription": {}}
+        ).encode()
+        mock_get_redis.return_value.mget.return_value = [cached]
+
+        result = enqueue_files(
+            [(io.BytesIO(b"old audio"), "old.mp3")], upload_dir=str(tmp_path)
+        )
+
+        assert result[0]["status"] == "transcribed"
+        mock_get_queue.return_value.enqueue_many.assert_not_called()
+
+    @mock.patch("backend.core.worker.tasks.get_redis_connection")
+    @mock.patch("backend.core.worker.tasks.save_uploaded_file")
+    @mock.patch("backend.core.worker.tasks.get_queue")
+    def test_enqueue_file_cached(
+        self, mock_get_queue, mock_save_file, mock_get_redis
+    ):
+        """Test enqueue_file returns the cached result of a known file."""
+        mock_save_file.return_value = {
+            "file_id": "0123456789abcdef0123456789abcdef",
+            "original_filename": "again.mp3",
+            "path": "uploads/0123456789abcdef0123456789abcdef.mp3",
+            "size": 1000
+        }
+        transcription = {
+            "json_path": "a.json",
+            "vtt_path": "a.vtt",
+            "transcript": "Hello world",
+        }
+        mock_get_redis.return_value.get.return_value = json.dumps(
+            {"job_id": "job-123", "transcription": transcription}
+        ).encode()
+
+        result = enqueue_file(io.BytesIO(b"test file content"), "again.mp3")
+
+        mock_get_redis.return_value.get.assert_called_once_with(
+            "transcription:result:0123456789abcdef0123456789abcdef"
+        )
+        mock_get_queue.assert_not_called()
+        assert result == {
+            "job_id": "job-123",
+            "file_id": "0123456789abcdef0123456789abcdef",
+            "original_filename": "again.mp3",
+            "status": "transcribed",
+            "transcription": transcription
+        }
+
+    @mock.patch("backend.core.worker.tasks.get_async_redis_connection")
+    @mock.patch("backend.core.worker.tasks.save_uploaded_file")
+    @mock.patch("backend.core.worker.tasks.get_async_queue")
+    def test_enqueue_file_async(
+        self, mock_get_queue, mock_save_file, mock_get_redis
+    ):
+        """Test enqueue_file_async saves the file and awaits the enqueue."""
+        mock_get_redis.return_value.get = mock.AsyncMock(return_value=None)
+        mock_get_redis.return_value.set = mock.AsyncMock(return_value=True)
+        mock_get_redis.return_value.hget = mock.AsyncMock(return_value=None)
+
+        # Setup mocks
+        mock_save_file.return_value = {
+            "file_id": "12345678-1234-5678-1234-567812345678",
+            "original_filename": "test.mp3",
+            "path": "uploads/12345678-1234-5678-1234-567812345678.mp3",
+            "size": 1000
+        }
+        mock_get_queue.return_value.enqueue = mock.AsyncMock()
+
+        # Call function
+        file_obj = io.BytesIO(b"test file content")
+        result = asyncio.run(enqueue_file_async(file_obj, "test.mp3"))
+
+        # Check results
+        assert result["job_id"] == "job-12345678-1234-5678-1234-567812345678"
+        assert result["file_id"] == "12345678-1234-5678-1234-567812345678"
+        assert result["status"] == "queued"
+        mock_get_queue.return_value.enqueue.assert_awaited_once_with(
+            process_file,
+            mock_save_file.return_value,
+            job_id="job-12345678-1234-5678-1234-567812345678",
+        )
+
+    @mock.patch("backend.core.worker.tasks.get_async_redis_connection")
+    @mock.patch("backend.core.worker.tasks.get_async_queue")
+    def test_enqueue_saved_file_async_pending(
+        self, mock_get_queue, mock_get_redis
+    ):
+        """Test a file whose job is still pending is not enqueued again."""
+        mock_get_redis.return_value.set = mock.AsyncMock(return_value=True)
+        mock_get_redis.return_value.hget = mock.AsyncMock(
+            return_value=b"started"
+        )
+        mock_get_queue.return_value.enqueue = mock.AsyncMock()
+        file_info = {
+            "file_id": "0123456789abcdef0123456789abcdef",
+            "original_filename": "again.mp3",
+            "path": "uploads/0123456789abcdef0123456789abcdef.mp3",
+            "size": 1000
+        }
+
+        result = asyncio.run(enqueue_saved_file_async(file_info))
+
+        assert result["job_id"] == file_job_id(file_info["file_id"])
+        assert result["status"] == "queued"
+        mock_get_redis.return_value.hget.assert_awaited_once_with(
+            b"rq:job:job-0123456789abcdef0123456789abcdef", "status"
+        )
+        mock_get_queue.return_value.enqueue.assert_not_called()
+
+    @mock.patch("backend.core.worker.tasks.get_async_redis_connection")
+    @mock.patch("backend.core.worker.tasks.get_async_queue")
+    def test_enqueue_saved_file_async_claimed(
+        self, mock_get_queue, mock_get_redis
+    ):
+        """Test concurrent uploads of the same file enqueue a single job."""
+        claims = set()
+
+        async def set_nx(key, value, nx, ex):
+            if key in claims:
+                return None
+            claims.add(key)
+            return True
+
+        mock_get_redis.return_value.set = mock.AsyncMock(side_effect=set_nx)
+        mock_get_redis.return_value.hget = mock.AsyncMock(return_value=None)
+        mock_get_queue.return_value.enqueue = mock.AsyncMock()
+        file_info = {
+            "file_id": "0123456789abcdef0123456789abcdef",
+            "original_filename": "again.mp3",
+            "path": "uploads/0123456789abcdef0123456789abcdef.mp3",
+            "size": 1000
+        }
+
+        async def upload_twice():
+            return await asyncio.gather(
+                enqueue_saved_file_async(file_info),
+                enqueue_saved_file_async(file_info),
+            )
+
+        results = asyncio.run(upload_twice())
+
+        assert [result["status"] for result in results] == ["queued"] * 2
+        mock_get_queue.return_value.enqueue.assert_awaited_once()
+
+    @mock.patch("backend.core.worker.tasks.get_async_redis_connection")
+    @mock.patch("backend.core.worker.tasks.get_async_queue")
+    def test_enqueue_saved_file_background_error(
+        self, mock_get_queue, mock_get_redis, capsys
+    ):
+        """Test a failed background enqueue is logged and recorded."""
+        mock_get_redis.return_value.set = mock.AsyncMock(return_value=True)
+        mock_get_redis.return_value.hget = mock.AsyncMock(return_value=None)
+        mock_get_redis.return_value.delete = mock.AsyncMock()
+        mock_get_redis.return_value.hset = mock.AsyncMock()
+        mock_get_queue.return_value.enqueue = mock.AsyncMock(
+            side_effect=ConnectionError("Redis is down")
+        )
+        file_info = {
+            "file_id": "0123456789abcdef0123456789abcdef",
+            "original_filename": "test.mp3",
+            "path": "uploads/0123456789abcdef0123456789abcdef.mp3",
+            "size": 1000
+        }
+
+        asyncio.run(enqueue_saved_file_background(file_info))
+
+        assert "0123456789abcdef0123456789abcdef" in capsys.readouterr().out
+        mock_get_redis.return_value.delete.assert_awaited_once_with(
+            "job-claim:0123456789abcdef0123456789abcdef"
+        )
+        mock_get_redis.return_value.hset.assert_awaited_once_with(
+            b"rq:job:job-0123456789abcdef0123456789abcdef",
+            mapping={"status": "failed", "exc_info": "Redis is down"},
+        )
@@ -1,20 +1,39 @@
 """Tests for transcription.py module."""
+import asyncio
+import concurrent.futures
+import io
 import os
 import json
 import tempfile
 import wave
 import unittest
 import subprocess
+import sys
 import zipfile
 from pathlib import Path
 from unittest import mock
 
 import pytest
+import requests
 
+from backend.core.utils import ensure_dir
 from backend.core.worker.transcription import (
+    _installed_models,
+    _output_files,
+    _recognizer_pool,
+    acquire_recognizer,
+    _ffi,
     ensure_ffmpeg,
     convert_audio_format,
+    decode_audio_stream,
+    decode_to_pcm16,
+    format_vtt_timestamp,
+    group_words_into_segments,
+    load_model,
+    recognize_words,
     transcribe_audio,
+    transcribe_audio_async,
+    MODEL_CACHE_SIZE,
     get_vosk_model,
     download_vosk_model,
     extract_transcript_from_json,
@@ -25,24 +44,70 @@ from backend.core.worker.transcription import (
 class TestTranscription:
     """Test class for transcription.py module."""
 
-    def test_ensure_ffmpeg_available(self):
+    def setup_method(self):
+        """Drop the models, directories and ffmpeg check cached by tests."""
+        ensure_ffmpeg.cache_clear()
+        load_model.cache_clear()
+        _recognizer_pool.cache_clear()
+        _installed_models.clear()
+        ensure_dir.cache_clear()
+
+    @mock.patch(
+        "backend.core.worker.transcription.shutil.which",
+        return_value="/usr/bin/ffmpeg",
+    )
+    def test_ensure_ffmpeg_available(self, mock_which):
         """Test ffmpeg check when it is available."""
         with mock.patch("subprocess.run") as mock_run:
             mock_run.return_value.returncode = 0
             assert ensure_ffmpeg() is True
 
-    def test_ensure_ffmpeg_not_available_returncode(self):
+    @mock.patch(
+        "backend.core.worker.transcription.shutil.which",
+        return_value="/usr/bin/ffmpeg",
+    )
+    def test_ensure_ffmpeg_not_available_returncode(self, mock_which):
         """Test ffmpeg check when it returns non-zero code."""
         with mock.patch("subprocess.run") as mock_run:
             mock_run.return_value.returncode = 1
             assert ensure_ffmpeg() is False
 
-    def test_ensure_ffmpeg_not_installed(self):
+    @mock.patch(
+        "backend.core.worker.transcription.shutil.which",
+        return_value="/usr/bin/ffmpeg",
+    )
+    def test_ensure_ffmpeg_not_installed(self, mock_which):
         """Test ffmpeg check when it is not installed."""
         with mock.patch("subprocess.run") as mock_run:
             mock_run.side_effect = FileNotFoundError()
             assert ensure_ffmpeg() is False
 
+    @mock.patch(
+        "backend.core.worker.transcription.shutil.which", return_value=None
+    )
+    def test_ensure_ffmpeg_not_on_path(self, mock_which):
+        """Test the ffmpeg check skips the subprocess without ffmpeg."""
+        with mock.patch("subprocess.run") as mock_run:
+            assert ensure_ffmpeg() is False
+            mock_run.assert_not_called()
+
+    @mock.patch(
+        "backend.core.worker.transcription.shutil.which",
+        return_value="/usr/bin/ffmpeg",
+    )
+    def test_ensure_ffmpeg_cached(self, mock_which):
+        """Test ffmpeg is only checked once per process."""
+        with mock.patch("subprocess.run") as mock_run:
+            mock_run.return_value.returncode = 0
+            assert ensure_ffmpeg() is True
+            assert ensure_ffmpeg() is True
+            mock_run.assert_called_once_with(
+                ["ffmpeg", "-version"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False,
+            )
+
     def test_convert_audio_format_success(self):
         """Test convert_audio_format with successful conversion."""
         with mock.patch("backend.core.worker.transcription.ensure_ffmpeg", return_value=True), \
@@ -53,6 +118,59 @@ class TestTranscription:
             assert result == "output.wav"
             mock_run.assert_called_once()
 
+            # Only the audio stream of video containers is decoded
+            command = mock_run.call_args[0][0]
+            assert {"-vn", "-sn", "-dn"} <= set(command)
+            assert command.index("-vn") > command.index("-i")
+            assert mock_run.call_args[1]["close_fds"] is False
+
+    def test_convert_audio_format_passthrough(self, tmp_path):
+        """Test 16 kHz mono PCM WAV files are returned unconverted."""
+        wav_path = tmp_path / "mono.wav"
+        with wave.open(str(wav_path), "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(16000)
+            wf.writeframes(b"\x00\x00" * 160)
+
+        with mock.patch(
+            "backend.core.worker.transcription.ensure_ffmpeg",
+            return_value=True,
+        ), mock.patch("subprocess.run") as mock_run:
+            assert convert_audio_format(str(wav_path)) == str(wav_path)
+            mock_run.assert_not_called()
+
+            # An explicit output file is always written
+            convert_audio_format(
+                str(wav_path), output_file=str(tmp_path / "out.wav")
+            )
+            mock_run.assert_called_once()
+
+    def test_convert_audio_format_flac(self):
+        """Test FLAC is encoded at the fastest compression level."""
+        with mock.patch(
+            "backend.core.worker.transcription.ensure_ffmpeg",
+            return_value=True,
+        ), mock.patch("subprocess.run") as mock_run:
+            result = convert_audio_format(
+                "input.mp3", output_format="flac", output_file="output.flac"
+            )
+
+            assert result == "output.flac"
+            command = mock_run.call_args[0][0]
+            assert command[command.index("-c:a") + 1] == "flac"
+            assert command[command.index("-compression_level") + 1] == "0"
+            assert command[command.index("-sample_fmt") + 1] == "s16"
+
+    def test_convert_audio_format_unsupported(self):
+        """Test convert_audio_format rejects formats it has no codec for."""
+        with mock.patch("subprocess.run") as mock_run:
+            with pytest.raises(
+                TranscriptionError, match="Unsupported output format: ogg"
+            ):
+                convert_audio_format("input.mp3", output_format="ogg")
+            mock_run.assert_not_called()
+
     def test_convert_audio_format_creates_tempfile(self):
         """Test convert_audio_format creates a temporary file when output_file is None."""
         with mock.patch("backend.core.worker.transcription.ensure_ffmpeg", return_value=True), \
@@ -76,10 +194,17 @@ class TestTranscription:
         """Test convert_audio_format when conversion fails."""
         with mock.patch("backend.core.worker.transcription.ensure_ffmpeg", return_value=True), \
              mock.patch("subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.CalledProcessError(1, "cmd", stderr="Conversion error")
-            
-            with pytest.raises(TranscriptionError, match="Audio conversion failed"):
+            def fail(cmd, stdout, stderr, **kwargs):
+                stderr.write(b"Conversion error")
+                raise subprocess.CalledProcessError(1, cmd)
+            mock_run.side_effect = fail
+
+            with pytest.raises(
+                TranscriptionError,
+                match="Audio conversion failed: Conversion error",
+            ):
                 convert_audio_format("input.mp3")
+            assert mock_run.call_args[1]["stdout"] == subprocess.DEVNULL
 
     @mock.patch("backend.core.worker.transcription.convert_audio_format")
     @mock.patch("backend.core.worker.transcription.get_vosk_model")
@@ -87,8 +212,16 @@ class TestTranscription:
     @mock.patch("backend.core.worker.transcription.Model")
     @mock.patch("backend.core.worker.transcription.KaldiRecognizer")
     @mock.patch("backend.core.worker.transcription.SetLogLevel")
-    def test_transcribe_audio_basic(self, mock_set_log_level, mock_recognizer_cls, mock_model_cls, 
-                                mock_wave_open, mock_get_model, mock_convert):
+    def test_transcribe_audio_basic(
+        self,
+        mock_set_log_level,
+        mock_recognizer_cls,
+        mock_model_cls,
+        mock_wave_open,
+        mock_get_model,
+        mock_convert,
+        tmp_path,
+    ):
         """Test basic transcription functionality."""
         # Mock the wave file operations
         mock_wave_file = mock.MagicMock()
@@ -97,7 +230,6 @@ class TestTranscription:
         mock_wave_file.getcomptype.return_value = "NONE"
         mock_wave_file.getframerate.return_value = 16000
         mock_wave_file.getnframes.return_value = 16000  # 1 second of audio
-        mock_wave_file.readframes.side_effect = [b"data", b""]  # Return data once, then empty
         mock_wave_open.return_value.__enter__.return_value = mock_wave_file
         
         # Mock the recognizer
@@ -121,21 +253,527 @@ class TestTranscription:
         mock_convert.return_value = "test.wav"
         
         with mock.patch("builtins.open", mock.mock_open()) as m_open, \
-             mock.patch("pathlib.Path.mkdir"), \
              mock.patch.object(Path, "exists", return_value=True):
+            m_open.return_value.readinto.return_value = 32000
             with mock.patch.dict('backend.core.worker.transcription.__dict__', {'model_name': mock_model_name}):
-                result = transcribe_audio("test.wav", output_dir="output")
+                result = transcribe_audio("test.wav", output_dir=str(tmp_path))
             
         assert result["success"] is True
         assert "outputs" in result
         assert "transcription" in result["outputs"]
+        mock_wave_open.assert_called_once_with(m_open.return_value, "rb")
+        read_sizes = [
+            len(call.args[0])
+            for call in m_open.return_value.readinto.call_args_list
+        ]
+        assert read_sizes == [32000]  # 1s of 16 kHz audio
+        assert (tmp_path / "test.vtt").read_text() == (
+            "WEBVTT\n\n"
+            "1\n00:00:00.000 --> 00:00:01.000\nhello world\n\n"
+        )
+
+    def test_output_files_existing_dir(self, tmp_path):
+        """Test a directory the caller created is not cached by ensure_dir."""
+        json_file, vtt_file = _output_files(
+            "uploads/test.mp3", str(tmp_path), ["json", "vtt"], False
+        )
+
+        assert json_file == tmp_path / "test.json"
+        assert vtt_file == tmp_path / "test.vtt"
+        assert ensure_dir.cache_info().currsize == 0
+
+    @mock.patch("backend.core.worker.transcription.decode_to_pcm16")
+    @mock.patch("backend.core.worker.transcription.get_vosk_model")
+    @mock.patch("backend.core.worker.transcription.Model")
+    @mock.patch("backend.core.worker.transcription.KaldiRecognizer")
+    @mock.patch("backend.core.worker.transcription.SetLogLevel")
+    def test_transcribe_audio_streams_non_wav(
+        self,
+        mock_set_log_level,
+        mock_recognizer_cls,
+        mock_model_cls,
+        mock_get_model,
+        mock_decode,
+        tmp_path,
+    ):
+        """Test non-WAV input is decoded in memory, without a WAV copy."""
+        mock_decode.return_value = (
+            chunk for chunk in [b"\x00\x01" * 8000, b"\x00\x01" * 10]
+        )
+
+        mock_recognizer = mock.MagicMock()
+        mock_recognizer.AcceptWaveform.return_value = False
+        mock_recognizer.FinalResult.return_value = json.dumps({
+            "result": [{"word": "hello", "start": 0.0, "end": 0.5}]
+        })
+        mock_recognizer_cls.return_value = mock_recognizer
+        mock_get_model.return_value = Path(
+            "/path/to/vosk-model-small-en-us-0.15"
+        )
+
+        with mock.patch(
+            "backend.core.worker.transcription.convert_audio_format"
+        ) as mock_convert:
+            result = transcribe_audio("test.mp3", output_dir=str(tmp_path))
+
+        mock_convert.assert_not_called()
+        mock_decode.assert_called_once_with("test.mp3", 16000)
+        mock_recognizer_cls.assert_called_once_with(
+            mock_model_cls.return_value, 16000
+        )
+        assert mock_recognizer.AcceptWaveform.call_args_list == [
+            mock.call(b"\x00\x01" * 8000), mock.call(b"\x00\x01" * 10)
+        ]
+        assert result["model"] == "vosk-model-small-en-us-0.15"
+        assert result["outputs"]["transcription"]["text"] == "hello"
+
+        # The JSON output is written indented and reads back to the same
+        # transcription
+        json_text = Path(result["outputs"]["json"]).read_text()
+        assert json_text.startswith('{\n  "text": "hello"')
+        assert json.loads(json_text) == result["outputs"]["transcription"]
+
+    @mock.patch("backend.core.worker.transcription.decode_to_pcm16")
+    @mock.patch("backend.core.worker.transcription.get_vosk_model")
+    @mock.patch("backend.core.worker.transcription.Model")
+    @mock.patch("backend.core.worker.transcription.KaldiRecognizer")
+    @mock.patch("backend.core.worker.transcription.SetLogLevel")
+    def test_transcribe_audio_decodes_stereo_wav(
+        self,
+        mock_set_log_level,
+        mock_recognizer_cls,
+        mock_model_cls,
+        mock_get_model,
+        mock_decode,
+        tmp_path,
+    ):
+        """Test WAV files other than 16-bit mono PCM are decoded."""
+        wav_path = tmp_path / "stereo.wav"
+        with wave.open(str(wav_path), "wb") as wf:
+            wf.setnchannels(2)
+            wf.setsampwidth(2)
+            wf.setframerate(44100)
+            wf.writeframes(b"\x00\x00" * 2 * 441)
+
+        mock_decode.return_value = (chunk for chunk in [b"\x00\x01" * 10])
+        mock_recognizer = mock.MagicMock()
+        mock_recognizer.AcceptWaveform.return_value = False
+        mock_recognizer.FinalResult.return_value = json.dumps({"result": []})
+        mock_recognizer_cls.return_value = mock_recognizer
+        mock_get_model.return_value = Path(
+            "/path/to/vosk-model-small-en-us-0.15"
+        )
+
+        result = transcribe_audio(str(wav_path), output_dir=str(tmp_path))
+
+        mock_decode.assert_called_once_with(str(wav_path), 16000)
+        mock_recognizer_cls.assert_called_once_with(
+            mock_model_cls.return_value, 16000
+        )
+        assert result["success"] is True
+
+    @mock.patch("backend.core.worker.transcription.decode_to_pcm16")
+    @mock.patch("backend.core.worker.transcription.get_vosk_model")
+    @mock.patch("backend.core.worker.transcription.Model")
+    @mock.patch("backend.core.worker.transcription.KaldiRecognizer")
+    def test_transcribe_audio_resamples_wav(
+        self,
+        mock_recognizer_cls,
+        mock_model_cls,
+        mock_get_model,
+        mock_decode,
+        tmp_path,
+    ):
+        """Test PCM WAV files at another rate are resampled to 16 kHz."""
+        wav_path = tmp_path / "phone.wav"
+        with wave.open(str(wav_path), "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(8000)
+            wf.writeframes(b"\x00\x00" * 800)
+
+        mock_decode.return_value = (chunk for chunk in [b"\x00\x01" * 10])
+        mock_recognizer_cls.return_value.AcceptWaveform.return_value = False
+        mock_recognizer_cls.return_value.FinalResult.return_value = json.dumps(
+            {"result": []}
+        )
+        mock_get_model.return_value = Path(
+            "/path/to/vosk-model-small-en-us-0.15"
+        )
+
+        transcribe_audio(str(wav_path), output_dir=str(tmp_path))
+
+        mock_decode.assert_called_once_with(str(wav_path), 16000)
+        mock_recognizer_cls.assert_called_once_with(
+            mock_model_cls.return_value, 16000
+        )
+
+    @mock.patch("backend.core.worker.transcription.get_vosk_model")
+    @mock.patch("backend.core.worker.transcription.Model")
+    @mock.patch("backend.core.worker.transcription.KaldiRecognizer")
+    def test_transcribe_audio_reads_wav_samples(
+        self, mock_recognizer_cls, mock_model_cls, mock_get_model, tmp_path
+    ):
+        """Test PCM WAV samples are read in chunks into a reused buffer."""
+        samples = bytes(range(256)) * 160  # 20480 frames
+        wav_path = tmp_path / "mono.wav"
+        with wave.open(str(wav_path), "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(16000)
+            wf.writeframes(samples)
+
+        received = []
+        mock_recognizer = mock.MagicMock()
+        mock_recognizer.AcceptWaveform.side_effect = (
+            lambda data: received.append(bytes(_ffi.buffer(data))) and False
+        )
+        mock_recognizer.FinalResult.return_value = json.dumps({"result": []})
+        mock_recognizer_cls.return_value = mock_recognizer
+        mock_get_model.return_value = Path(
+            "/path/to/vosk-model-small-en-us-0.15"
+        )
+
+        result = transcribe_audio(str(wav_path), output_dir=str(tmp_path))
+
+        assert result["success"] is True
+        assert received == [samples[:32000], samples[32000:]]
+
+    class _FakeRecognizer:
+        """Recognizer hearing a word every 0.1s of the audio it is fed."""
+
+        def __init__(self, model, rate):
+            self.frames = 0
+
+        def SetWords(self, words):
+            pass
+
+        def Reset(self):
+            self.frames = 0
+
+        def AcceptWaveform(self, data):
+            self.frames += len(_ffi.buffer(data)) // 2
+            return False
+
+        def FinalResult(self):
+            duration = self.frames / 16000
+            starts = [k * 0.1 + 0.05 for k in range(int(duration * 10) + 1)]
+            return json.dumps(
+                {
+                    "result": [
+                        {"word": "w", "start": t, "end": t + 0.04}
+                        for t in starts
+                        if t < duration
+                    ]
+                }
+            )
+
+    @mock.patch("backend.core.worker.transcription.PARALLEL_CHUNK_SECONDS", 1)
+    @mock.patch("backend.core.worker.transcription.CHUNK_OVERLAP_SECONDS", 0.2)
+    @mock.patch("backend.core.worker.transcription.Model")
+    @mock.patch("backend.core.worker.transcription.KaldiRecognizer")
+    def test_recognize_words_parallel_chunks(
+        self, mock_recognizer_cls, mock_model_cls, tmp_path
+    ):
+        """Test long WAV files are recognized in overlapping chunks."""
+        mock_recognizer_cls.side_effect = self._FakeRecognizer
+        wav_path = tmp_path / "long.wav"
+        with wave.open(str(wav_path), "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(16000)
+            wf.writeframes(b"\x00\x00" * 40000)  # 2.5s, three chunks
+
+        words = recognize_words(str(wav_path), "/path/to/model", num_workers=2)
+
+        # One word every 0.1s, none lost or duplicated at the chunk boundaries
+        assert [round(word["start"], 2) for word in words] == [
+            round(k * 0.1 + 0.05, 2) for k in range(25)
+        ]
+        mock_model_cls.assert_called_once_with("/path/to/model")
+        assert mock_recognizer_cls.call_count <= 2
+
+    @mock.patch("backend.core.worker.transcription.PARALLEL_CHUNK_SECONDS", 1)
+    @mock.patch("backend.core.worker.transcription.Model")
+    @mock.patch("backend.core.worker.transcription.KaldiRecognizer")
+    def test_recognize_words_single_worker(
+        self, mock_recognizer_cls, mock_model_cls, tmp_path
+    ):
+        """Test a single worker recognizes long WAV files in one stream."""
+        mock_recognizer_cls.side_effect = self._FakeRecognizer
+        wav_path = tmp_path / "long.wav"
+        with wave.open(str(wav_path), "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(16000)
+            wf.writeframes(b"\x00\x00" * 40000)
+
+        with mock.patch(
+            "concurrent.futures.ThreadPoolExecutor"
+        ) as mock_executor:
+            words = recognize_words(
+                str(wav_path), "/path/to/model", num_workers=1
+            )
+
+        mock_executor.assert_not_called()
+        assert len(words) == 25
+
+    @mock.patch("backend.core.worker.transcription.decode_to_pcm16")
+    @mock.patch("backend.core.worker.transcription.get_vosk_model")
+    @mock.patch("backend.core.worker.transcription.Model")
+    @mock.patch("backend.core.worker.transcription.KaldiRecognizer")
+    def test_transcribe_audio_async(
+        self,
+        mock_recognizer_cls,
+        mock_model_cls,
+        mock_get_model,
+        mock_decode,
+        tmp_path,
+    ):
+        """Test the async variant writes the same outputs."""
+        mock_recognizer = mock.MagicMock()
+        mock_recognizer.AcceptWaveform.return_value = False
+        mock_recognizer.FinalResult.return_value = json.dumps({
+            "result": [{"word": "hello", "start": 0.0, "end": 0.5}]
+        })
+        mock_recognizer_cls.return_value = mock_recognizer
+        mock_get_model.return_value = Path(
+            "/path/to/vosk-model-small-en-us-0.15"
+        )
+
+        mock_decode.return_value = (chunk for chunk in [b"\x00\x01" * 10])
+        expected = transcribe_audio(
+            "test.mp3", output_dir=str(tmp_path / "sync")
+        )
+        mock_decode.return_value = (chunk for chunk in [b"\x00\x01" * 10])
+        result = asyncio.run(
+            transcribe_audio_async(
+                "test.mp3", output_dir=str(tmp_path / "async")
+            )
+        )
+
+        assert (
+            result["outputs"]["transcription"]
+            == expected["outputs"]["transcription"]
+        )
+        for fmt in ("json", "vtt"):
+            assert Path(result["outputs"][fmt]).parent == tmp_path / "async"
+            assert (
+                Path(result["outputs"][fmt]).read_text()
+                == Path(expected["outputs"][fmt]).read_text()
+            )
+
+    @mock.patch("backend.core.worker.transcription.get_vosk_model")
+    def test_transcribe_audio_async_model_error(
+        self, mock_get_model, tmp_path
+    ):
+        """Test the async variant raises when the model is missing."""
+        mock_get_model.side_effect = RuntimeError("no model")
+
+        with pytest.raises(
+            TranscriptionError, match="Could not obtain Vosk model: no model"
+        ):
+            asyncio.run(
+                transcribe_audio_async("test.mp3", output_dir=str(tmp_path))
+            )
+
+    def test_decode_to_pcm16_pyav(self):
+        """Test decode_to_pcm16 resamples with PyAV into fixed-size chunks."""
+        def resampled(samples, padding=0):
+            frame = mock.MagicMock(samples=samples)
+            frame.planes = [b"\x01\x00" * samples + b"\xff" * padding]
+            return frame
+
+        mock_av = mock.MagicMock()
+        container = mock_av.open.return_value.__enter__.return_value
+        container.decode.return_value = iter(["frame1", "frame2"])
+        mock_resampler = mock_av.AudioResampler.return_value
+        mock_resampler.resample.side_effect = [
+            [resampled(6, padding=4)],  # frame1, with plane padding to drop
+            [resampled(3)],              # frame2
+            [resampled(2)],              # flush
+        ]
+
+        with mock.patch("backend.core.worker.transcription.av", mock_av):
+            chunks = list(decode_to_pcm16("input.mp3", chunk_size=8))
+
+        mock_av.AudioResampler.assert_called_once_with(
+            format="s16", layout="mono", rate=16000
+        )
+        container.decode.assert_called_once_with(audio=0)
+        assert mock_resampler.resample.call_args_list[-1] == mock.call(None)
+        assert b"".join(chunks) == b"\x01\x00" * 11
+        assert [len(chunk) for chunk in chunks] == [8, 8, 6]
+
+    @mock.patch("backend.core.worker.transcription.av", None)
+    @mock.patch("backend.core.worker.transcription.decode_audio_stream")
+    def test_decode_to_pcm16_ffmpeg_fallback(self, mock_decode):
+        """Test decode_to_pcm16 reads an ffmpeg pipe without PyAV."""
+        mock_pcm = io.BufferedReader(io.BytesIO(b"\x00\x01" * 16001))
+        mock_decode.return_value.__enter__.return_value = mock_pcm
+
+        # Chunks share one buffer, copy each before reading the next
+        chunks = [
+            bytes(_ffi.buffer(chunk)) for chunk in decode_to_pcm16("input.mp3")
+        ]
+
+        mock_decode.assert_called_once_with("input.mp3", 16000)
+        assert chunks == [
+            b"\x00\x01" * 16000,
+            b"\x00\x01",
+        ]  # 1s of 16-bit mono audio at a time
+
+    @mock.patch("backend.core.worker.transcription.Model")
+    def test_load_model_cached(self, mock_model_cls):
+        """Test load_model loads each model only once per process."""
+        first = load_model("/path/to/model")
+        second = load_model("/path/to/model")
+
+        assert first is second
+        mock_model_cls.assert_called_once_with("/path/to/model")
+
+    @mock.patch("backend.core.worker.transcription.Model")
+    def test_load_model_cache_bounded(self, mock_model_cls):
+        """Test only the most recently used models are kept loaded."""
+        mock_model_cls.side_effect = lambda path: mock.MagicMock()
+        first = load_model("/models/0")
+        for i in range(1, MODEL_CACHE_SIZE + 1):
+            load_model(f"/models/{i}")
+
+        assert load_model("/models/0") is not first
+        assert mock_model_cls.call_count == MODEL_CACHE_SIZE + 2
+
+    @mock.patch("backend.core.worker.transcription.Model")
+    @mock.patch("backend.core.worker.transcription.KaldiRecognizer")
+    @mock.patch("backend.core.worker.transcription.SetLogLevel")
+    def test_acquire_recognizer_reused(
+        self, mock_set_log_level, mock_recognizer_cls, mock_model_cls
+    ):
+        """Test recognizers are pooled and reset for every new stream."""
+        mock_recognizer_cls.side_effect = lambda model, rate: mock.MagicMock()
+        with acquire_recognizer("/path/to/model", 16000) as first:
+            pass
+        with acquire_recognizer("/path/to/model", 16000) as second:
+            pass
+        with acquire_recognizer("/path/to/model", 8000) as other_rate:
+            pass
+
+        assert first is second
+        assert mock_recognizer_cls.call_args_list == [
+            mock.call(mock_model_cls.return_value, 16000),
+            mock.call(mock_model_cls.return_value, 8000),
+        ]
+        mock_model_cls.assert_called_once_with("/path/to/model")
+        assert other_rate is not first
+        first.SetWords.assert_called_once_with(True)
+        assert first.Reset.call_count == 2
+
+    @mock.patch("backend.core.worker.transcription.Model")
+    @mock.patch("backend.core.worker.transcription.KaldiRecognizer")
+    def test_acquire_recognizer_concurrent(
+        self, mock_recognizer_cls, mock_model_cls
+    ):
+        """Test concurrent streams each get their own recognizer."""
+        mock_recognizer_cls.side_effect = lambda model, rate: mock.MagicMock()
+        with acquire_recognizer("/path/to/model", 16000) as first:
+            with acquire_recognizer("/path/to/model", 16000) as second:
+                assert first is not second
+
+        with acquire_recognizer("/path/to/model", 16000) as third:
+            assert third in (first, second)
+        assert mock_recognizer_cls.call_count == 2
+
+    def test_decode_audio_stream(self):
+        """Test decode_audio_stream yields ffmpeg's stdout as raw PCM."""
+        with mock.patch("subprocess.Popen") as mock_popen:
+            mock_popen.return_value.wait.return_value = 0
+            with decode_audio_stream("input.mp3") as pcm:
+                assert pcm is mock_popen.return_value.stdout
+
+            command = mock_popen.call_args[0][0]
+            assert command[command.index("-f") + 1] == "s16le"
+            assert command[command.index("-ar") + 1] == "16000"
+            assert command[-1] == "pipe:1"
+            assert {"-vn", "-sn", "-dn"} <= set(command)
+            assert mock_popen.call_args[1]["bufsize"] == 1024 * 1024
+            assert mock_popen.call_args[1]["close_fds"] is False
+            mock_popen.return_value.stdout.close.assert_called_once()
+
+    def test_decode_audio_stream_fails(self):
+        """Test decode_audio_stream raises when ffmpeg exits with an error."""
+        with mock.patch("subprocess.Popen") as mock_popen:
+            mock_popen.return_value.wait.return_value = 1
+            with pytest.raises(TranscriptionError):
+                with decode_audio_stream("input.mp3"):
+                    pass
+
+    def test_decode_audio_stream_ffmpeg_not_installed(self):
+        """Test decode_audio_stream when ffmpeg is not installed."""
+        with mock.patch("subprocess.Popen", side_effect=FileNotFoundError):
+            with pytest.raises(TranscriptionError):
+                with decode_audio_stream("input.mp3"):
+                    pass
         
+    def test_group_words_into_segments(self):
+        """Test words are split into segments at pauses longer than 0.3s."""
+        words = [
+            {"word": "hello", "start": 0.0, "end": 0.4},
+            {"word": "there", "start": 0.5, "end": 0.9},
+            {"word": "general", "start": 1.5, "end": 1.9},
+            {"word": "kenobi", "start": 2.0, "end": 2.5004},
+        ]
+
+        assert group_words_into_segments(words) == [
+            {"id": 0, "start": 0.0, "end": 0.9, "text": "hello there"},
+            {"id": 1, "start": 1.5, "end": 2.5, "text": "general kenobi"},
+        ]
+
+    def test_group_words_into_segments_empty(self):
+        """Test no segments are built without words."""
+        assert group_words_into_segments([]) == []
+
+    def test_format_vtt_timestamp(self):
+        """Test timestamps always carry hours and exactly three decimals."""
+        assert format_vtt_timestamp(0) == "00:00:00.000"
+        assert format_vtt_timestamp(1.5) == "00:00:01.500"
+        assert format_vtt_timestamp(61.0004) == "00:01:01.000"
+        assert format_vtt_timestamp(59.9996) == "00:01:00.000"
+        assert format_vtt_timestamp(3723.45) == "01:02:03.450"
+        assert format_vtt_timestamp(36000) == "10:00:00.000"
+
+    def test_recognizer_threads_follow_worker_share(self):
+        """Test thread counts follow the worker's share of the cores."""
+        result = subprocess.run(
+            [
+                sys.executable, "-c",
+                "from backend.core.worker import transcription as t; "
+                "print(t.RECOGNIZER_THREADS, t.EXTRACT_THREADS)",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "WORKER_CPUS": "2"},
+        )
+        assert result.stdout.split() == ["2", "2"]
+
     def test_get_vosk_model_exists(self):
         """Test get_vosk_model when model exists."""
         with mock.patch("pathlib.Path.exists", return_value=True):
             result = get_vosk_model()
             assert "vosk-model-small-en-us" in str(result)
 
+    def test_get_vosk_model_exists_cached(self):
+        """Test an installed model is only looked up on disk once."""
+        with mock.patch(
+            "pathlib.Path.exists", return_value=True
+        ) as mock_exists, mock.patch("pathlib.Path.mkdir") as mock_mkdir:
+            first = get_vosk_model()
+            second = get_vosk_model()
+
+        assert first == second
+        mock_exists.assert_called_once()
+        mock_mkdir.assert_called_once()
+
     @mock.patch("backend.core.worker.transcription.download_vosk_model")
     def test_get_vosk_model_download(self, mock_download):
         """Test get_vosk_model when model needs to be downloaded."""
@@ -167,6 +805,255 @@ class TestTranscription:
         # Verify return type annotation
         assert sig.return_annotation == Path
 
+    def test_download_vosk_model_extracts_stream(self, tmp_path):
+        """Test the archive is extracted from the response stream."""
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr(
+                "vosk-model-test/conf/model.conf", "--sample-frequency=16000"
+            )
+        archive.seek(0)
+
+        with mock.patch(
+            "backend.core.worker.transcription.requests.head"
+        ) as mock_head, mock.patch(
+            "backend.core.worker.transcription.requests.get"
+        ) as mock_get:
+            mock_head.return_value.headers = {
+                "Content-Length": str(len(archive.getvalue()))
+            }
+            mock_get.return_value.__enter__.return_value = (
+                mock_get.return_value
+            )
+            mock_get.return_value.raw = archive
+            result = download_vosk_model(
+                "https://example.com/model.zip", "vosk-model-test", tmp_path
+            )
+
+        mock_get.assert_called_once_with(
+            "https://example.com/model.zip", stream=True
+        )
+        assert mock_get.return_value.raw.decode_content is True
+        mock_get.return_value.__exit__.assert_called_once()
+        assert result == tmp_path / "vosk-model-test"
+        assert (
+            result / "conf" / "model.conf"
+        ).read_text() == "--sample-frequency=16000"
+        assert sorted(os.listdir(tmp_path)) == ["vosk-model-test"]
+
+    @mock.patch("backend.core.worker.transcription.EXTRACT_THREADS", 4)
+    def test_download_vosk_model_extracts_in_parallel(self, tmp_path):
+        """Test archives are extracted by several threads."""
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+            for i in range(20):
+                zf.writestr(
+                    f"vosk-model-test/graph/part{i}/data.bin",
+                    bytes([i]) * 100000,
+                )
+        archive.seek(0)
+
+        with mock.patch(
+            "backend.core.worker.transcription.requests.head"
+        ) as mock_head, mock.patch(
+            "backend.core.worker.transcription.requests.get"
+        ) as mock_get, mock.patch(
+            "concurrent.futures.ThreadPoolExecutor",
+            wraps=concurrent.futures.ThreadPoolExecutor,
+        ) as mock_executor:
+            mock_head.return_value.headers = {}
+            mock_get.return_value.__enter__.return_value = (
+                mock_get.return_value
+            )
+            mock_get.return_value.raw = archive
+            result = download_vosk_model(
+                "https://example.com/model.zip", "vosk-model-test", tmp_path
+            )
+
+        mock_executor.assert_called_once_with(max_workers=4)
+        for i in range(20):
+            assert (
+                result / "graph" / f"part{i}" / "data.bin"
+            ).read_bytes() == bytes([i]) * 100000
+
+    def test_download_vosk_model_missing_model(self, tmp_path):
+        """Test an archive without the model leaves nothing behind."""
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("other-model/conf/model.conf", "")
+        archive.seek(0)
+
+        with mock.patch(
+            "backend.core.worker.transcription.requests.head"
+        ) as mock_head, mock.patch(
+            "backend.core.worker.transcription.requests.get"
+        ) as mock_get:
+            mock_head.return_value.headers = {}
+            mock_get.return_value.__enter__.return_value = (
+                mock_get.return_value
+            )
+            mock_get.return_value.raw = archive
+            with pytest.raises(
+                TranscriptionError, match="Model extraction failed"
+            ):
+                download_vosk_model(
+                    "https://example.com/model.zip",
+                    "vosk-model-test",
+                    tmp_path,
+                )
+
+        assert os.listdir(tmp_path) == []
+
+    def test_download_vosk_model_installed_concurrently(self, tmp_path):
+        """Test a model installed concurrently by another process is kept."""
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("vosk-model-test/conf/model.conf", "new")
+        archive.seek(0)
+        (tmp_path / "vosk-model-test" / "conf").mkdir(parents=True)
+        (tmp_path / "vosk-model-test" / "conf" / "model.conf").write_text(
+            "installed"
+        )
+
+        with mock.patch(
+            "backend.core.worker.transcription.requests.head"
+        ) as mock_head, mock.patch(
+            "backend.core.worker.transcription.requests.get"
+        ) as mock_get:
+            mock_head.return_value.headers = {}
+            mock_get.return_value.__enter__.return_value = (
+                mock_get.return_value
+            )
+            mock_get.return_value.raw = archive
+            result = download_vosk_model(
+                "https://example.com/model.zip", "vosk-model-test", tmp_path
+            )
+
+        assert (result / "conf" / "model.conf").read_text() == "installed"
+        assert os.listdir(tmp_path) == ["vosk-model-test"]
+
+    def test_download_vosk_model_bad_archive(self, tmp_path):
+        """Test a corrupt archive raises TranscriptionError."""
+        with mock.patch(
+            "backend.core.worker.transcription.requests.head"
+        ) as mock_head, mock.patch(
+            "backend.core.worker.transcription.requests.get"
+        ) as mock_get:
+            mock_head.return_value.headers = {}
+            mock_get.return_value.__enter__.return_value = (
+                mock_get.return_value
+            )
+            mock_get.return_value.raw = io.BytesIO(b"not a zip file")
+            with pytest.raises(
+                TranscriptionError, match="Failed to download or extract model"
+            ):
+                download_vosk_model(
+                    "https://example.com/model.zip",
+                    "vosk-model-test",
+                    tmp_path,
+                )
+
+    @staticmethod
+    def _range_server(content, interrupt_once=False, ranges=True):
+        """Build a fake requests.get serving content, maybe in ranges."""
+        requested = []
+
+        def get(url, headers=None, stream=False):
+            response = mock.MagicMock()
+            response.__enter__.return_value = response
+            range_header = (headers or {}).get("Range")
+            requested.append(range_header)
+            if range_header is None or not ranges:
+                response.status_code = 200
+                response.raw = io.BytesIO(content)
+                return response
+
+            first, last = range_header[len("bytes="):].split("-")
+            start, end = int(first), int(last)
+            body = content[start:end + 1]
+            response.status_code = 206
+
+            def iter_content(chunk_size):
+                if (
+                    interrupt_once
+                    and start == 0
+                    and requested.count(range_header) == 1
+                ):
+                    yield body[:10]
+                    raise requests.exceptions.ConnectionError(
+                        "connection reset"
+                    )
+                yield body
+            response.iter_content.side_effect = iter_content
+            return response
+
+        return get, requested
+
+    def _model_archive(self):
+        """Build a small model archive."""
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr(
+                "vosk-model-test/conf/model.conf",
+                "--sample-frequency=16000" * 100,
+            )
+        return archive.getvalue()
+
+    @mock.patch("backend.core.worker.transcription.MODEL_SPOOL_SIZE", 0)
+    def test_download_vosk_model_parallel_ranges(self, tmp_path):
+        """Test large archives are fetched in resumable byte ranges."""
+        content = self._model_archive()
+        get, requested = self._range_server(content, interrupt_once=True)
+
+        with mock.patch(
+            "backend.core.worker.transcription.requests.head"
+        ) as mock_head, mock.patch(
+            "backend.core.worker.transcription.requests.get", side_effect=get
+        ):
+            mock_head.return_value.headers = {
+                "Content-Length": str(len(content)),
+                "Accept-Ranges": "bytes",
+            }
+            result = download_vosk_model(
+                "https://example.com/model.zip", "vosk-model-test", tmp_path
+            )
+
+        assert (
+            result / "conf" / "model.conf"
+        ).read_text() == "--sample-frequency=16000" * 100
+        part_size = -(-len(content) // 4)
+        assert sorted(
+            requested, key=lambda header: int(header[6:].split("-")[0])
+        ) == [
+            f"bytes=0-{part_size - 1}",
+            f"bytes=10-{part_size - 1}",
+            f"bytes={part_size}-{2 * part_size - 1}",
+            f"bytes={2 * part_size}-{3 * part_size - 1}",
+            f"bytes={3 * part_size}-{len(content) - 1}",
+        ]
+
+    @mock.patch("backend.core.worker.transcription.MODEL_SPOOL_SIZE", 0)
+    def test_download_vosk_model_ranges_ignored(self, tmp_path):
+        """Test the download falls back to one stream without ranges."""
+        content = self._model_archive()
+        get, requested = self._range_server(content, ranges=False)
+
+        with mock.patch(
+            "backend.core.worker.transcription.requests.head"
+        ) as mock_head, mock.patch(
+            "backend.core.worker.transcription.requests.get", side_effect=get
+        ):
+            mock_head.return_value.headers = {
+                "Content-Length": str(len(content)),
+                "Accept-Ranges": "bytes",
+            }
+            result = download_vosk_model(
+                "https://example.com/model.zip", "vosk-model-test", tmp_path
+            )
+
+        assert (result / "conf" / "model.conf").exists()
+        assert requested[-1] is None
+
     def test_extract_transcript_from_json(self):
         """Test extract_transcript_from_json function."""
         # Create a temporary JSON file
@@ -185,6 +1072,26 @@ class TestTranscription:
             # Clean up temp file
             os.unlink(temp_path)
 
+    def test_extract_transcript_from_json_segments(self, tmp_path):
+        """Test segments are joined when the JSON has no text field."""
+        json_path = tmp_path / "transcript.json"
+        json_path.write_text(
+            json.dumps(
+                {
+                    "segments": [
+                        {"id": 0, "text": "hello there"},
+                        {"id": 1},
+                        {"id": 2, "text": "general kenobi"},
+                    ]
+                }
+            )
+        )
+
+        assert (
+            extract_transcript_from_json(str(json_path))
+            == "hello there general kenobi"
+        )
+
     def test_extract_transcript_from_json_invalid(self):
         """Test extract_transcript_from_json with invalid JSON."""
         # Create invalid JSON file
@@ -1,62 +1,175 @@
 """Tests for worker.py module."""
 import argparse
+import os
 from unittest import mock
 
 import pytest
-from rq import Worker, Connection
+from rq import Worker
 
-from backend.core.worker.worker import run_worker
+from backend.core.worker.worker import (
+    DEFAULT_NUM_WORKERS,
+    ModelPreloadingWorker,
+    run_worker,
+)
 
 
 class TestWorker:
     """Test class for worker.py module."""
 
     @mock.patch("backend.core.worker.worker.get_redis_connection")
-    @mock.patch("backend.core.worker.worker.Worker")
-    @mock.patch("backend.core.worker.worker.Connection")
-    def test_run_worker_default_queue(self, mock_connection, mock_worker_cls, mock_get_redis):
+    @mock.patch("backend.core.worker.worker.ModelPreloadingWorker")
+    def test_run_worker_default_queue(self, mock_worker_cls, mock_get_redis):
         """Test run_worker with default queue name."""
         # Setup mocks
         mock_redis_conn = mock.MagicMock()
         mock_get_redis.return_value = mock_redis_conn
         
-        mock_connection_ctx = mock.MagicMock()
-        mock_connection.return_value = mock_connection_ctx
-        
         mock_worker = mock.MagicMock()
         mock_worker_cls.return_value = mock_worker
         
-        # Call function
-        run_worker()
+        # Call function with a single worker process
+        with mock.patch.dict(os.environ, {"RQ_WORKERS": "1"}, clear=True):
+            run_worker()
         
         # Verify
         mock_get_redis.assert_called_once()
-        mock_connection.assert_called_once_with(mock_redis_conn)
-        mock_worker_cls.assert_called_once_with(["transcription"])
-        mock_worker.work.assert_called_once_with(with_scheduler=True)
+        mock_worker_cls.assert_called_once_with(
+            ["transcription"], connection=mock_redis_conn
+        )
+        mock_worker.work.assert_called_once_with(
+            with_scheduler=True, burst=False
+        )
 
     @mock.patch("backend.core.worker.worker.get_redis_connection")
-    @mock.patch("backend.core.worker.worker.Worker")
-    @mock.patch("backend.core.worker.worker.Connection")
-    def test_run_worker_custom_queues(self, mock_connection, mock_worker_cls, mock_get_redis):
+    @mock.patch("backend.core.worker.worker.ModelPreloadingWorker")
+    def test_run_worker_custom_queues(self, mock_worker_cls, mock_get_redis):
         """Test run_worker with custom queue names."""
         # Setup mocks
         mock_redis_conn = mock.MagicMock()
         mock_get_redis.return_value = mock_redis_conn
         
-        mock_connection_ctx = mock.MagicMock()
-        mock_connection.return_value = mock_connection_ctx
-        
         mock_worker = mock.MagicMock()
         mock_worker_cls.return_value = mock_worker
         
         # Call function with custom queue names
         custom_queues = ["high", "low"]
-        run_worker(queue_names=custom_queues)
+        run_worker(queue_names=custom_queues, num_workers=1, burst=False)
         
         # Verify
-        mock_worker_cls.assert_called_once_with(custom_queues)
-        mock_worker.work.assert_called_once_with(with_scheduler=True)
+        mock_worker_cls.assert_called_once_with(
+            custom_queues, connection=mock_redis_conn
+        )
+        mock_worker.work.assert_called_once_with(
+            with_scheduler=True, burst=False
+        )
+
+    @mock.patch("backend.core.worker.worker.get_redis_connection")
+    @mock.patch("backend.core.worker.worker.WorkerPool")
+    @mock.patch("backend.core.worker.worker.ModelPreloadingWorker")
+    def test_run_worker_pool(
+        self, mock_worker_cls, mock_pool_cls, mock_get_redis
+    ):
+        """Test run_worker starts a worker pool sized from RQ_WORKERS."""
+        mock_redis_conn = mock.MagicMock()
+        mock_get_redis.return_value = mock_redis_conn
+
+        with mock.patch.dict(os.environ, {"RQ_WORKERS": "4"}, clear=True):
+            run_worker()
+
+        mock_pool_cls.assert_called_once_with(
+            ["transcription"],
+            connection=mock_redis_conn,
+            num_workers=4,
+            worker_class=mock_worker_cls,
+        )
+        mock_pool_cls.return_value.start.assert_called_once_with(burst=False)
+        mock_worker_cls.assert_not_called()
+
+    @mock.patch("backend.core.worker.worker.get_redis_connection")
+    @mock.patch("backend.core.worker.worker.WorkerPool")
+    @mock.patch("backend.core.worker.worker.ModelPreloadingWorker")
+    def test_run_worker_burst(
+        self, mock_worker_cls, mock_pool_cls, mock_get_redis
+    ):
+        """Test RQ_BURST makes the worker or pool exit when queues empty."""
+        with mock.patch.dict(os.environ, {"RQ_BURST": "1"}, clear=True):
+            run_worker(num_workers=1)
+            run_worker(num_workers=2)
+
+        mock_worker_cls.return_value.work.assert_called_once_with(
+            with_scheduler=True, burst=True
+        )
+        mock_pool_cls.return_value.start.assert_called_once_with(burst=True)
+
+    @mock.patch("backend.core.worker.worker.get_redis_connection")
+    @mock.patch("backend.core.worker.worker.WorkerPool")
+    def test_run_worker_pool_default_size(self, mock_pool_cls, mock_get_redis):
+        """Test run_worker defaults to DEFAULT_NUM_WORKERS processes."""
+        with mock.patch.dict(os.environ, {}, clear=True), \
+             mock.patch("backend.core.worker.worker.DEFAULT_NUM_WORKERS", 4):
+            run_worker()
+
+        _, kwargs = mock_pool_cls.call_args
+        assert kwargs["num_workers"] == 4
+
+    @mock.patch("backend.core.worker.worker.get_redis_connection")
+    @mock.patch("backend.core.worker.worker.WorkerPool")
+    @mock.patch("backend.core.worker.worker.os.cpu_count", return_value=8)
+    def test_run_worker_pool_omp_threads(
+        self, mock_cpu_count, mock_pool_cls, mock_get_redis
+    ):
+        """Test the cores are split between workers unless already set."""
+        with mock.patch.dict(os.environ, {}, clear=True):
+            run_worker(num_workers=4)
+            assert os.environ["WORKER_CPUS"] == "2"
+            assert os.environ["OMP_NUM_THREADS"] == "2"
+
+        with mock.patch.dict(os.environ, {"OMP_NUM_THREADS": "3"}, clear=True):
+            run_worker(num_workers=4)
+            assert os.environ["WORKER_CPUS"] == "2"
+            assert os.environ["OMP_NUM_THREADS"] == "3"
+
+        with mock.patch.dict(os.environ, {"WORKER_CPUS": "1"}, clear=True):
+            run_worker(num_workers=4)
+            assert os.environ["OMP_NUM_THREADS"] == "1"
+
+    def test_default_num_workers(self):
+        """Test the default pool size is one worker per physical core."""
+        assert DEFAULT_NUM_WORKERS == max(1, (os.cpu_count() or 2) // 2)
+
+    @mock.patch("backend.core.worker.transcription", create=True)
+    @mock.patch.object(Worker, "work")
+    def test_model_preloading_worker(self, mock_work, mock_transcription):
+        """Test the worker loads the Vosk model once before taking jobs."""
+        mock_transcription.get_vosk_model.return_value = "/path/to/model"
+        worker = ModelPreloadingWorker(
+            ["transcription"], connection=mock.MagicMock()
+        )
+
+        worker.work(with_scheduler=True)
+
+        mock_transcription.get_vosk_model.assert_called_once_with("small")
+        mock_transcription.acquire_recognizer.assert_called_once_with(
+            "/path/to/model", mock_transcription.PCM_SAMPLE_RATE
+        )
+        mock_work.assert_called_once_with(with_scheduler=True)
+
+    @mock.patch("backend.core.worker.transcription", create=True)
+    @mock.patch.object(Worker, "work")
+    def test_model_preloading_worker_load_fails(
+        self, mock_work, mock_transcription
+    ):
+        """Test the worker still starts when the model cannot be preloaded."""
+        mock_transcription.get_vosk_model.side_effect = Exception(
+            "download failed"
+        )
+        worker = ModelPreloadingWorker(
+            ["transcription"], connection=mock.MagicMock()
+        )
+
+        worker.work()
+
+        mock_work.assert_called_once_with()
 
     @mock.patch("backend.core.worker.worker.argparse.ArgumentParser")
     @mock.patch("backend.core.worker.worker.run_worker")
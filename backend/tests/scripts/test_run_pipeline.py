@@ -1,11 +1,14 @@
 """Tests for run_pipeline.py module."""
+import os
 import signal
+import subprocess
 import sys
 import time
 from unittest import mock
 
 import pytest
 
+import backend.scripts.run_pipeline
 from backend.scripts.run_pipeline import (
     signal_handler,
     stop_all_processes,
@@ -25,11 +28,13 @@ class TestRunPipeline:
         """Set up test environment for each test."""
         # Clear global processes dict before each test
         processes.clear()
+        backend.scripts.run_pipeline._signal_handlers_installed = False
 
     def teardown_method(self):
         """Clean up after each test."""
         # Clear global processes dict after each test
         processes.clear()
+        backend.scripts.run_pipeline._signal_handlers_installed = False
 
     @mock.patch("backend.scripts.run_pipeline.stop_all_processes")
     @mock.patch("sys.exit")
@@ -82,6 +87,21 @@ class TestRunPipeline:
         mock_process.wait.assert_called_once()
         mock_process.kill.assert_called_once()
 
+    @mock.patch("backend.scripts.run_pipeline.time.monotonic")
+    def test_stop_all_processes_shared_deadline(self, mock_monotonic):
+        """Test every process waits against the same deadline."""
+        mock_monotonic.side_effect = [100.0, 100.0, 104.5, 106.0]
+        mock_processes = [mock.MagicMock() for _ in range(3)]
+        for i, mock_process in enumerate(mock_processes):
+            mock_process.poll.return_value = None
+            processes[f"process{i}"] = mock_process
+
+        stop_all_processes()
+
+        mock_processes[0].wait.assert_called_once_with(timeout=5.0)
+        mock_processes[1].wait.assert_called_once_with(timeout=0.5)
+        mock_processes[2].wait.assert_called_once_with(timeout=0)
+
     @mock.patch("subprocess.Popen")
     def test_start_api(self, mock_popen):
         """Test start_api function."""
@@ -99,7 +119,7 @@ class TestRunPipeline:
         
         # Verify correct command and parameters
         args, kwargs = mock_popen.call_args
-        assert args[0] == ["poetry", "run", "api"]
+        assert args[0] == [sys.executable, "-m", "backend.app.main"]
         assert kwargs["env"] is not None
 
     @mock.patch("subprocess.Popen")
@@ -119,46 +139,92 @@ class TestRunPipeline:
         
         # Verify correct command and parameters
         args, kwargs = mock_popen.call_args
-        assert args[0] == ["poetry", "run", "worker"]
+        assert args[0] == [
+            sys.executable,
+            "-m",
+            "backend.core.worker.worker",
+            "--queues",
+            "test_queue",
+        ]
         assert kwargs["env"] is not None
         assert kwargs["env"].get("QUEUE_NAME") == "test_queue"
+        assert kwargs["close_fds"] is False
+
+    def _piped_process(self, output, returncode=0):
+        """Create a mock process whose stdout pipe already holds output."""
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, output)
+        os.close(write_fd)
 
-    @mock.patch("time.sleep")
-    def test_print_process_output_exited(self, mock_sleep):
-        """Test print_process_output when processes have exited."""
-        # Setup mock process that has exited
         mock_process = mock.MagicMock()
-        mock_process.poll.return_value = 0  # Process has exited
-        mock_process.stdout.readline.return_value = ""  # No output
+        mock_process.stdout = os.fdopen(read_fd, "rb", buffering=0)
+        mock_process.poll.return_value = returncode
+        mock_process.returncode = returncode
+        return mock_process
+
+    def test_print_process_output_exited(self, capsys):
+        """Test print_process_output when processes have exited."""
+        # Setup mock process that has exited without output
+        mock_process = self._piped_process(b"", returncode=0)
         
         # Add to processes dict
         processes["api"] = mock_process
         
         # Call function
         print_process_output()
+        mock_process.stdout.close()
         
         # Verify
         mock_process.poll.assert_called()
-        mock_process.stdout.readline.assert_called()
+        out = capsys.readouterr().out
+        assert "api exited with code 0" in out
+        assert "All processes have exited." in out
 
-    @mock.patch("time.sleep", side_effect=KeyboardInterrupt)  # Raise KeyboardInterrupt to exit loop
-    def test_print_process_output_with_output(self, mock_sleep):
-        """Test print_process_output with process output."""
-        # Setup mock process with output
-        mock_process = mock.MagicMock()
-        mock_process.poll.return_value = None  # Process still running
-        mock_process.stdout.readline.side_effect = ["Output line 1", "Output line 2", ""]
+    def test_print_process_output_with_output(self, capsys):
+        """Test each line is prefixed, including a final partial one."""
+        api = self._piped_process(b"Output line 1\nOutput line 2\npartial")
+        worker = self._piped_process(b"Worker line\n", returncode=1)
         
-        # Add to processes dict
+        processes["api"] = api
+        processes["worker"] = worker
+
+        print_process_output()
+        api.stdout.close()
+        worker.stdout.close()
+
+        out = capsys.readouterr().out
+        assert "[api] Output line 1\n[api] Output line 2\n" in out
+        assert "[api] partial\n" in out
+        assert "[worker] Worker line\n" in out
+        assert "worker exited with code 1" in out
+
+    def test_print_process_output_waits_for_running_process(self, capsys):
+        """Test output is read until a running process exits."""
+        mock_process = self._piped_process(b"starting\n")
+        mock_process.poll.side_effect = [None, None, 0]
         processes["api"] = mock_process
         
-        # Call function - will exit due to KeyboardInterrupt from mock
-        with pytest.raises(KeyboardInterrupt):
-            print_process_output()
+        print_process_output()
+        mock_process.stdout.close()
         
-        # Verify
-        mock_process.poll.assert_called()
-        assert mock_process.stdout.readline.call_count >= 3
+        assert mock_process.poll.call_count == 3
+        assert "[api] starting" in capsys.readouterr().out
+
+    @mock.patch("subprocess.Popen")
+    def test_start_api_unbuffered_pipe(self, mock_popen):
+        """Test the API output is piped as unbuffered bytes."""
+        start_api()
+
+        _, kwargs = mock_popen.call_args
+        assert kwargs["stdout"] == subprocess.PIPE
+        assert kwargs["stderr"] == subprocess.STDOUT
+        assert kwargs["bufsize"] == 0
+        assert "universal_newlines" not in kwargs
+
+        # Nothing rules out posix_spawn: no close_fds pass, preexec_fn or cwd
+        assert kwargs["close_fds"] is False
+        assert "preexec_fn" not in kwargs
+        assert "cwd" not in kwargs
 
     @mock.patch("backend.scripts.run_pipeline.start_api")
     @mock.patch("backend.scripts.run_pipeline.start_worker")
@@ -182,6 +248,26 @@ class TestRunPipeline:
         assert signal.SIGINT in signal_calls
         assert signal.SIGTERM in signal_calls
 
+    @mock.patch("backend.scripts.run_pipeline.start_api")
+    @mock.patch("backend.scripts.run_pipeline.start_worker")
+    @mock.patch("backend.scripts.run_pipeline.signal.signal")
+    @mock.patch("backend.scripts.run_pipeline.time.sleep")
+    @mock.patch("backend.scripts.run_pipeline.print_process_output")
+    def test_start_pipeline_restart(
+        self,
+        mock_print_output,
+        mock_sleep,
+        mock_signal,
+        mock_start_worker,
+        mock_start_api,
+    ):
+        """Test restarting the pipeline keeps the signal handlers."""
+        start_pipeline()
+        start_pipeline()
+
+        assert mock_signal.call_count == 2
+        assert mock_start_api.call_count == 2
+
     @mock.patch("backend.scripts.run_pipeline.start_api")
     @mock.patch("backend.scripts.run_pipeline.start_worker")
     @mock.patch("backend.scripts.run_pipeline.signal.signal")